@@ -1,19 +1,24 @@
 # Python standard library imports
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 import asyncio
 from functools import partial
+import contextvars
 import os
 import time
 
 # Third-party imports
 from dotenv import load_dotenv
+from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
 # Local imports
+from agents.event_log import EventLog
+from interview_session.task_scheduler import background_llm_call
 from utils.llm.engines import get_engine, invoke_engine
 from utils.llm.xml_formatter import format_tool_as_xml_v2, parse_tool_calls
 from utils.logger.session_logger import SessionLogger
+from utils.logger.tracer import Tracer
 
 # Load environment variables
 load_dotenv(override=True)
@@ -43,15 +48,27 @@ class BaseAgent:
                                             os.getenv("MODEL_NAME", "gpt-4o")))
         self.tools = {}
 
-        # Each agent has an event stream. 
-        # Contains all the events that have been sent by the agent.
-        self.event_stream: list[BaseAgent.Event] = []
-        
+        # Seconds spent in each tool during the last tool call handling
+        self.last_tool_durations: Dict[str, float] = {}
+
         # Setup environment variables
         self._max_consideration_iterations = \
             int(os.getenv("MAX_CONSIDERATION_ITERATIONS", "3"))
         self._max_events_len = int(os.getenv("MAX_EVENTS_LEN", 30))
 
+        # Each agent has an event stream. 
+        # Contains all the events that have been sent by the agent,
+        # indexed by sender and tag for fast recent-event lookups.
+        # Older events are spilled next to the event stream log file.
+        self.event_stream: EventLog = EventLog(
+            index_size=int(os.getenv("EVENT_INDEX_SIZE",
+                                     2 * self._max_events_len + 4)),
+            max_resident=int(os.getenv("MAX_RESIDENT_EVENTS", 200)),
+            spill_path=lambda: SessionLogger.get_log_dir() / \
+                f"{self.name}_event_stream.jsonl",
+            event_type=BaseAgent.Event
+        )
+
     def workout(self):
         pass
 
@@ -59,7 +76,10 @@ class BaseAgent:
         '''Calls the LLM engine with the given prompt.'''
         for attempt in range(10):
             try:
-                output = invoke_engine(self.engine, prompt)
+                with Tracer.span("call_engine", agent=self.name,
+                                 attempt=attempt + 1,
+                                 prompt_chars=len(prompt)):
+                    output = invoke_engine(self.engine, prompt)
                 return output
             except Exception as e:
                 # Calculate exponential backoff sleep time (1s, 2s, 4s, 8s, etc.)
@@ -77,12 +97,16 @@ class BaseAgent:
     
     async def call_engine_async(self, prompt: str) -> str:
         '''Asynchronously call the LLM engine with the given prompt.'''
-        # Run call_engine in a thread pool since it's a blocking operation
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            None,
-            partial(self._call_engine, prompt)
-        )
+        # Run call_engine in a thread pool since it's a blocking operation.
+        # Copy the context so the engine call is traced under the caller's span.
+        # Background agents wait for the user to be idle first.
+        async with background_llm_call():
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                None,
+                partial(context.run, self._call_engine, prompt)
+            )
         
     def add_event(self, sender: str, tag: str, content: str):
         '''Adds an event to the event stream. 
@@ -104,7 +128,8 @@ class BaseAgent:
                                   f"({self.name}) Sender: {sender}, "
                                   f"Tag: {tag}\nContent: {content}")
         
-    def get_event_stream_str(self, filter: List[Dict[str, str]] = None, as_list: bool = False):
+    def get_event_stream_str(self, filter: List[Dict[str, str]] = None,
+                             as_list: bool = False, limit: int = None):
         '''Gets the event stream that passes the filter. 
         Important for ensuring that the event stream only 
         contains events that are relevant to the agent.
@@ -113,35 +138,15 @@ class BaseAgent:
             filter: A list of dictionaries with sender and tag keys 
             to filter the events.
             as_list: Whether to return the events as a list of strings.
+            limit: If given, only the last `limit` events passing the filter.
+                Served from the event index without scanning the stream.
         '''
-        events = []
-        for event in self.event_stream:
-            if self._passes_filter(event, filter):
-                event_str = f"<{event.sender}>\n{event.content}\n</{event.sender}>"
-                events.append(event_str)
+        events = self.event_stream.get_rendered(filter=filter, limit=limit)
         
         if as_list:
             return events
         return "\n".join(events)
     
-    def _passes_filter(self, event: Event, filter: List[Dict[str, str]]):
-        '''Helper function to check if an event passes the filter.
-        
-        Args:
-            event: The event to check.
-            filter: A list of dictionaries with sender 
-            and tag keys to filter the events.
-        '''
-        if filter:
-            for filter_item in filter:
-                if not filter_item.get("sender", None) \
-                      or event.sender == filter_item["sender"]:
-                    if not filter_item.get("tag", None) \
-                          or event.tag == filter_item["tag"]:
-                        return True
-            return False
-        return True
-    
     def get_tools_description(self, selected_tools: List[str] = None):
         '''Gets the tools description as a string.
         
@@ -156,8 +161,17 @@ class BaseAgent:
             return "\n".join([format_tool_as_xml_v2(tool) \
                                for tool in self.tools.values()])
     
-    def handle_tool_calls(self, response: str, raise_error: bool = False):
-        """Synchronous tool handling for non-I/O bound operations"""
+    def handle_tool_calls(self, response: str, raise_error: bool = False,
+                          tools: Optional[Dict[str, BaseTool]] = None):
+        """Synchronous tool handling for non-I/O bound operations
+
+        Args:
+            response: LLM response with the tool calls
+            raise_error: Whether to raise tool errors instead of logging them
+            tools: Tools to call instead of the agent's own, such as tools
+                bound to one of several concurrent requests
+        """
+        tools = tools if tools is not None else self.tools
         result = None
         if "<tool_calls>" in response:
             tool_calls_start = response.find("<tool_calls>")
@@ -172,11 +186,13 @@ class BaseAgent:
                     try:
                         tool_name = call['tool_name']
                         arguments = call['arguments']
-                        tool = self.tools[tool_name]
+                        tool = tools[tool_name]
                         
                         # Only handle sync tools here
                         if not asyncio.iscoroutinefunction(tool._run):
-                            result = tool._run(**arguments)
+                            with Tracer.span(f"tool.{tool_name}",
+                                             agent=self.name):
+                                result = tool._run(**arguments)
                             self.add_event(sender="system", 
                                            tag=tool_name, 
                                            content=result)
@@ -201,6 +217,7 @@ class BaseAgent:
     async def handle_tool_calls_async(self, response: str, raise_error: bool = False):
         """Asynchronous tool handling for I/O bound operations"""
         result = None
+        self.last_tool_durations = {}
         if "<tool_calls>" in response:
             tool_calls_start = response.find("<tool_calls>")
             tool_calls_end = response.find("</tool_calls>")
@@ -217,10 +234,16 @@ class BaseAgent:
                         tool = self.tools[tool_name]
                         
                         # Handle both sync and async tools
-                        if asyncio.iscoroutinefunction(tool._run):
-                            result = await tool._run(**arguments)
-                        else:
-                            result = tool._run(**arguments)
+                        start_time = time.perf_counter()
+                        with Tracer.span(f"tool.{tool_name}",
+                                         agent=self.name):
+                            if asyncio.iscoroutinefunction(tool._run):
+                                result = await tool._run(**arguments)
+                            else:
+                                result = tool._run(**arguments)
+                        self.last_tool_durations[tool_name] = \
+                            self.last_tool_durations.get(tool_name, 0.0) + \
+                            time.perf_counter() - start_time
                         self.add_event(sender="system", 
                                        tag=tool_name, content=result)
                     except Exception as e:
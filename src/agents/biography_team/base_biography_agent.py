@@ -54,5 +54,14 @@ class BiographyTeamAgent(BaseAgent, Participant):
         # Use the shared biography instance
         self.biography = BiographyTeamAgent._shared_biographies[user_id]
         
+    @classmethod
+    def release_biography(cls, user_id: str) -> None:
+        """Drop the user's shared biography once their session is over.
+
+        The next session loads it from disk again, with any updates made
+        since by other processes, such as post-session workers.
+        """
+        cls._shared_biographies.pop(user_id, None)
+
     def get_biography_structure(self):
         return self.biography.get_sections() 
\ No newline at end of file
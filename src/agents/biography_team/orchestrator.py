@@ -12,6 +12,7 @@ from agents.biography_team.session_coordinator.session_coordinator import Sessio
 from agents.biography_team.models import Plan
 from content.memory_bank.memory import Memory
 from utils.logger.session_logger import setup_default_logger, SessionLogger
+from utils.task_graph import TaskGraph
 
 
 if TYPE_CHECKING:
@@ -44,13 +45,68 @@ class BiographyOrchestrator:
         self._memory_threshold = int(
             os.getenv("MEMORY_THRESHOLD_FOR_UPDATE", 10))
 
-        # Flags to track different types of updates in progress
+        # Flags to track different types of updates in progress.
+        # Each flag is backed by an event that is set while it is idle.
+        self._biography_update_idle = asyncio.Event()
+        self._session_agenda_update_idle = asyncio.Event()
         self.biography_update_in_progress = False
         self.session_agenda_update_in_progress = False
         
         # Lock for biography updates to ensure only one runs at a time
         self._biography_update_lock = asyncio.Lock()
 
+        # User edits waiting to be processed in one pass
+        self._user_edit_debounce = float(
+            os.getenv("USER_EDIT_DEBOUNCE_SECONDS", 1.0))
+        self._user_edit_max_wait = float(
+            os.getenv("USER_EDIT_MAX_WAIT_SECONDS", 5.0))
+        self._pending_edits: List[Dict] = []
+        self._edit_batch_arrivals = 0
+        self._edit_batch_done: Optional[asyncio.Future] = None
+
+    @property
+    def biography_update_in_progress(self) -> bool:
+        return not self._biography_update_idle.is_set()
+
+    @biography_update_in_progress.setter
+    def biography_update_in_progress(self, value: bool) -> None:
+        if value:
+            self._biography_update_idle.clear()
+        else:
+            self._biography_update_idle.set()
+
+    @property
+    def session_agenda_update_in_progress(self) -> bool:
+        return not self._session_agenda_update_idle.is_set()
+
+    @session_agenda_update_in_progress.setter
+    def session_agenda_update_in_progress(self, value: bool) -> None:
+        if value:
+            self._session_agenda_update_idle.clear()
+        else:
+            self._session_agenda_update_idle.set()
+
+    async def wait_for_updates(self, timeout: Optional[float] = None) -> bool:
+        """Wait until no biography or session agenda update is in progress.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if all updates completed, False on timeout
+        """
+        async def _wait_until_idle():
+            while self.biography_update_in_progress or \
+                    self.session_agenda_update_in_progress:
+                await self._biography_update_idle.wait()
+                await self._session_agenda_update_idle.wait()
+
+        try:
+            await asyncio.wait_for(_wait_until_idle(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def _process_section_update(self, item: Plan) -> None:
         """Process a single section update."""
         try:
@@ -135,26 +191,16 @@ class BiographyOrchestrator:
             finally:
                 self.biography_update_in_progress = False
 
-    async def update_session_agenda_with_memories(self):
-        """Update just the session agenda."""
-        try:
-            self.session_agenda_update_in_progress = True
-            
-            # 1. Collect all follow-ups proposed in the session
-            follow_up_questions = self._collect_follow_up_questions()
-            
-            # 2. Regenerate session agenda with new memories and follow-ups
-            await self._session_coordinator.regenerate_session_agenda(
-                follow_up_questions=follow_up_questions
-            )
-            
-        finally:
-            self.session_agenda_update_in_progress = False
-    
     async def final_update_biography_and_agenda(
             self, selected_topics: Optional[List[str]] = None,
             wait_time: Optional[float] = None):
-        """Update biography and session agenda with new memories."""
+        """Update biography and session agenda with new memories.
+
+        Runs as a task graph: the session summary only needs the session's
+        memories, so it is written while the biography is updated, and the
+        interview questions are rebuilt as soon as the biography update
+        has proposed its follow-ups.
+        """
         try:
             # Set both flags to indicate updates are in progress
             self.biography_update_in_progress = True
@@ -172,6 +218,10 @@ class BiographyOrchestrator:
                     f"(actual: {actual_wait:.2f}s)"
                 )
 
+            # If topics are provided now, set them immediately
+            if selected_topics is not None:
+                self._session_coordinator.set_selected_topics(selected_topics)
+
             # Get new memories for update
             new_memories: List[Memory] = await (
                 self._interview_session.get_session_memories(
@@ -179,31 +229,44 @@ class BiographyOrchestrator:
                 )
             )
 
-            # Process biography updates
-            await self.update_biography_with_memories(new_memories)
-            
             # Save session agenda of the current session
             self._interview_session.session_agenda.save(save_type="updated")
 
-            # Skip session agenda update if baseline is used or no new memories
-            if not new_memories or self._section_writer.use_baseline:
-                if new_memories:
-                    await self._session_coordinator.update_session_summary(
-                        new_memories)
-                self._interview_session.session_agenda.save(save_type="next_version")
-                return
-
-            # Process session agenda update
-            session_agenda_task = asyncio.create_task(
-                self.update_session_agenda_with_memories()
-            )
+            # Skip rebuilding the questions if baseline is used
+            # or there are no new memories
+            rebuild_questions = bool(new_memories) and \
+                not self._section_writer.use_baseline
 
-            # If topics are provided now, set them immediately
-            if selected_topics is not None:
-                self._session_coordinator.set_selected_topics(selected_topics)
+            async def update_session_summary():
+                memories = new_memories
+                if rebuild_questions:
+                    memories = await self._interview_session \
+                        .get_session_memories(include_processed=True)
+                await self._interview_session.scheduler.submit(
+                    "agenda", self._session_coordinator.update_session_summary,
+                    memories)
+
+            async def rebuild_interview_questions():
+                await self._interview_session.scheduler.submit(
+                    "agenda",
+                    self._session_coordinator.rebuild_interview_questions,
+                    self._collect_follow_up_questions())
 
-            # Wait for session agenda task to complete
-            await session_agenda_task
+            graph = TaskGraph("final_update")
+            graph.add("biography",
+                      lambda: self.update_biography_with_memories(new_memories))
+            graph.add("session_summary", update_session_summary)
+            if rebuild_questions:
+                graph.add("interview_questions", rebuild_interview_questions,
+                          after=["biography"])
+            await graph.run()
+
+            SessionLogger.log_to_file(
+                "execution_log",
+                "[BIOGRAPHY] Final update steps took " + ", ".join(
+                    f"{name}: {seconds:.2f}s"
+                    for name, seconds in graph.durations.items())
+            )
 
             # Save session agenda of the next session
             self._interview_session.session_agenda.save(save_type="next_version")
@@ -215,31 +278,95 @@ class BiographyOrchestrator:
 
     async def process_user_edits(self, edits: List[Dict]):
         """Process user-requested edits to the biography.
-        This is used for the API mode and non-interview sessions."""
-        todo_items: List[Plan] = []
+        This is used for the API mode and non-interview sessions.
 
-        for edit in edits:
-            # Get detailed plan from planner
-            try:
-                plan: Plan = await self._planner.create_user_edit_plan(edit)
-                if plan:
-                    plan.section_title = edit["title"] \
-                        if edit["type"] != "ADD" else None
-                    plan.section_path = edit["data"]["newPath"] \
-                        if edit["type"] == "ADD" else None
-                
-                    plan.action_type = "user_add" if edit["type"] == "ADD" \
-                        else "user_update"
+        Edits to the same section are coalesced into one plan, and the
+        sections are planned concurrently."""
+        groups = self._group_user_edits(edits)
+        plans = await asyncio.gather(
+            *(self._create_user_edit_plan(group) for group in groups))
+        todo_items: List[Plan] = [plan for plan in plans if plan]
+        SessionLogger.log_to_file(
+            "execution_log",
+            f"[USER_EDITS] Planned {len(edits)} edits "
+            f"as {len(todo_items)} section updates")
 
-                    todo_items.append(plan)
-                
-            except Exception as e:
-                print(f"[DEBUG] Error creating plan for edit: {type(e).__name__}: {e}")
+        async with self._biography_update_lock:
+            await self._process_updates_in_batches(todo_items)
 
-        await self._process_updates_in_batches(todo_items)
+            # Save biography after all updates are complete
+            await self._section_writer.save_biography()
 
-        # Save biography after all updates are complete
-        await self._section_writer.save_biography()
+    async def queue_user_edits(self, edits: List[Dict]):
+        """Process user edits, batching edits that arrive close together.
+
+        Edits are held until none arrive for user_edit_debounce seconds,
+        or for at most user_edit_max_wait seconds, and then processed in
+        one pass. Returns once the pass with these edits has finished.
+        """
+        loop = asyncio.get_running_loop()
+        if self._edit_batch_done is None:
+            self._edit_batch_done = loop.create_future()
+            asyncio.create_task(self._flush_user_edits())
+        self._pending_edits.extend(edits)
+        self._edit_batch_arrivals += 1
+        await asyncio.shield(self._edit_batch_done)
+
+    async def _flush_user_edits(self):
+        """Process the pending edits once the batch is complete."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._user_edit_max_wait
+        arrivals = -1
+        while arrivals != self._edit_batch_arrivals and loop.time() < deadline:
+            arrivals = self._edit_batch_arrivals
+            await asyncio.sleep(
+                min(self._user_edit_debounce, deadline - loop.time()))
+
+        # Edits arriving from now on start the next batch
+        edits, done = self._pending_edits, self._edit_batch_done
+        self._pending_edits = []
+        self._edit_batch_done = None
+        self._edit_batch_arrivals = 0
+        try:
+            await self.process_user_edits(edits)
+            done.set_result(None)
+        except Exception as e:
+            done.set_exception(e)
+
+    @staticmethod
+    def _group_user_edits(edits: List[Dict]) -> List[List[Dict]]:
+        """Group edits by the section they target, in order of arrival."""
+        groups: Dict[tuple, List[Dict]] = {}
+        for edit in edits:
+            key = ("ADD", edit["data"]["newPath"]) if edit["type"] == "ADD" \
+                else ("UPDATE", edit["title"])
+            groups.setdefault(key, []).append(edit)
+        return list(groups.values())
+
+    async def _create_user_edit_plan(self, edits: List[Dict]) -> Optional[Plan]:
+        """Plan edits targeting the same section."""
+        edit = edits[0]
+        # Get detailed plan from planner
+        try:
+            plan: Plan = await self._planner.create_user_edit_plan(edits)
+            if plan:
+                plan.section_title = edit["title"] \
+                    if edit["type"] != "ADD" else None
+                plan.section_path = edit["data"]["newPath"] \
+                    if edit["type"] == "ADD" else None
+            
+                plan.action_type = "user_add" if edit["type"] == "ADD" \
+                    else "user_update"
+            return plan
+            
+        except Exception as e:
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[BIOGRAPHY] Error creating plan for edit: "
+                f"{type(e).__name__}: {e}",
+                log_level="error"
+            )
+            return None
     
     async def get_session_topics(self) -> List[str]:
         """To user: Get list of topics covered in this session"""
@@ -3,7 +3,7 @@ from typing import Dict, List, TYPE_CHECKING, Optional
 
 from agents.biography_team.base_biography_agent import BiographyConfig, BiographyTeamAgent
 from agents.biography_team.models import Plan, FollowUpQuestion
-from agents.biography_team.planner.prompts import get_prompt
+from agents.biography_team.planner.prompts import USER_COMMENT, get_prompt
 from agents.biography_team.planner.tools import AddPlan
 from agents.shared.feedback_prompts import MISSING_MEMORIES_WARNING
 from agents.shared.note_tools import ProposeFollowUp
@@ -134,40 +134,42 @@ class BiographyPlanner(BiographyTeamAgent):
         
         return plans_copy
 
-    async def create_user_edit_plan(self, edit: Dict) -> Plan:
-        """Create a detailed plan for user-requested edits."""
-        # Clear any existing plans before starting
-        self.plans = []
-        
+    async def create_user_edit_plan(self, edits: List[Dict]) -> Optional[Plan]:
+        """Create a detailed plan for user-requested edits.
+
+        Safe to run concurrently for different sections.
+
+        Args:
+            edits: Edits of the same type targeting the same section,
+                planned together in one plan
+        """
+        edit = edits[0]
         if edit["type"] == "ADD":   # ADD
             prompt = await self._get_formatted_prompt(
                 "user_add_planner",
                 section_path=edit['data']['newPath'],
-                section_prompt=edit['data']['sectionPrompt']
+                section_prompt="\n\n".join(
+                    e['data']['sectionPrompt'] for e in edits)
             )
         else:  # COMMENT
             prompt = await self._get_formatted_prompt(
                 "user_comment_planner",
                 section_title=edit['title'],
-                selected_text=edit['data']['comment']['text'],
-                user_comment=edit['data']['comment']['comment']
+                comments=[e['data']['comment'] for e in edits]
             )
 
         self.add_event(sender=self.name, tag="user_edit_prompt", content=prompt)
         response = await self.call_engine_async(prompt)
         self.add_event(sender=self.name, tag="user_edit_response", content=response)
 
-        # Handle tool calls to create plan
-        self.handle_tool_calls(response)
-        
-        # Get the latest plan
-        latest_plan = self.plans[-1] if self.plans else None
-        
-        # Clear the internal plans list
-        self.plans = []
+        # Collect this request's plans apart from the planner's own, so
+        # concurrent requests do not see each other's plans
+        plans: List[Plan] = []
+        self.handle_tool_calls(response, tools={
+            **self.tools, "add_plan": AddPlan(on_plan_added=plans.append)})
         
-        # Return a copy of the latest plan
-        return latest_plan
+        # Return the latest plan
+        return plans[-1] if plans else None
 
     async def _get_formatted_prompt(self, prompt_type: str, **kwargs) -> str:
         """
@@ -221,8 +223,11 @@ class BiographyPlanner(BiographyTeamAgent):
             prompt_params = {
                 **base_params,
                 "section_title": kwargs.get('section_title'),
-                "selected_text": kwargs.get('selected_text'),
-                "user_comment": kwargs.get('user_comment'),
+                "user_comments": "\n\n".join(
+                    USER_COMMENT.format(selected_text=comment['text'],
+                                        user_comment=comment['comment'])
+                    for comment in kwargs.get('comments', [])
+                ),
                 "tool_descriptions": self.get_tools_description(["add_plan"])
             }
         else:
@@ -271,8 +271,17 @@ USER_COMMENT_CONTEXT = """\
 </biography_content>
 
 <user_feedback>
-The user has provided feedback to the following text on section "{section_title}":
+The user has provided feedback on section "{section_title}". Address every comment below in one plan:
 
+{user_comments}
+</user_feedback>
+
+</input_context>
+"""
+
+USER_COMMENT = """\
+<comment>
+Feedback to the following text:
 <selected_text>
 {selected_text}
 </selected_text>
@@ -281,10 +290,7 @@ User's comment:
 <user_comment>
 {user_comment}
 </user_comment>
-</user_feedback>
-
-</input_context>
-"""
+</comment>"""
 
 USER_ADD_OUTPUT_FORMAT = """\
 <output_format>
@@ -97,14 +97,12 @@ class SessionCoordinator(BiographyTeamAgent):
 
         return topics
 
-    async def regenerate_session_agenda(self, follow_up_questions: List[Dict]):
-        """Update session agenda with new memories and follow-up questions."""
-        new_memories: List[Memory] = await self.interview_session \
-            .get_session_memories(include_processed=True)
-
-        # Update summaries and user portrait (can be done immediately)
-        await self.update_session_summary(new_memories)
+    async def rebuild_interview_questions(self, follow_up_questions: List[Dict]):
+        """Regenerate the interview questions for the next session.
 
+        Only touches the questions, so it can run alongside
+        update_session_summary.
+        """
         # Wait for selected topics before managing interview questions
         selected_topics = await self.wait_for_selected_topics()
 
@@ -243,7 +241,8 @@ class SessionCoordinator(BiographyTeamAgent):
             filter=[
                 {"sender": self.name, "tag": "recall_response"}
             ],
-            as_list=True
+            as_list=True,
+            limit=10
         )
 
         # Format warning if needed
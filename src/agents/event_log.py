@@ -0,0 +1,182 @@
+import json
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+# Index key: (sender, tag). None matches any sender or tag.
+IndexKey = Tuple[Optional[str], Optional[str]]
+
+
+class EventLog:
+    """Append-only event log indexed by sender and tag.
+
+    Every event is rendered to its prompt string once, on append. Each
+    (sender, tag) combination, including wildcards, keeps a bounded ring
+    buffer of the most recent (sequence number, rendered string) pairs,
+    so fetching the last N events that pass a filter costs O(N)
+    regardless of how long the log has grown.
+
+    At most max_resident events are kept in memory. Older events are
+    spilled to a JSON lines file and only read back when a query needs
+    more history than the ring buffers hold.
+    """
+
+    def __init__(
+        self,
+        index_size: int = 64,
+        max_resident: Optional[int] = None,
+        spill_path: Optional[Callable[[], Path]] = None,
+        event_type: Optional[Callable[..., Any]] = None
+    ):
+        """Initialize the event log.
+
+        Args:
+            index_size: Number of recent events kept per index entry.
+                Queries for more events fall back to a full scan.
+            max_resident: Maximum number of events kept in memory.
+                None keeps every event in memory.
+            spill_path: Returns the file older events are spilled to.
+                Resolved on the first spill.
+            event_type: Constructor used to rebuild spilled events
+        """
+        self.index_size = index_size
+        self.max_resident = max_resident if spill_path else None
+        self._spill_path_factory = spill_path
+        self._spill_path: Optional[Path] = None
+        self._event_type = event_type
+        self._spilled = 0
+        self._events: List[Any] = []
+        self._rendered: List[str] = []
+        self._index: Dict[IndexKey, Deque[Tuple[int, str]]] = {}
+        self._counts: Dict[IndexKey, int] = {}
+
+    @staticmethod
+    def render(event: Any) -> str:
+        """Render an event as it appears in prompts."""
+        return f"<{event.sender}>\n{event.content}\n</{event.sender}>"
+
+    @staticmethod
+    def _filter_keys(filter: Optional[List[Dict[str, str]]]) -> List[IndexKey]:
+        """Convert a sender/tag filter into index keys."""
+        if not filter:
+            return [(None, None)]
+        return list(dict.fromkeys(
+            (item.get("sender") or None, item.get("tag") or None)
+            for item in filter
+        ))
+
+    def append(self, event: Any) -> None:
+        """Append an event and index it under all matching keys."""
+        seq = len(self)
+        rendered = self.render(event)
+        self._events.append(event)
+        self._rendered.append(rendered)
+
+        for key in ((event.sender, event.tag), (event.sender, None),
+                    (None, event.tag), (None, None)):
+            buffer = self._index.get(key)
+            if buffer is None:
+                buffer = deque(maxlen=self.index_size)
+                self._index[key] = buffer
+            buffer.append((seq, rendered))
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+        if self.max_resident and len(self._events) > self.max_resident:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Move the older half of the resident events to the spill file."""
+        mode = 'a'
+        if self._spill_path is None:
+            # Start a fresh file rather than appending to a previous run's
+            self._spill_path = self._spill_path_factory()
+            mode = 'w'
+        count = len(self._events) - self.max_resident // 2
+
+        with open(self._spill_path, mode, encoding='utf-8') as f:
+            for event in self._events[:count]:
+                f.write(json.dumps({
+                    "sender": event.sender,
+                    "tag": event.tag,
+                    "content": event.content,
+                    "timestamp": event.timestamp.isoformat()
+                }) + "\n")
+
+        del self._events[:count]
+        del self._rendered[:count]
+        self._spilled += count
+
+    def _load_spilled(self) -> Iterator[Tuple[Any, str]]:
+        """Read spilled events back from disk, oldest first."""
+        if not self._spilled:
+            return
+        with open(self._spill_path, 'r', encoding='utf-8') as f:
+            for line, _ in zip(f, range(self._spilled)):
+                data = json.loads(line)
+                data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+                event = self._event_type(**data)
+                yield event, self.render(event)
+
+    def _iter_all(self) -> Iterator[Tuple[Any, str]]:
+        """Iterate over spilled and resident (event, rendered) pairs."""
+        yield from self._load_spilled()
+        yield from zip(self._events, self._rendered)
+
+    def get_rendered(
+        self,
+        filter: Optional[List[Dict[str, str]]] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """Get rendered events passing the filter, oldest first.
+
+        Args:
+            filter: A list of dictionaries with sender and tag keys.
+                An event passes if it matches any item.
+            limit: If given, only the last `limit` matching events
+        """
+        keys = self._filter_keys(filter)
+
+        if limit is None or limit > self.index_size:
+            # The ring buffers may not hold enough events; scan everything
+            matching = [
+                rendered for event, rendered in self._iter_all()
+                if any(self._matches(event, key) for key in keys)
+            ]
+            return matching[-limit:] if limit else matching
+
+        if limit <= 0:
+            return []
+
+        # Take the tail of each matching buffer and merge by sequence
+        candidates: Dict[int, str] = {}
+        for key in keys:
+            buffer = self._index.get(key)
+            if not buffer:
+                continue
+            for i in range(max(0, len(buffer) - limit), len(buffer)):
+                seq, rendered = buffer[i]
+                candidates[seq] = rendered
+        return [candidates[seq] for seq in sorted(candidates)[-limit:]]
+
+    def since(self, start: int) -> List[Any]:
+        """Get the events from sequence number start onward, oldest first."""
+        if start >= self._spilled:
+            return self._events[start - self._spilled:]
+        return [event for seq, event in enumerate(self) if seq >= start]
+
+    def count(self, sender: Optional[str] = None, tag: Optional[str] = None) -> int:
+        """Count events from a sender with a tag (None matches any)."""
+        return self._counts.get((sender or None, tag or None), 0)
+
+    @staticmethod
+    def _matches(event: Any, key: IndexKey) -> bool:
+        sender, tag = key
+        return (sender is None or event.sender == sender) and \
+            (tag is None or event.tag == tag)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (event for event, _ in self._iter_all())
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._events)
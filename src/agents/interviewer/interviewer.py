@@ -1,5 +1,7 @@
 import os
 import re
+import time
+from datetime import datetime
 from typing import TYPE_CHECKING, TypedDict
 from dotenv import load_dotenv
 
@@ -10,7 +12,9 @@ from agents.interviewer.tools import EndConversation, RespondToUser
 from agents.shared.memory_tools import Recall
 from utils.llm.prompt_utils import format_prompt
 from interview_session.session_models import Participant, Message
+from interview_session.turn_metrics import TurnLatencyTracker
 from utils.logger.session_logger import SessionLogger
+from utils.logger.evaluation_logger import EvaluationLogger
 from utils.constants.colors import GREEN, RESET
 
 if TYPE_CHECKING:
@@ -69,6 +73,9 @@ class Interviewer(BaseAgent, Participant):
         }
 
         self._turn_to_respond = False
+        self.turn_latency = TurnLatencyTracker()
+        self.opening_llm_seconds = 0.0  # LLM wait for the first question
+        self._turn_response_time: datetime = None
 
     def _handle_response(self, response: str) -> None:
         """Handle responses from the RespondToUser tool by adding them to chat history.
@@ -82,6 +89,37 @@ class Interviewer(BaseAgent, Participant):
         )
         self.add_event(sender=self.name, tag="message",
                        content=response)
+        if self.turn_latency.turn_in_progress:
+            self._turn_response_time = datetime.now()
+
+    def _end_turn_timing(self) -> None:
+        """Record the latency breakdown of the turn that just got a response."""
+        response_time = self._turn_response_time
+        self._turn_response_time = None
+        turn = self.turn_latency.end_turn(response_time)
+        if turn is None:
+            return
+
+        phases = turn["phases"]
+        if phases["total"] > self.turn_latency.slo_seconds:
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[LATENCY] Turn took {phases['total']:.2f}s, over the "
+                f"{self.turn_latency.slo_seconds:.0f}s SLO: " + ", ".join(
+                    f"{phase}={seconds:.2f}s"
+                    for phase, seconds in phases.items()),
+                log_level="warning"
+            )
+
+        eval_logger = EvaluationLogger.get_current_logger()
+        if eval_logger:
+            eval_logger.log_response_latency(
+                message_id=turn["message_id"],
+                user_message_timestamp=turn["message_time"],
+                response_timestamp=response_time,
+                user_message_length=turn["message_length"]
+            )
+            eval_logger.log_turn_latency(turn["message_id"], phases)
 
     async def on_message(self, message: Message):
 
@@ -92,21 +130,42 @@ class Interviewer(BaseAgent, Participant):
             )
             self.add_event(sender=message.role, tag="message",
                            content=message.content)
+            if message.role == "User":
+                self.turn_latency.start_turn(
+                    message.id, message.timestamp, len(message.content))
         
         self._turn_to_respond = True
         iterations = 0
 
         while self._turn_to_respond and iterations < self._max_consideration_iterations:
+            start_time = time.perf_counter()
             prompt = self._get_prompt()
             self.add_event(sender=self.name, tag="llm_prompt", content=prompt)
+            self.turn_latency.add("prompt_build",
+                                  time.perf_counter() - start_time)
+
+            start_time = time.perf_counter()
             response = await self.call_engine_async(prompt)
+            self.turn_latency.add("llm_wait", time.perf_counter() - start_time)
+            if message is None:
+                self.opening_llm_seconds += time.perf_counter() - start_time
             print(f"{GREEN}Interviewer:\n{response}{RESET}")
    
+            start_time = time.perf_counter()
             try:
                 await self.handle_tool_calls_async(response)
             except Exception as e:
                 print(f"Error calling tool: {e}. Use the raw response as the output.")
                 self._handle_response(response)
+            finally:
+                # Recall time is reported separately from other tool work
+                recall_time = self.last_tool_durations.get("recall", 0.0)
+                self.turn_latency.add("recall_search", recall_time)
+                self.turn_latency.add(
+                    "tool_dispatch",
+                    time.perf_counter() - start_time - recall_time)
+                if self._turn_response_time:
+                    self._end_turn_timing()
 
             iterations += 1
             if iterations >= self._max_consideration_iterations:
@@ -139,7 +198,8 @@ class Interviewer(BaseAgent, Participant):
                 {"sender": "User", "tag": "message"},
                 {"sender": "system", "tag": "recall"},
             ],
-            as_list=True
+            as_list=True,
+            limit=self._max_events_len
         )
         
         recent_events = chat_history_events[-self._max_events_len:] if \
@@ -148,7 +208,8 @@ class Interviewer(BaseAgent, Participant):
 
         all_interviewer_messages = self.get_event_stream_str(
             [{"sender": "Interviewer", "tag": "message"}],
-            as_list=True
+            as_list=True,
+            limit=5
         )
         recent_interviewer_messages = all_interviewer_messages[-5:] if \
             len(all_interviewer_messages) >= 5 else all_interviewer_messages
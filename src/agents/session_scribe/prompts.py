@@ -27,6 +27,15 @@ def get_prompt(prompt_type: str):
             "INSTRUCTIONS": CONSIDER_AND_PROPOSE_FOLLOWUPS_INSTRUCTIONS,
             "OUTPUT_FORMAT": CONSIDER_AND_PROPOSE_FOLLOWUPS_OUTPUT_FORMAT
         })
+    elif prompt_type == "update_combined":
+        return format_prompt(UPDATE_COMBINED_PROMPT, {
+            "CONTEXT": UPDATE_COMBINED_CONTEXT,
+            "EVENT_STREAM": UPDATE_SESSION_AGENDA_EVENT,
+            "QUESTIONS_AND_NOTES": QUESTIONS_AND_NOTES,
+            "TOOL_DESCRIPTIONS": UPDATE_COMBINED_TOOL,
+            "INSTRUCTIONS": UPDATE_COMBINED_INSTRUCTIONS,
+            "OUTPUT_FORMAT": UPDATE_COMBINED_OUTPUT_FORMAT
+        })
 
 
 UPDATE_MEMORY_QUESTION_BANK_PROMPT = """
@@ -66,14 +75,14 @@ Here is the stream of previous events for context:
 {previous_events}
 </previous_events>
 
-Here is the current question-answer exchange you need to process:
+Here is the current question-answer exchange you need to process (if the conversation moved on while you were busy, it contains several consecutive exchanges; process all of them):
 <current_qa>
 {current_qa}
 </current_qa>
 
 Reminder:
 - The external tag of each event indicates the role of the sender of the event.
-- Focus ONLY on processing the content within the current Q&A exchange above.
+- Focus ONLY on processing the content within the current Q&A exchange(s) above.
 - Previous messages are shown only for context, not for reprocessing.
 </input_context>
 """
@@ -239,7 +248,7 @@ Be thorough but concise in capturing key information while avoiding redundant de
 
 <context>
 Right now, you are in an interview session with the interviewer and the user.
-Your task is to process ONLY the most recent user message and update session agenda with any new, relevant information.
+Your task is to process ONLY the user message(s) in the current Q&A exchange and update session agenda with any new, relevant information.
 You have access to the session agenda containing topics and questions to be discussed.
 </context>
 
@@ -256,14 +265,14 @@ Here is the stream of previous events for context:
 {previous_events}
 </previous_events>
 
-Here is the current question-answer exchange you need to process:
+Here is the current question-answer exchange you need to process (if the conversation moved on while you were busy, it contains several consecutive exchanges; process all of them):
 <current_qa>
 {current_qa}
 </current_qa>
 
 Reminder:
 - The external tag of each event indicates the role of the sender of the event.
-- Focus ONLY on processing the content within the current Q&A exchange above.
+- Focus ONLY on processing the content within the current Q&A exchange(s) above.
 - Previous messages are shown only for context, not for reprocessing.
 </input_context>
 """
@@ -286,13 +295,13 @@ UPDATE_SESSION_AGENDA_INSTRUCTIONS = """
 <instructions>
 # Session Agenda Update
 ## Process:
-1. Focus ONLY on the most recent user message in the conversation history
+1. Focus ONLY on the user message(s) in the current Q&A exchange
 2. Review existing session agenda, paying attention to:
    - Which questions are marked as "Answered"
    - What information is already captured in existing notes
 
 ## Guidelines for Adding Notes:
-- Only process information from the latest user message
+- Only process information from the user message(s) in the current Q&A exchange
 - Skip questions marked as "Answered" - do not add more notes to them
 - Only add information that:
   - Answers previously unanswered questions
@@ -556,3 +565,131 @@ Your reasoning process on reflecting on the available information and deciding o
 Reminder:
 - If you decide not to propose any follow-up questions, just return <tool_calls></tool_calls> with empty tags
 """
+
+#### UPDATE_COMBINED_PROMPT ####
+
+UPDATE_COMBINED_PROMPT = """
+{CONTEXT}
+
+{EVENT_STREAM}
+
+{QUESTIONS_AND_NOTES}
+
+{TOOL_DESCRIPTIONS}
+
+{INSTRUCTIONS}
+
+{OUTPUT_FORMAT}
+"""
+
+UPDATE_COMBINED_CONTEXT = """
+<session_scribe_persona>
+You are a session scribe who works as the assistant of the interviewer. You observe conversations between the interviewer and the user.
+For the current question-answer exchange, your job is to:
+1. Update the session agenda with notes on the user's answer
+2. Identify important information shared by the user and store it in the memory bank
+3. Store the questions the user answered in the question bank and link them to the memories
+4. Propose follow-up questions when there are meaningful information gaps and the user is engaged
+</session_scribe_persona>
+
+<context>
+Right now, you are in an interview session with the interviewer and the user.
+You do all four jobs in a single response.
+</context>
+
+<user_portrait>
+This is the portrait of the user:
+{user_portrait}
+</user_portrait>
+"""
+
+UPDATE_COMBINED_TOOL = """
+Here are the tools that you can use to manage the session agenda, memories and questions:
+<tool_descriptions>
+{tool_descriptions}
+</tool_descriptions>
+"""
+
+UPDATE_COMBINED_INSTRUCTIONS = """
+<instructions>
+Process ONLY the user message(s) in the current Q&A exchange. Previous events are shown for context only.
+
+## Step 1: Session Agenda Notes (update_session_agenda)
+- Add a concise, fact-focused note for each distinct piece of new information
+- Use the question's ID, or leave the ID empty for information not tied to a question
+- Skip questions marked as "Answered" and information already captured in existing notes
+
+## Step 2: Memories (update_memory_bank)
+- Split long responses into MULTIPLE sequential memories; together they cover the ENTIRE response
+- Use a unique temporary ID for each memory (MEM_TEMP_1, MEM_TEMP_2, etc.)
+- Give each memory a concise title, a clear summary, metadata (topics, emotions, when, where, who, etc.) and an importance score (1-10)
+- Avoid ambiguity: use names from <user_portrait> instead of "the user", and specific names instead of "the project" or "the company"
+- Skip memories if the response is just greetings, deflection or a non-answer
+
+## Step 3: Historical Questions (add_historical_question)
+- Store the direct question that was asked and questions derived from the response content
+- Link each question to ALL relevant temp_ids; every temp_id must be linked to at least one question
+
+## Step 4: Follow-up Questions (add_interview_question)
+Only propose follow-ups if the user shows good engagement (detailed, enthusiastic or personal answers) and there are meaningful information gaps.
+If so, propose:
+1. A fact-gathering question about basic details still missing (setting, people, frequency)
+2. A deeper question about the same experience (memorable moments, relationships, challenges)
+3. Optionally, a tangential question if a significant theme emerges that hasn't been explored
+
+Follow-up questions must:
+- Use direct "you/your" address and focus on specific experiences
+- Follow the parent-child ID structure, with at most 4 levels (e.g., 1.2.3.4); create the question at the same level as its sibling if it would exceed this
+- Not be similar to questions in <questions_and_notes> or already asked in the conversation
+- Not be yes/no, abstract, about future implications, or several questions at once
+</instructions>
+"""
+
+UPDATE_COMBINED_OUTPUT_FORMAT = """
+<output_format>
+<thinking>
+1. What new information does the user's response contain for the session agenda?
+2. How should I split the response into memories, and which questions does it answer?
+3. Is the user engaged, and are there information gaps worth a follow-up?
+</thinking>
+
+<tool_calls>
+    <!-- Notes on the session agenda -->
+    <update_session_agenda>
+        <question_id>...</question_id>
+        <note>...</note>
+    </update_session_agenda>
+    ...
+
+    <!-- Memories, one call per piece of information -->
+    <update_memory_bank>
+        <temp_id>MEM_TEMP_1</temp_id>
+        <title>Concise descriptive title</title>
+        <text>Clear summary of the information</text>
+        <metadata>{{"key 1": "value 1", "key 2": "value 2", ...}}</metadata>
+        <importance_score>1-10</importance_score>
+    </update_memory_bank>
+    ...
+
+    <!-- Questions answered, linked to the memories above -->
+    <add_historical_question>
+        <content>The exact question that was asked</content>
+        <temp_memory_ids>['MEM_TEMP_1', 'MEM_TEMP_2', ...]</temp_memory_ids>
+    </add_historical_question>
+    ...
+
+    <!-- Follow-up questions, only if appropriate -->
+    <add_interview_question>
+        <topic>Topic name</topic>
+        <parent_id>ID of the parent question</parent_id>
+        <parent_text>Full text of the parent question</parent_text>
+        <question_id>ID in proper parent-child format</question_id>
+        <question>[FACT-GATHERING] or [DEEPER] or [TANGENTIAL] Your question here</question>
+    </add_interview_question>
+    ...
+</tool_calls>
+</output_format>
+
+Reminder:
+- Leave out any group of tool calls that is not needed. If nothing is worth storing, return <tool_calls></tool_calls>.
+"""
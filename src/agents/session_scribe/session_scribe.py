@@ -1,5 +1,8 @@
-from typing import List, TYPE_CHECKING, TypedDict
+from typing import Dict, List, TYPE_CHECKING, Optional, Tuple, TypedDict
 import asyncio
+import contextvars
+import os
+import re
 import time
 
 
@@ -13,6 +16,7 @@ from content.question_bank.question import QuestionSearchResult, SimilarQuestion
 from utils.llm.prompt_utils import format_prompt
 from utils.llm.xml_formatter import extract_tool_arguments, extract_tool_calls_xml
 from utils.logger.session_logger import SessionLogger
+from utils.logger.evaluation_logger import EvaluationLogger
 from utils.text_formatter import format_similar_questions
 from interview_session.session_models import Participant, Message
 from content.memory_bank.memory import Memory
@@ -20,6 +24,13 @@ from content.memory_bank.memory import Memory
 if TYPE_CHECKING:
     from interview_session.interview_session import InterviewSession
 
+# Tools whose successful calls count as scribe output
+OUTPUT_TOOLS = ["update_session_agenda", "add_interview_question",
+                "update_memory_bank", "add_historical_question"]
+
+# LLM usage of the scribe pass running in the current task
+_pass_usage: contextvars.ContextVar[Optional[Dict[str, int]]] = \
+    contextvars.ContextVar("scribe_pass_usage", default=None)
 
 
 class SessionScribeConfig(TypedDict, total=False):
@@ -39,6 +50,8 @@ class SessionScribe(BaseAgent, Participant):
         
         # Current unprocessed memories
         self._new_memories: List[Memory] = []
+        # Memories cleared for a biography update that has not finished
+        self._memories_in_update: List[Memory] = []
         # All memories from this session
         self._all_session_memories: List[Memory] = []
         # Mapping from temporary memory IDs to real IDs
@@ -47,12 +60,25 @@ class SessionScribe(BaseAgent, Participant):
         # Track last interviewer message
         self._last_interviewer_message = None
 
+        # Q&A pairs waiting for each lock. Pairs that queue up while a lock
+        # is busy are processed together in a single prompt.
+        self._pending_notes_pairs: List[Tuple[Message, Message]] = []
+        self._pending_memory_pairs: List[Tuple[Message, Message]] = []
+        self._max_batch_pairs = int(os.getenv("SCRIBE_MAX_BATCH_PAIRS", 4))
+        self._memory_batch_size = 1  # Pairs in the memory prompt being run
+
+        # "combined" writes agenda notes, follow-ups, memories and questions
+        # in one LLM call instead of the multi-call pipeline
+        self.mode = os.getenv("SCRIBE_MODE", "multi").lower()
+
         # Locks and processing flags
         self.processing_in_progress = False # If processing is in progress
         self._pending_tasks = 0             # Track number of pending tasks
         self._notes_lock = asyncio.Lock()   # Lock for _write_notes_and_questions
         self._memory_lock = asyncio.Lock()  # Lock for update_memory_bank
         self._tasks_lock = asyncio.Lock()   # Lock for updating task counter
+        self._processing_complete = asyncio.Event() # Set when no tasks pending
+        self._processing_complete.set()
 
         # Tools agent can use
         self.tools = {
@@ -93,70 +119,270 @@ class SessionScribe(BaseAgent, Participant):
             self._last_interviewer_message = message
         elif message.role == "User":
             if self._last_interviewer_message:
-                asyncio.create_task(self._process_qa_pair(
-                    interviewer_message=self._last_interviewer_message,
-                    user_message=message
-                ))
+                qa_pair = (self._last_interviewer_message, message)
+                self._pending_notes_pairs.append(qa_pair)
+                self._pending_memory_pairs.append(qa_pair)
+                # Count the Q&A pair as pending while it waits in the queue
+                await self._increment_pending_tasks()
+                self.interview_session.scheduler.submit(
+                    "scribe", self._process_pending_qa_pairs)
                 self._last_interviewer_message = None
 
-    async def _process_qa_pair(self, interviewer_message: Message, user_message: Message):
-        """Process a Q&A pair with task tracking"""
-        await self._increment_pending_tasks()
+    async def _process_pending_qa_pairs(self):
+        """Process the pending Q&A pairs with task tracking"""
         try:
-            # Run both updates concurrently, each with their own lock
-            await asyncio.gather(
-                self._locked_write_notes_and_questions(
-                    interviewer_message, user_message),
-                self._locked_write_memory_and_question_bank(
-                    interviewer_message, user_message)
-            )
+            if self.mode == "combined" and not self.use_baseline:
+                await self._locked_write_combined()
+            else:
+                # Run both updates concurrently, each with their own lock
+                await asyncio.gather(
+                    self._locked_write_notes_and_questions(),
+                    self._locked_write_memory_and_question_bank()
+                )
         finally:
             await self._decrement_pending_tasks()
 
-    async def _locked_write_notes_and_questions(self, interviewer_message: Message, user_message: Message) -> None:
-        """Wrapper to handle _write_notes_and_questions with lock"""
-        async with self._notes_lock:
+    def _take_batch(self, pending: List[Tuple[Message, Message]],
+                    lane: str) -> List[Tuple[Message, Message]]:
+        """Take the oldest pending Q&A pairs to process in one prompt.
+
+        The pairs stay in the pending list until the lock holder finishes
+        them, so a session checkpoint taken meanwhile still includes them.
+        """
+        batch = pending[:self._max_batch_pairs]
+        if len(batch) > 1:
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[SCRIBE] Coalesced {len(batch)} Q&A pairs for {lane}"
+            )
+        return batch
+
+    def _add_qa_events(self, batch: List[Tuple[Message, Message]],
+                       tag: str) -> None:
+        for interviewer_message, user_message in batch:
             self.add_event(sender=interviewer_message.role,
-                           tag="notes_lock_message", 
+                           tag=tag, 
                            content=interviewer_message.content)
             self.add_event(sender=user_message.role,
-                           tag="notes_lock_message", 
+                           tag=tag, 
                            content=user_message.content)
-            await self._write_notes_and_questions()
 
-    async def _locked_write_memory_and_question_bank(self, interviewer_message: Message, user_message: Message) -> None:
+    async def _locked_write_notes_and_questions(self) -> None:
+        """Wrapper to handle _write_notes_and_questions with lock"""
+        async with self._notes_lock:
+            # Pairs may already have been taken by an earlier holder
+            batch = self._take_batch(self._pending_notes_pairs, "notes")
+            if not batch:
+                return
+            try:
+                self._add_qa_events(batch, "notes_lock_message")
+                await self._run_tracked_pass(
+                    "notes", len(batch),
+                    self._write_notes_and_questions(len(batch)))
+            finally:
+                del self._pending_notes_pairs[:len(batch)]
+
+    async def _locked_write_memory_and_question_bank(self) -> None:
         """Wrapper to handle update_memory_bank with lock"""
         async with self._memory_lock:
-            self.add_event(sender=interviewer_message.role,
-                           tag="memory_lock_message", 
-                           content=interviewer_message.content)
-            self.add_event(sender=user_message.role,
-                           tag="memory_lock_message", 
-                           content=user_message.content)
-            await self._write_memory_and_question_bank()
+            batch = self._take_batch(self._pending_memory_pairs, "memory")
+            if not batch:
+                return
+            try:
+                self._add_qa_events(batch, "memory_lock_message")
+                self._memory_batch_size = len(batch)
+                await self._run_tracked_pass(
+                    "memory", len(batch),
+                    self._write_memory_and_question_bank(len(batch)))
+            finally:
+                del self._pending_memory_pairs[:len(batch)]
+
+    async def _locked_write_combined(self) -> None:
+        """Process the pending Q&A pairs in one call, holding both locks"""
+        async with self._notes_lock, self._memory_lock:
+            batch = self._take_batch(self._pending_notes_pairs, "combined")
+            if not batch:
+                return
+            try:
+                self._add_qa_events(batch, "notes_lock_message")
+                self._add_qa_events(batch, "memory_lock_message")
+                self._memory_batch_size = len(batch)
+                await self._run_tracked_pass(
+                    "combined", len(batch), self._write_combined(len(batch)))
+            finally:
+                del self._pending_notes_pairs[:len(batch)]
+                del self._pending_memory_pairs[:len(batch)]
+
+    async def _run_tracked_pass(self, lane: str, num_pairs: int, write) -> None:
+        """Run a scribe pass and log its latency, LLM usage and output.
+
+        Used to compare the combined and multi-call modes.
+        """
+        usage = {"llm_calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        token = _pass_usage.set(usage)
+        outputs_before = self._count_outputs()
+        start_time = time.perf_counter()
+        try:
+            await write
+        finally:
+            _pass_usage.reset(token)
+            outputs_after = self._count_outputs()
+            eval_logger = EvaluationLogger.get_current_logger()
+            if eval_logger:
+                eval_logger.log_scribe_pass(
+                    mode=self.mode if lane == "combined" else "multi",
+                    lane=lane,
+                    num_pairs=num_pairs,
+                    duration=time.perf_counter() - start_time,
+                    usage=usage,
+                    outputs={tool: outputs_after[tool] - outputs_before[tool]
+                             for tool in OUTPUT_TOOLS}
+                )
 
-    async def _write_notes_and_questions(self) -> None:
+    def _count_outputs(self) -> Dict[str, int]:
+        return {tool: self.event_stream.count(sender="system", tag=tool)
+                for tool in OUTPUT_TOOLS}
+
+    async def call_engine_async(self, prompt: str) -> str:
+        '''Call the LLM engine, counting usage for the running scribe pass.'''
+        response = await super().call_engine_async(prompt)
+        usage = _pass_usage.get()
+        if usage is not None:
+            tokenizer = await self.interview_session.get_tokenizer()
+            usage["llm_calls"] += 1
+            usage["prompt_tokens"] += len(
+                tokenizer.encode(prompt, disallowed_special=()))
+            usage["completion_tokens"] += len(
+                tokenizer.encode(response, disallowed_special=()))
+        return response
+
+    async def _write_notes_and_questions(self, num_pairs: int = 1) -> None:
         """
         Process user's response by updating session agenda 
         and considering follow-up questions.
+
+        Args:
+            num_pairs: Number of latest Q&A pairs to process together
         """
         if self.use_baseline:
             return
         
         # First update the direct response in session agenda
-        await self._update_session_agenda()
+        await self._update_session_agenda(num_pairs)
 
         # Then consider and propose follow-up questions if appropriate
         await self._propose_followups()
 
-    async def _propose_followups(self) -> None:
+    async def _write_combined(self, num_pairs: int = 1) -> None:
+        """
+        Update the session agenda, memory bank and question bank and propose
+        follow-ups for the latest Q&A pairs in a single LLM call.
+
+        Args:
+            num_pairs: Number of latest Q&A pairs to process together
+        """
+        prompt = self._get_formatted_prompt(
+            "update_combined", num_pairs=num_pairs)
+        self.add_event(
+            sender=self.name,
+            tag="update_combined_prompt",
+            content=prompt
+        )
+        response = await self.call_engine_async(prompt)
+        self.add_event(
+            sender=self.name,
+            tag="update_combined_response",
+            content=response
+        )
+
+        try:
+            proposed_questions = extract_tool_arguments(
+                response, "add_interview_question", "question"
+            )
+        except Exception as e:
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[ERROR] Error extracting tool arguments: {e}"
+                f"Set proposed questions to empty list"
+            )
+            proposed_questions = []
+        similar_questions = self._find_similar_questions(proposed_questions)
+
+        if not similar_questions:
+            await self.handle_tool_calls_async(response)
+            return
+
+        # Follow-ups with similar questions go through the same feedback
+        # loop as in the multi-call pipeline; store everything else now
+        followup_calls = re.findall(
+            r"<add_interview_question>.*?</add_interview_question>",
+            response, flags=re.DOTALL)
+        await self.handle_tool_calls_async(re.sub(
+            r"<add_interview_question>.*?</add_interview_question>",
+            "", response, flags=re.DOTALL))
+        await self._propose_followups(
+            previous_tool_call="<tool_calls>\n" +
+                "\n".join(followup_calls) + "\n</tool_calls>",
+            similar_questions=similar_questions,
+            iterations=1
+        )
+
+    def _find_similar_questions(
+        self, proposed_questions: List[str]
+    ) -> List[SimilarQuestionsGroup]:
+        """Find existing questions similar to each proposed question."""
+        similar_questions: List[SimilarQuestionsGroup] = []
+        for question in proposed_questions:
+            # Search in both question banks
+            historical_results = \
+                self.interview_session.historical_question_bank \
+                    .search_questions(query=question, k=3)
+            proposed_results = \
+                self.interview_session.proposed_question_bank \
+                    .search_questions(query=question, k=3)
+            
+            # Combine results and remove duplicates
+            all_results: List[QuestionSearchResult] = []
+            seen_questions = set()
+            
+            # Process all results and keep track of seen questions
+            for result_list in [historical_results, proposed_results]:
+                if result_list:
+                    for result in result_list:
+                        # Only add if we haven't seen before
+                        if result.content not in seen_questions:
+                            all_results.append(result)
+                            seen_questions.add(result.content)
+            
+            # Sort by similarity score (higher score = more similar)
+            all_results.sort(key=lambda x: x.similarity_score, reverse=True)
+            
+            # Take top 3 unique results if available
+            top_results = all_results[:3] if all_results else []
+            
+            if top_results:
+                similar_questions.append(SimilarQuestionsGroup(
+                    proposed=question,
+                    similar=top_results
+                ))
+        return similar_questions
+
+    async def _propose_followups(
+        self,
+        previous_tool_call: Optional[str] = None,
+        similar_questions: Optional[List[SimilarQuestionsGroup]] = None,
+        iterations: int = 0
+    ) -> None:
         """
         Determine if follow-up questions should be proposed 
         and propose them if appropriate.
+
+        Args:
+            previous_tool_call: Proposals from an earlier call to revise
+            similar_questions: Existing questions similar to those proposals
+            iterations: Number of consideration iterations already used
         """
-        iterations = 0
-        previous_tool_call = None
-        similar_questions: List[SimilarQuestionsGroup] = []
+        similar_questions = similar_questions or []
         
         while iterations < self._max_consideration_iterations:
             prompt = self._get_formatted_prompt(
@@ -216,40 +442,8 @@ class SessionScribe(BaseAgent, Participant):
                     break
             else:
                 # Search for similar questions
-                similar_questions: List[SimilarQuestionsGroup] = []
-                for question in proposed_questions:
-                    # Search in both question banks
-                    historical_results = \
-                        self.interview_session.historical_question_bank \
-                            .search_questions(query=question, k=3)
-                    proposed_results = \
-                        self.interview_session.proposed_question_bank \
-                            .search_questions(query=question, k=3)
-                    
-                    # Combine results and remove duplicates
-                    all_results: List[QuestionSearchResult] = []
-                    seen_questions = set()
-                    
-                    # Process all results and keep track of seen questions
-                    for result_list in [historical_results, proposed_results]:
-                        if result_list:
-                            for result in result_list:
-                                # Only add if we haven't seen before
-                                if result.content not in seen_questions:
-                                    all_results.append(result)
-                                    seen_questions.add(result.content)
-                    
-                    # Sort by similarity score (higher score = more similar)
-                    all_results.sort(key=lambda x: x.similarity_score, reverse=True)
-                    
-                    # Take top 3 unique results if available
-                    top_results = all_results[:3] if all_results else []
-                    
-                    if top_results:
-                        similar_questions.append(SimilarQuestionsGroup(
-                            proposed=question,
-                            similar=top_results
-                        ))
+                similar_questions = \
+                    self._find_similar_questions(proposed_questions)
                 
                 if not similar_questions:
                     # No similar questions found, proceed with adding
@@ -271,9 +465,10 @@ class SessionScribe(BaseAgent, Participant):
                 )
             )
 
-    async def _write_memory_and_question_bank(self) -> None:
+    async def _write_memory_and_question_bank(self, num_pairs: int = 1) -> None:
         """Process the latest conversation and update both memory and question banks."""
-        prompt = self._get_formatted_prompt("update_memory_question_bank")
+        prompt = self._get_formatted_prompt(
+            "update_memory_question_bank", num_pairs=num_pairs)
         self.add_event(
             sender=self.name, 
             tag="update_memory_question_bank_prompt", 
@@ -287,9 +482,10 @@ class SessionScribe(BaseAgent, Participant):
         )
         self.handle_tool_calls(response)
 
-    async def _update_session_agenda(self) -> None:
+    async def _update_session_agenda(self, num_pairs: int = 1) -> None:
         """Update session agenda with user's response"""
-        prompt = self._get_formatted_prompt("update_session_agenda")
+        prompt = self._get_formatted_prompt(
+            "update_session_agenda", num_pairs=num_pairs)
         self.add_event(
             sender=self.name,
             tag="update_session_agenda_prompt",
@@ -313,7 +509,7 @@ class SessionScribe(BaseAgent, Participant):
                 {"sender": self.name, "tag": "recall_response"},
                 *[{"tag": f"consider_and_propose_followups_response_{i}"} \
                    for i in range(self._max_consideration_iterations)]
-            ], as_list=True)
+            ], as_list=True, limit=self._max_events_len)
 
             recent_events = events[-self._max_events_len:] if len(
                 events) > self._max_events_len else events
@@ -346,11 +542,14 @@ class SessionScribe(BaseAgent, Participant):
                 )
             })
         elif prompt_type == "update_memory_question_bank":
+            current_len = 2 * kwargs.get('num_pairs', 1)
             events = self.get_event_stream_str(filter=[
                 {"tag": "memory_lock_message"},
-            ], as_list=True)
-            current_qa = events[-2:] if len(events) >= 2 else []
-            previous_events = events[:-2] if len(events) >= 2 else events
+            ], as_list=True, limit=self._max_events_len + current_len)
+            current_qa = events[-current_len:] \
+                if len(events) >= current_len else []
+            previous_events = events[:-current_len] \
+                if len(events) >= current_len else events
 
             if len(previous_events) > self._max_events_len:
                 previous_events = previous_events[-self._max_events_len:]
@@ -364,11 +563,16 @@ class SessionScribe(BaseAgent, Participant):
                                     "add_historical_question"]
                 )
             })
-        elif prompt_type == "update_session_agenda":
+        elif prompt_type in ("update_session_agenda", "update_combined"):
+            # The combined prompt reads the same exchange as the agenda update
+            current_len = 2 * kwargs.get('num_pairs', 1)
             events = self.get_event_stream_str(
-                filter=[{"tag": "notes_lock_message"}], as_list=True)
-            current_qa = events[-2:] if len(events) >= 2 else []
-            previous_events = events[:-2] if len(events) >= 2 else events
+                filter=[{"tag": "notes_lock_message"}], as_list=True,
+                limit=self._max_events_len + current_len)
+            current_qa = events[-current_len:] \
+                if len(events) >= current_len else []
+            previous_events = events[:-current_len] \
+                if len(events) >= current_len else events
 
             if len(previous_events) > self._max_events_len:
                 previous_events = previous_events[-self._max_events_len:]
@@ -384,41 +588,43 @@ class SessionScribe(BaseAgent, Participant):
                         )
                 ),
                 "tool_descriptions": self.get_tools_description(
-                    selected_tools=["update_session_agenda"]
+                    selected_tools=OUTPUT_TOOLS
+                    if prompt_type == "update_combined"
+                    else ["update_session_agenda"]
                 )
             })
 
-    async def get_session_memories(self, clear_processed=False, wait_for_processing=True, include_processed=False) -> List[Memory]:
+    async def get_session_memories(self, clear_processed=False, wait_for_processing=True, include_processed=False,
+                                   max_memories: Optional[int] = None) -> List[Memory]:
         """Get memories added by session scribe during current session.
         
         Args:
             clear_processed: 
-                - If True, clears the list of unprocessed memories after returning
+                - If True, clears the list of unprocessed memories after returning;
+                  call finish_memory_update once they are written
             wait_for_processing: 
                 - If True, waits for all pending memory updates to complete
             include_processed: 
                 - If True, returns all memories from the session
                 - If False, returns only the currently unprocessed memories
+            max_memories:
+                - If given, returns at most this many of the oldest memories,
+                  and only those are cleared
         
         Returns:
             List of Memory objects based on the include_processed parameter
         """
         if wait_for_processing:
-            start_time = time.time()
-
             SessionLogger.log_to_file(
                 "execution_log",
                 f"[MEMORY] Waiting for memory updates to complete..."
             )
             
-            while self.processing_in_progress:
-                await asyncio.sleep(0.1)
-                if time.time() - start_time > 300:  # 5 minutes timeout
-                    SessionLogger.log_to_file(
-                        "execution_log",
-                        f"[MEMORY] Timeout waiting for memory updates"
-                    )
-                    break
+            if not await self.wait_for_processing(timeout=300):
+                SessionLogger.log_to_file(
+                    "execution_log",
+                    f"[MEMORY] Timeout waiting for memory updates"
+                )
         elif self.processing_in_progress:
             SessionLogger.log_to_file(
                 "execution_log",
@@ -431,13 +637,18 @@ class SessionScribe(BaseAgent, Participant):
         else:
             memories = self._new_memories.copy()
             memory_source = "unprocessed"
+        if max_memories is not None:
+            memories = memories[:max_memories]
         
         if clear_processed:
+            num_cleared = len(self._new_memories) if max_memories is None \
+                else min(max_memories, len(self._new_memories))
             SessionLogger.log_to_file(
                 "execution_log",
-                f"[MEMORY] Clearing {len(self._new_memories)} unprocessed memories"
+                f"[MEMORY] Clearing {num_cleared} unprocessed memories"
             )
-            self._new_memories = []
+            self._memories_in_update.extend(self._new_memories[:num_cleared])
+            self._new_memories = self._new_memories[num_cleared:]
             
         SessionLogger.log_to_file(
             "execution_log",
@@ -448,6 +659,31 @@ class SessionScribe(BaseAgent, Participant):
         )
         return memories
 
+    def finish_memory_update(self, memories: List[Memory]) -> None:
+        """Mark memories cleared by get_session_memories as written.
+
+        Until then, checkpoints keep them unprocessed, so a resumed
+        session updates the biography with them again.
+        """
+        for memory in memories:
+            if memory in self._memories_in_update:
+                self._memories_in_update.remove(memory)
+
+    async def wait_for_processing(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all pending Q&A processing has completed.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if processing completed, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._processing_complete.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     def _add_new_memory(self, memory: Memory):
         """Callback to track newly added memory in the session"""
         self._new_memories.append(memory)
@@ -468,11 +704,77 @@ class SessionScribe(BaseAgent, Participant):
         ]
         return real_ids
 
+    def get_checkpoint_state(self) -> Dict:
+        """Get the state needed to resume the session from a checkpoint.
+
+        Memories and messages are referenced by ID; they are restored
+        from the checkpointed memory bank and chat history.
+        """
+        def pair_ids(pairs: List[Tuple[Message, Message]]) -> List[List[str]]:
+            return [[question.id, answer.id] for question, answer in pairs]
+
+        return {
+            # Memories of an unfinished update are not in the biography yet
+            "new_memory_ids": [memory.id for memory in
+                               self._memories_in_update + self._new_memories],
+            "session_memory_ids": [memory.id
+                                   for memory in self._all_session_memories],
+            "memory_id_map": dict(self._memory_id_map),
+            "last_interviewer_message_id":
+                self._last_interviewer_message.id
+                if self._last_interviewer_message else None,
+            "pending_notes_pairs": pair_ids(self._pending_notes_pairs),
+            "pending_memory_pairs": pair_ids(self._pending_memory_pairs)
+        }
+
+    def restore_checkpoint_state(self, state: Dict,
+                                 memories: Dict[str, Memory],
+                                 messages: Dict[str, Message]) -> None:
+        """Restore the state saved by get_checkpoint_state.
+
+        Args:
+            state: The saved state
+            memories: Memories in the memory bank by ID
+            messages: Messages in the chat history by ID
+        """
+        def load_pairs(pairs: List[List[str]]) -> List[Tuple[Message, Message]]:
+            return [(messages[question_id], messages[answer_id])
+                    for question_id, answer_id in pairs
+                    if question_id in messages and answer_id in messages]
+
+        self._new_memories = [memories[memory_id]
+                              for memory_id in state["new_memory_ids"]
+                              if memory_id in memories]
+        self._all_session_memories = [memories[memory_id]
+                                      for memory_id in state["session_memory_ids"]
+                                      if memory_id in memories]
+        self._memory_id_map = dict(state["memory_id_map"])
+        self._last_interviewer_message = messages.get(
+            state["last_interviewer_message_id"])
+        self._pending_notes_pairs = load_pairs(state["pending_notes_pairs"])
+        self._pending_memory_pairs = load_pairs(state["pending_memory_pairs"])
+
+    async def resume_processing(self) -> None:
+        """Process the Q&A pairs restored from a checkpoint."""
+        num_pairs = max(len(self._pending_notes_pairs),
+                        len(self._pending_memory_pairs))
+        if num_pairs:
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[SCRIBE] Resuming {num_pairs} unprocessed Q&A pairs"
+            )
+        # One job per pair, as if the pairs had just arrived
+        for _ in range(num_pairs):
+            await self._increment_pending_tasks()
+            self.interview_session.scheduler.submit(
+                "scribe", self._process_pending_qa_pairs)
+
     async def _increment_pending_tasks(self):
         """Increment the pending tasks counter"""
         async with self._tasks_lock:
             self._pending_tasks += 1
             self.processing_in_progress = True
+            self._processing_complete.clear()
 
     async def _decrement_pending_tasks(self):
         """Decrement the pending tasks counter"""
@@ -481,22 +783,25 @@ class SessionScribe(BaseAgent, Participant):
             if self._pending_tasks <= 0:
                 self._pending_tasks = 0
                 self.processing_in_progress = False
+                self._processing_complete.set()
 
     def _get_recent_user_response(self) -> str:
-        """Safely get the current user response, with error handling."""
+        """Safely get the current user response, with error handling.
+
+        When several Q&A pairs are processed together, this is all of
+        their user responses.
+        """
         try:
             messages = self.get_event_stream_str(filter=[
                 {"tag": "memory_lock_message", "sender": "User"}
-            ], as_list=True)
+            ], as_list=True, limit=self._memory_batch_size)
                         
             if not messages:
                 return "No user response available"
             
-            last_message = messages[-1]
-            
-            result = last_message. \
-                removeprefix("<User>\n"). \
-                removesuffix("\n</User>")
+            result = "\n\n".join(
+                message.removeprefix("<User>\n").removesuffix("\n</User>")
+                for message in messages[-self._memory_batch_size:])
             
             return result
         except Exception as e:
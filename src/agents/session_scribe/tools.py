@@ -89,7 +89,7 @@ class UpdateMemoryBank(BaseTool):
             if not isinstance(metadata, dict):
                 metadata = {}
             
-            memory = self.memory_bank.add_memory(
+            memory, merged = self.memory_bank.add_or_merge_memory(
                 title=title, 
                 text=text, 
                 metadata=metadata, 
@@ -100,6 +100,11 @@ class UpdateMemoryBank(BaseTool):
             # Use callback to update the mapping
             self.update_memory_map(temp_id, memory.id)
             
+            if merged:
+                # Near-duplicate of a memory that is already tracked
+                return (f"Merged memory '{title}' into existing "
+                        f"memory {memory.id}: {memory.title}")
+
             # Trigger callback to track newly added memory
             self.on_memory_added(memory)
                 
@@ -0,0 +1,39 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+from interview_session.session_models import Participant, Message
+
+
+class APIParticipant(Participant):
+    """Participant that relays interviewer messages to an API client.
+
+    Messages are queued until the client reads them, so replies produced
+    while no client is connected are not lost.
+    """
+
+    def __init__(self):
+        # The interview session is attached by InterviewSession itself
+        super().__init__(title="APIParticipant", interview_session=None)
+        self._messages: asyncio.Queue[Optional[Message]] = asyncio.Queue()
+        self._closed = False
+
+    async def on_message(self, message: Message):
+        """Queue an interviewer message for the client"""
+        if not self._closed:
+            await self._messages.put(message)
+
+    def close(self) -> None:
+        """Stop accepting messages and end any open stream"""
+        if not self._closed:
+            self._closed = True
+            self._messages.put_nowait(None)
+
+    async def stream(self) -> AsyncIterator[Message]:
+        """Yield interviewer messages as they arrive until closed"""
+        while True:
+            message = await self._messages.get()
+            if message is None:
+                # Keep the sentinel for any other reader
+                self._messages.put_nowait(None)
+                return
+            yield message
@@ -0,0 +1,239 @@
+import asyncio
+import contextvars
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from dotenv import load_dotenv
+
+from interview_session.interview_session import InterviewSession
+from interview_session.post_session import (
+    final_update_job_key, get_post_session_queue
+)
+from interview_session.session_models import MessageType
+from api.core.api_participant import APIParticipant
+
+load_dotenv(override=True)
+
+
+class SessionLimitError(Exception):
+    """Raised when the server is hosting its maximum number of sessions."""
+
+
+class SessionConflictError(Exception):
+    """Raised when a user already has an active session."""
+
+
+class SessionEndedError(Exception):
+    """Raised when a message is sent to a session that has ended."""
+
+
+@dataclass
+class HostedSession:
+    """An interview session running inside the API server."""
+    key: str
+    session: InterviewSession
+    context: contextvars.Context  # Holds the session's loggers and tracer
+    run_task: Optional[asyncio.Task] = None
+    final_update_task: Optional[asyncio.Task] = None
+    created_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def participant(self) -> APIParticipant:
+        return self.session.api_participant
+
+    def create_task(self, coro) -> asyncio.Task:
+        """Run a coroutine as a task in the session's context."""
+        return asyncio.get_running_loop().create_task(
+            coro, context=self.context)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_key": self.key,
+            "user_id": self.session.user_id,
+            "session_id": self.session.session_id,
+            "in_progress": self.session.session_in_progress,
+            "resumed": self.session.resumed,
+            "created_at": self.created_at.isoformat()
+        }
+
+
+class SessionManager:
+    """Hosts many concurrent interview sessions in one event loop.
+
+    Each session runs in its own context, so SessionLogger,
+    EvaluationLogger and Tracer resolve to that session's instances in
+    every task and thread it starts. Sessions are removed once their run
+    task finishes.
+
+    With the post-session queue enabled, a session's run task hands its
+    final update off to a post-session worker and finishes right away;
+    topics selected afterwards are passed on through the queue.
+    """
+
+    def __init__(self):
+        self.max_sessions = int(os.getenv("MAX_CONCURRENT_SESSIONS", 500))
+        self.topic_selection_timeout = \
+            float(os.getenv("TOPIC_SELECTION_TIMEOUT_SECONDS", 240))
+        self._sessions: Dict[str, HostedSession] = {}
+        self._active_users: Dict[str, str] = {}
+        self.post_session_queue = get_post_session_queue()
+        # Final update jobs of ended sessions, until their topics are selected
+        self._final_update_jobs: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def create_session(
+        self,
+        user_id: str,
+        biography_style: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create and start an interview session for a user.
+
+        Returns:
+            Dict[str, Any]: Description of the session, including its key
+
+        Raises:
+            SessionLimitError: If the server is full
+            SessionConflictError: If the user already has a session
+        """
+        if len(self._sessions) >= self.max_sessions:
+            raise SessionLimitError(
+                f"Server is hosting the maximum of {self.max_sessions} sessions")
+        if user_id in self._active_users:
+            raise SessionConflictError(
+                f"User {user_id} already has an active session")
+        if self.post_session_queue is not None and await asyncio.to_thread(
+                self.post_session_queue.has_unfinished, user_id):
+            raise SessionConflictError(
+                f"User {user_id}'s last session is still being processed")
+
+        key = uuid.uuid4().hex
+        self._active_users[user_id] = key
+        try:
+            user_config = {"user_id": user_id}
+            if biography_style:
+                user_config["biography_style"] = biography_style
+
+            # Loading the banks reads from disk, so build the session in a
+            # worker thread, inside a fresh context of its own
+            context = contextvars.Context()
+            session = await asyncio.to_thread(
+                context.run, InterviewSession,
+                interaction_mode='api', user_config=user_config)
+        except Exception:
+            del self._active_users[user_id]
+            raise
+
+        hosted = HostedSession(key=key, session=session, context=context)
+        hosted.run_task = hosted.create_task(session.run())
+        hosted.run_task.add_done_callback(lambda _: self._remove(hosted))
+        self._sessions[key] = hosted
+        return hosted.to_dict()
+
+    def get_session(self, key: str) -> HostedSession:
+        """Get a hosted session by key.
+
+        Raises:
+            KeyError: If no session has the key
+        """
+        return self._sessions[key]
+
+    async def get_info(self, key: str) -> Dict[str, Any]:
+        """Describe a hosted session."""
+        return self.get_session(key).to_dict()
+
+    async def send_message(
+        self,
+        key: str,
+        content: str,
+        message_type: MessageType = MessageType.CONVERSATION
+    ) -> None:
+        """Add a user message to a session's conversation.
+
+        Raises:
+            SessionEndedError: If the session is no longer in progress
+        """
+        hosted = self.get_session(key)
+        if not hosted.session.session_in_progress:
+            raise SessionEndedError(f"Session {key} has ended")
+        hosted.context.run(
+            hosted.session.add_message_to_chat_history,
+            role="User", content=content, message_type=message_type)
+
+    async def stream(self, key: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the interviewer's messages in a session as they arrive."""
+        async for message in self.get_session(key).participant.stream():
+            yield {
+                "id": message.id,
+                "role": message.role,
+                "content": message.content,
+                "timestamp": message.timestamp.isoformat()
+            }
+
+    async def end_session(self, key: str) -> List[str]:
+        """End the conversation and start the final biography update.
+
+        Returns:
+            List[str]: Topics covered in the session, to select from for
+            the next session
+        """
+        hosted = self.get_session(key)
+        if hosted.session.post_session_queue is not None:
+            # The run task hands the final update off to the queue
+            if key not in self._final_update_jobs:
+                self._final_update_jobs[key] = final_update_job_key(
+                    hosted.session.user_id, hosted.session.session_id)
+                hosted.context.run(hosted.session.end_session)
+                asyncio.create_task(self._forget_job_after_timeout(key))
+        elif hosted.final_update_task is None:
+            hosted.final_update_task = hosted.create_task(
+                hosted.session.final_update_biography_and_agenda(
+                    selected_topics=None))
+            # Let the update mark itself in progress before the session
+            # stops, so the run task waits for it before saving
+            await asyncio.sleep(0)
+            hosted.context.run(hosted.session.end_session)
+            hosted.create_task(self._default_topics_after_timeout(hosted))
+
+        return await hosted.create_task(
+            hosted.session.biography_orchestrator.get_session_topics())
+
+    async def select_topics(self, key: str, topics: List[str]) -> None:
+        """Set the topics to focus on in the user's next session."""
+        job_key = self._final_update_jobs.pop(key, None)
+        if job_key is not None:
+            await asyncio.to_thread(
+                self.post_session_queue.update_payload, job_key,
+                selected_topics=topics)
+            return
+        hosted = self.get_session(key)
+        await hosted.create_task(
+            hosted.session.biography_orchestrator.set_selected_topics(topics))
+
+    async def _default_topics_after_timeout(self, hosted: HostedSession):
+        """Continue the agenda update without topics if none are selected."""
+        await asyncio.sleep(self.topic_selection_timeout)
+        if hosted.key in self._sessions:
+            await hosted.session.biography_orchestrator.set_selected_topics([])
+
+    async def _forget_job_after_timeout(self, key: str):
+        """Stop taking topics once the worker has stopped waiting for them."""
+        await asyncio.sleep(self.topic_selection_timeout)
+        self._final_update_jobs.pop(key, None)
+
+    def _remove(self, hosted: HostedSession) -> None:
+        self._sessions.pop(hosted.key, None)
+        if self._active_users.get(hosted.session.user_id) == hosted.key:
+            del self._active_users[hosted.session.user_id]
+        hosted.participant.close()
+
+    async def shutdown(self) -> None:
+        """End all sessions and wait for them to save their state."""
+        for hosted in list(self._sessions.values()):
+            hosted.context.run(hosted.session.end_session)
+        tasks = [hosted.run_task for hosted in self._sessions.values()]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,330 @@
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import queue
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+from api.core.session_manager import (
+    SessionManager, SessionLimitError, SessionConflictError, SessionEndedError
+)
+from interview_session.session_models import MessageType
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+# Exceptions that cross the process boundary by name
+_ERRORS = {
+    error.__name__: error for error in
+    (KeyError, SessionLimitError, SessionConflictError, SessionEndedError)
+}
+
+
+def _worker_main(requests: multiprocessing.Queue,
+                 responses: multiprocessing.Queue) -> None:
+    """Entry point of a worker process hosting a SessionManager."""
+    asyncio.run(_SessionWorker(requests, responses).serve())
+
+
+class _SessionWorker:
+    """Runs commands from the supervisor against a local SessionManager.
+
+    Replies are (request id, error name, result) tuples. Interviewer
+    messages are pushed unprompted as (None, "message", (key, message))
+    and (None, "closed", key) once a session's stream ends.
+    """
+
+    def __init__(self, requests: multiprocessing.Queue,
+                 responses: multiprocessing.Queue):
+        self._requests = requests
+        self._responses = responses
+        self._manager = SessionManager()
+
+    async def serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=int(os.getenv("ENGINE_POOL_SIZE", 256)),
+            thread_name_prefix="engine"))
+        while True:
+            # Queue.get blocks, so wait for commands in a thread
+            request = await loop.run_in_executor(None, self._requests.get)
+            if request is None:
+                await self._manager.shutdown()
+                return
+            asyncio.create_task(self._handle(*request))
+
+    async def _handle(self, request_id: int, command: str, args: Tuple) -> None:
+        try:
+            if command == "create_session":
+                result = await self._manager.create_session(*args)
+                asyncio.create_task(self._forward(result["session_key"]))
+            elif command == "get_info":
+                result = await self._manager.get_info(*args)
+            elif command == "send_message":
+                result = await self._manager.send_message(*args)
+            elif command == "end_session":
+                result = await self._manager.end_session(*args)
+            elif command == "select_topics":
+                result = await self._manager.select_topics(*args)
+            else:
+                raise ValueError(f"Unknown command: {command}")
+            self._responses.put((request_id, None, result))
+        except Exception as e:
+            error = type(e).__name__ if type(e).__name__ in _ERRORS \
+                else "RuntimeError"
+            self._responses.put((request_id, error, str(e)))
+
+    async def _forward(self, key: str) -> None:
+        """Push a session's interviewer messages to the supervisor."""
+        async for message in self._manager.stream(key):
+            self._responses.put((None, "message", (key, message)))
+        self._responses.put((None, "closed", key))
+
+
+@dataclass
+class _Worker:
+    """A worker process and the queues to and from it."""
+    index: int
+    process: Any
+    requests: Any
+    responses: Any
+    # Set once the process has stopped and the worker has been replaced
+    stopped: bool = False
+
+
+class WorkerPool:
+    """Shards interview sessions across worker processes by user.
+
+    Every session of a user runs in the same worker, chosen by a stable
+    hash of the user ID, so each user's banks, biography and agenda are
+    loaded and written by a single process. Exposes the same interface
+    as SessionManager for the API server.
+
+    A worker that stops unexpectedly fails its pending calls, ends the
+    streams of its sessions and is replaced by a new worker, so its
+    users can start new sessions.
+    """
+
+    def __init__(self, num_workers: int):
+        self.num_workers = num_workers
+        self._context = multiprocessing.get_context("spawn")
+        self.call_timeout = \
+            float(os.getenv("WORKER_CALL_TIMEOUT_SECONDS", 300))
+        self.shutdown_timeout = \
+            float(os.getenv("WORKER_SHUTDOWN_TIMEOUT_SECONDS", 360))
+        self.topic_selection_timeout = \
+            float(os.getenv("TOPIC_SELECTION_TIMEOUT_SECONDS", 240))
+        self._workers: List[_Worker] = []
+        # Pending calls by request ID, with the worker they were sent to
+        self._pending: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._request_ids = itertools.count()
+        self._session_workers: Dict[str, int] = {}
+        # Workers of ended sessions, which may still receive topics after
+        # their run task has finished, until the topic selection times out
+        self._ended_workers: Dict[str, int] = {}
+        self._streams: Dict[str, asyncio.Queue] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+
+    def start(self) -> None:
+        """Start the worker processes. Must be called from the event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._workers = [self._spawn(index)
+                         for index in range(self.num_workers)]
+
+    def _spawn(self, index: int) -> _Worker:
+        """Start a worker process, with threads reading its responses and
+        watching for it to stop."""
+        requests = self._context.Queue()
+        responses = self._context.Queue()
+        process = self._context.Process(
+            target=_worker_main, args=(requests, responses),
+            name=f"session-worker-{index}", daemon=True)
+        process.start()
+        worker = _Worker(index, process, requests, responses)
+        threading.Thread(
+            target=self._read_responses, args=(worker,),
+            name=f"session-worker-{index}-reader", daemon=True).start()
+        threading.Thread(
+            target=self._watch, args=(worker,),
+            name=f"session-worker-{index}-watcher", daemon=True).start()
+        return worker
+
+    def __len__(self) -> int:
+        return len(self._session_workers)
+
+    def worker_for(self, user_id: str) -> int:
+        """Index of the worker that hosts a user's sessions."""
+        return zlib.crc32(user_id.encode("utf-8")) % self.num_workers
+
+    def _read_responses(self, worker: _Worker) -> None:
+        # A process that stopped abruptly may never send an end marker,
+        # so poll until the worker is marked stopped
+        while not worker.stopped:
+            try:
+                response = worker.responses.get(timeout=1)
+            except queue.Empty:
+                continue
+            self._loop.call_soon_threadsafe(self._dispatch, worker, *response)
+
+    def _watch(self, worker: _Worker) -> None:
+        multiprocessing.connection.wait([worker.process.sentinel])
+        # Reap the process, so its exit code is set
+        worker.process.join()
+        if not self._stopping:
+            self._loop.call_soon_threadsafe(self._on_worker_stopped, worker)
+
+    def _on_worker_stopped(self, worker: _Worker) -> None:
+        """Clean up after a worker that stopped unexpectedly and replace it."""
+        if self._stopping or worker.stopped:
+            return
+        worker.stopped = True
+        logger.error(f"Session worker {worker.index} stopped with exit code "
+                     f"{worker.process.exitcode}, restarting it")
+
+        for request_id, (index, future) in list(self._pending.items()):
+            if index == worker.index:
+                del self._pending[request_id]
+                if not future.done():
+                    future.set_exception(RuntimeError(
+                        f"Session worker {worker.index} stopped"))
+        for key, index in list(self._session_workers.items()):
+            if index == worker.index:
+                del self._session_workers[key]
+                self._streams.setdefault(key, asyncio.Queue()) \
+                    .put_nowait(None)
+        for key, index in list(self._ended_workers.items()):
+            if index == worker.index:
+                del self._ended_workers[key]
+
+        # Requests nobody will read must not keep the server from exiting
+        worker.requests.cancel_join_thread()
+        self._workers[worker.index] = self._spawn(worker.index)
+
+    def _dispatch(self, worker: _Worker, request_id: Optional[int],
+                  kind: Optional[str], payload: Any) -> None:
+        if worker.stopped:
+            # Its calls have failed and its streams have ended already
+            return
+        if request_id is None:
+            # Stream push from a worker
+            if kind == "message":
+                key, message = payload
+                self._streams.setdefault(key, asyncio.Queue()) \
+                    .put_nowait(message)
+            elif kind == "closed":
+                self._streams.setdefault(payload, asyncio.Queue()) \
+                    .put_nowait(None)
+                self._session_workers.pop(payload, None)
+                if payload in self._ended_workers:
+                    self._loop.call_later(self.topic_selection_timeout,
+                                          self._ended_workers.pop,
+                                          payload, None)
+            return
+
+        _, future = self._pending.pop(request_id, (None, None))
+        if future is None or future.done():
+            return
+        if kind is None:
+            future.set_result(payload)
+        else:
+            future.set_exception(_ERRORS.get(kind, RuntimeError)(payload))
+
+    async def _call(self, worker: int, command: str, *args) -> Any:
+        """Run a command in a worker and wait for its result.
+
+        Raises:
+            TimeoutError: If the worker does not reply within call_timeout
+            RuntimeError: If the worker stops before replying
+        """
+        request_id = next(self._request_ids)
+        future = self._loop.create_future()
+        self._pending[request_id] = (worker, future)
+        self._workers[worker].requests.put((request_id, command, args))
+        try:
+            return await asyncio.wait_for(future, self.call_timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _worker_of(self, key: str) -> int:
+        """Worker hosting a session.
+
+        Raises:
+            KeyError: If no session has the key
+        """
+        return self._session_workers[key]
+
+    async def create_session(
+        self,
+        user_id: str,
+        biography_style: Optional[str] = None
+    ) -> Dict[str, Any]:
+        worker = self.worker_for(user_id)
+        info = await self._call(
+            worker, "create_session", user_id, biography_style)
+        self._session_workers[info["session_key"]] = worker
+        self._streams.setdefault(info["session_key"], asyncio.Queue())
+        return info
+
+    async def get_info(self, key: str) -> Dict[str, Any]:
+        return await self._call(self._worker_of(key), "get_info", key)
+
+    async def send_message(
+        self,
+        key: str,
+        content: str,
+        message_type: MessageType = MessageType.CONVERSATION
+    ) -> None:
+        await self._call(
+            self._worker_of(key), "send_message", key, content, message_type)
+
+    async def stream(self, key: str) -> AsyncIterator[Dict[str, Any]]:
+        queue = self._streams.get(key)
+        if queue is None:
+            raise KeyError(key)
+        while True:
+            message = await queue.get()
+            if message is None:
+                self._streams.pop(key, None)
+                return
+            yield message
+
+    async def end_session(self, key: str) -> List[str]:
+        worker = self._worker_of(key)
+        self._ended_workers[key] = worker
+        return await self._call(worker, "end_session", key)
+
+    async def select_topics(self, key: str, topics: List[str]) -> None:
+        worker = self._ended_workers.pop(key, None)
+        if worker is None:
+            worker = self._worker_of(key)
+        await self._call(worker, "select_topics", key, topics)
+
+    async def shutdown(self) -> None:
+        """Stop the workers after their sessions have saved their state.
+
+        Workers still running after shutdown_timeout are terminated.
+        """
+        self._stopping = True
+        for worker in self._workers:
+            worker.requests.put(None)
+        deadline = time.monotonic() + self.shutdown_timeout
+        for worker in self._workers:
+            await asyncio.to_thread(
+                worker.process.join, max(0, deadline - time.monotonic()))
+            if worker.process.is_alive():
+                logger.warning(f"Session worker {worker.index} did not stop "
+                               f"in time, terminating it")
+                worker.requests.cancel_join_thread()
+                worker.process.terminate()
+                await asyncio.to_thread(worker.process.join)
+            worker.stopped = True
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from dotenv import load_dotenv
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from api.core.session_manager import (
+    SessionManager, SessionLimitError, SessionConflictError, SessionEndedError
+)
+from api.core.worker_pool import WorkerPool
+from interview_session.post_session import get_post_session_queue
+from interview_session.session_models import MessageType
+
+load_dotenv(override=True)
+
+
+class CreateSessionRequest(BaseModel):
+    user_id: str
+    biography_style: Optional[str] = None
+
+
+class SendMessageRequest(BaseModel):
+    content: str = ""
+    type: MessageType = MessageType.CONVERSATION
+
+
+class SelectTopicsRequest(BaseModel):
+    topics: List[str]
+
+
+# With more than one worker process, sessions are sharded across workers
+# by user; otherwise they run in this process
+num_workers = int(os.getenv("WORKER_PROCESSES", 1))
+sessions = WorkerPool(num_workers) if num_workers > 1 else SessionManager()
+
+# Final updates handed off to post-session workers, if enabled
+post_session_queue = get_post_session_queue()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    executor = None
+    if isinstance(sessions, WorkerPool):
+        sessions.start()
+    else:
+        # LLM calls block a worker thread each, so size the default executor
+        # for many concurrent sessions rather than the CPU count
+        executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("ENGINE_POOL_SIZE", 256)),
+            thread_name_prefix="engine")
+        asyncio.get_running_loop().set_default_executor(executor)
+    yield
+    await sessions.shutdown()
+    if executor:
+        executor.shutdown(wait=False)
+
+
+app = FastAPI(title="Interview API", lifespan=lifespan)
+
+
+def _not_found(key: str) -> HTTPException:
+    return HTTPException(status_code=404, detail=f"Session {key} not found")
+
+
+@app.get("/health")
+async def health():
+    health = {"status": "ok", "sessions": len(sessions)}
+    if post_session_queue is not None:
+        health["post_session_jobs"] = \
+            await asyncio.to_thread(post_session_queue.stats)
+    return health
+
+
+@app.post("/sessions", status_code=201)
+async def create_session(request: CreateSessionRequest):
+    """Start an interview session; the interviewer's opening is streamed."""
+    try:
+        return await sessions.create_session(
+            request.user_id, request.biography_style)
+    except SessionLimitError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@app.get("/sessions/{key}")
+async def get_session(key: str):
+    try:
+        return await sessions.get_info(key)
+    except KeyError:
+        raise _not_found(key)
+
+
+@app.post("/sessions/{key}/messages", status_code=202)
+async def send_message(key: str, request: SendMessageRequest):
+    """Send a user message; replies arrive on the stream endpoint."""
+    try:
+        await sessions.send_message(key, request.content, request.type)
+    except KeyError:
+        raise _not_found(key)
+    except SessionEndedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"status": "accepted"}
+
+
+@app.get("/sessions/{key}/stream")
+async def stream_messages(key: str):
+    """Stream interviewer messages as server-sent events."""
+    try:
+        await sessions.get_info(key)
+    except KeyError:
+        raise _not_found(key)
+
+    async def events():
+        async for message in sessions.stream(key):
+            yield f"event: message\ndata: {json.dumps(message)}\n\n"
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.post("/sessions/{key}/end")
+async def end_session(key: str):
+    """End the conversation and get the topics to choose from."""
+    try:
+        return {"topics": await sessions.end_session(key)}
+    except KeyError:
+        raise _not_found(key)
+
+
+@app.post("/sessions/{key}/topics", status_code=204)
+async def select_topics(key: str, request: SelectTopicsRequest):
+    """Select topics for the next session's agenda."""
+    try:
+        await sessions.select_topics(key, request.topics)
+    except KeyError:
+        raise _not_found(key)
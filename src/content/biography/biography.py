@@ -1,3 +1,4 @@
+import copy
 from datetime import datetime
 import json
 from typing import Dict, Optional, List
@@ -7,6 +8,8 @@ import asyncio
 import re
 from dotenv import load_dotenv
 
+from utils.logger.tracer import Tracer
+
 load_dotenv()
 
 class Section:
@@ -17,6 +20,7 @@ class Section:
         self.created_at = datetime.now().isoformat()
         self.last_edit = datetime.now().isoformat()
         self.subsections: Dict[str, 'Section'] = {}
+        self.parent = parent
         self.memory_ids: List[str] = []
         self.update_memory_ids()
 
@@ -34,19 +38,20 @@ class Section:
             "content": self.content,
             "created_at": self.created_at,
             "last_edit": self.last_edit,
-            "memory_ids": self.memory_ids,
+            "memory_ids": list(self.memory_ids),
             "subsections": {k: v.to_dict() for k, v in self.subsections.items()}
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Section':
-        section = cls(data["title"])
+    def from_dict(cls, data: Dict, parent: Optional['Section'] = None) -> 'Section':
+        section = cls(data["title"], parent=parent)
         section.id = data["id"]
         section.content = data["content"]
         section.created_at = data["created_at"]
         section.last_edit = data["last_edit"]
         section.memory_ids = data.get("memory_ids", [])
-        section.subsections = {k: cls.from_dict(v) for k, v in data["subsections"].items()}
+        section.subsections = {k: cls.from_dict(v, parent=section)
+                               for k, v in data["subsections"].items()}
         return section
 
     @classmethod
@@ -74,6 +79,17 @@ class Section:
         return list(dict.fromkeys(found_ids))
 
 class Biography:
+    """A user's biography, as a tree of sections.
+
+    Section updates run concurrently on the event loop. Every read and
+    write of the tree completes without awaiting, so each one is atomic:
+    writers of different sections never wait on each other, and readers
+    such as export_to_markdown see a consistent tree without blocking
+    writers. Keep it that way: an await inside a read or write of the
+    tree would let other updates interleave with it. Saves snapshot the
+    tree and write the files in a worker thread.
+    """
+
     def __init__(self, user_id):
         # Path information
         self.user_id = user_id or str(uuid.uuid4())
@@ -84,54 +100,38 @@ class Biography:
         self.version = self._get_latest_version()
         self.increment_version = False
 
-        # Root section
-        self.root = Section(f"Biography of {self.user_id}")
-
-        # Locks for write operations
-        self._write_lock = asyncio.Lock()           # Lock for write operations
-        self._pending_writes = 0                    # Counter for pending writes
-        self._pending_writes_lock = asyncio.Lock()  # Lock for the counter
-        self._all_writes_complete = asyncio.Event() # Event to track completion
-        self._all_writes_complete.set()             # Initially set to True
-        
-        # Reader-writer lock implementation
-        self._active_readers = 0                    # Counter for active readers
-        self._reader_lock = asyncio.Lock()          # Lock for reader counter
-
-    async def _increment_pending_writes(self):
-        """Increment the pending writes counter."""
-        async with self._pending_writes_lock:
-            self._pending_writes += 1
-            self._all_writes_complete.clear()
-
-    async def _decrement_pending_writes(self):
-        """Decrement the pending writes counter."""
-        async with self._pending_writes_lock:
-            self._pending_writes -= 1
-            if self._pending_writes == 0:
-                self._all_writes_complete.set()
-                
-    async def _acquire_read_lock(self):
-        """Acquire a read lock. Multiple readers can read simultaneously."""
-        # Wait for any pending writes to complete
-        await self._all_writes_complete.wait()
-        
-        # Increment active readers count
-        async with self._reader_lock:
-            self._active_readers += 1
-            
-    async def _release_read_lock(self):
-        """Release a read lock."""
-        async with self._reader_lock:
-            self._active_readers -= 1
-            
-    async def _wait_for_readers(self):
-        """Wait for all readers to finish before allowing writes."""
-        while True:
-            async with self._reader_lock:
-                if self._active_readers == 0:
-                    break
-            await asyncio.sleep(0.1)  # Small delay to prevent CPU spinning
+        # Root section, and an index of its section tree by title.
+        # Titles map to every section with the title, in insertion order.
+        self._sections_by_title: Dict[str, List[Section]] = {}
+        self._set_root(Section(f"Biography of {self.user_id}"))
+
+        # Saves write the same files, so they run one at a time
+        self._save_lock = asyncio.Lock()
+
+    def _set_root(self, root: Section) -> None:
+        """Replace the section tree and rebuild its index."""
+        self.root = root
+        self._sections_by_title = {}
+        self._index_section(root)
+
+    def _index_section(self, section: Section) -> None:
+        """Add a section and its subsections to the index."""
+        self._sections_by_title.setdefault(section.title, []).append(section)
+        for subsection in section.subsections.values():
+            self._index_section(subsection)
+
+    def _unindex_section(self, section: Section) -> None:
+        """Remove a section and its subsections from the index."""
+        self._unindex_title(section)
+        for subsection in section.subsections.values():
+            self._unindex_section(subsection)
+
+    def _unindex_title(self, section: Section) -> None:
+        sections = self._sections_by_title.get(section.title, [])
+        if section in sections:
+            sections.remove(section)
+        if not sections:
+            self._sections_by_title.pop(section.title, None)
 
     def _get_file_name(self) -> str:
         save_version = self.version + 1 if self.increment_version \
@@ -198,43 +198,45 @@ class Biography:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                biography.root = Section.from_dict(data)
+                biography._set_root(Section.from_dict(data))
                 biography.version = version if version > 0 else latest_version
         except FileNotFoundError:
             pass
         
         return biography
     
+    @Tracer.traced("biography.save")
     async def save(self, save_markdown: bool = False, increment_version: bool = True) -> None:
         """Save the biography to a JSON file using user_id."""
         if increment_version:
             self.increment_version = True
-                
-        try:
-            # Wait for all pending writes with timeout
-            await asyncio.wait_for(self._all_writes_complete.wait(), timeout=30)
-        except asyncio.TimeoutError:
-            raise TimeoutError("Timeout waiting for pending writes to complete")
 
-        # Wait for all readers to finish before writing
-        await self._wait_for_readers()
+        # Snapshot the biography, then write it out in a worker thread, so
+        # section updates carry on while the files are written
+        file_name = self._get_file_name()
+        data = self.root.to_dict()
+        markdown_content = \
+            self._covert_to_markdown_content(hide_memory_links=True) \
+            if save_markdown else None
 
-        async with self._write_lock:
-            os.makedirs(self.base_path, exist_ok=True)
-            
-            # Save JSON
-            with open(f'{self._get_file_name()}.json', 'w', encoding='utf-8') as f:
-                json.dump(self.root.to_dict(), f, indent=4, ensure_ascii=False)
-
-            # Save markdown if requested
-            if save_markdown:
-                markdown_content = \
-                      self._covert_to_markdown_content(hide_memory_links=True)
-                output_path = f"{self._get_file_name()}.md"
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
+        async with self._save_lock:
+            await asyncio.to_thread(
+                self._write_files, file_name, data, markdown_content)
 
+    def _write_files(self, file_name: str, data: Dict,
+                     markdown_content: Optional[str]) -> None:
+        os.makedirs(self.base_path, exist_ok=True)
+        
+        # Save JSON
+        with open(f'{file_name}.json', 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+        # Save markdown if requested
+        if markdown_content is not None:
+            output_path = f"{file_name}.md"
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(markdown_content)
 
     def is_valid_path_format(self, path: str) -> bool:
         """
@@ -307,26 +309,6 @@ class Biography:
         sorted_items = sorted(sections.items(), key=lambda x: get_sort_key(x[0]))
         return dict(sorted_items)
 
-    def _find_parent(self, title: str) -> Optional[Section]:
-        """Find the parent section of a section with the given title using DFS.
-        
-        Args:
-            title: Title of the section whose parent we want to find
-            
-        Returns:
-            Parent section if found, None if section is root or not found
-        """
-        def _search(section: Section) -> Optional[Section]:
-            for subsection_title, subsection in section.subsections.items():
-                if subsection_title == title:
-                    return section
-                parent = _search(subsection)
-                if parent:
-                    return parent
-            return None
-        
-        return _search(self.root)
-    
     def _get_section_by_path(self, path: str) -> Optional[Section]:
         """Get a section using its path (e.g., 'Chapter 1/Section 1.1')"""
         if not path:
@@ -347,7 +329,17 @@ class Biography:
         return current
 
     def _get_section_by_title(self, title: str) -> Optional[Section]:
-        """Find a section by its title using DFS"""
+        """Find a section by its title.
+
+        If several sections share the title, the first one in depth-first
+        order is returned.
+        """
+        sections = self._sections_by_title.get(title)
+        if not sections:
+            return None
+        if len(sections) == 1:
+            return sections[0]
+
         def _search(section: Section) -> Optional[Section]:
             if section.title == title:
                 return section
@@ -384,6 +376,8 @@ class Biography:
             section = self._get_section_by_title(title)
 
         if section and hide_memory_links:
+            # Hide the links in a copy; the section itself keeps them
+            section = copy.copy(section)
             section.content = re.sub(r'\[([\w-]+)\]', '', section.content)
         
         return section
@@ -404,137 +398,132 @@ class Biography:
     async def add_section(self, path: str, content: str = "") -> Section:
         """Add a new section at the specified path, creating parent sections if they don't exist.
         If section already exists, updates its content without modifying subsections."""
-        await self._increment_pending_writes()
-        try:
-            async with self._write_lock:
-                if not path:
-                    raise ValueError("Path cannot be empty - "
-                                     "must provide a section path")
-                
-                if not self.is_valid_path_format(path):
-                    raise ValueError(
-                        f"Invalid path format: {path}. "
-                        "Path must follow the required format rules."
-                    )
-
-                # Split the path into parts
-                path_parts = path.split('/')
-                title = path_parts[-1]
-                
-                # Get or create the parent section
-                current = self.root
-                for part in path_parts[:-1]:
-                    if part not in current.subsections:
-                        new_parent = Section(part, "", current)
-                        current.subsections[part] = new_parent
-                    current = current.subsections[part]
-                
-                # If section already exists, just update content
-                if path_parts[-1] in current.subsections:
-                    if content:  # Only update if new content provided
-                        current.subsections[path_parts[-1]].content = content
-                        current.subsections[path_parts[-1]].last_edit = \
-                            datetime.now().isoformat()
-                    return current.subsections[path_parts[-1]]
-                
-                # Create and add the new section
-                new_section = Section(title, content, current)
-                new_section.update_memory_ids()
-                current.subsections[path_parts[-1]] = new_section
-                
-                # Sort the subsections after adding the new one
-                current.subsections = self._sort_sections(current.subsections)
+        if not path:
+            raise ValueError("Path cannot be empty - "
+                             "must provide a section path")
 
-                return new_section
-        finally:
-            await self._decrement_pending_writes()
+        if not self.is_valid_path_format(path):
+            raise ValueError(
+                f"Invalid path format: {path}. "
+                "Path must follow the required format rules."
+            )
+
+        # Split the path into parts
+        path_parts = path.split('/')
+        title = path_parts[-1]
+
+        # Get or create the parent section
+        current = self.root
+        for part in path_parts[:-1]:
+            if part not in current.subsections:
+                new_parent = Section(part, "", current)
+                current.subsections[part] = new_parent
+                self._index_section(new_parent)
+            current = current.subsections[part]
+
+        # If section already exists, just update content
+        if path_parts[-1] in current.subsections:
+            if content:  # Only update if new content provided
+                current.subsections[path_parts[-1]].content = content
+                current.subsections[path_parts[-1]].last_edit = \
+                    datetime.now().isoformat()
+            return current.subsections[path_parts[-1]]
+
+        # Create and add the new section
+        new_section = Section(title, content, current)
+        new_section.update_memory_ids()
+        current.subsections[path_parts[-1]] = new_section
+        self._index_section(new_section)
+
+        # Sort the subsections after adding the new one
+        current.subsections = self._sort_sections(current.subsections)
+
+        return new_section
 
     async def update_section(self, path: Optional[str] = None, title: Optional[str] = None, content: Optional[str] = None, new_title: Optional[str] = None) -> Optional[Section]:
         """Update the content and optionally the title of a section 
         by path or title."""
-        await self._increment_pending_writes()
-        try:
-            async with self._write_lock:
-                if path is None and title is None:
-                    raise ValueError("Must provide either path or title")
-                elif path and title and not path.endswith(title):
-                    raise ValueError("Path and title must match to update a section")
-                
-                # Handle special case for root section
-                if path is not None and path == "":
-                    if content is not None:
-                        self.root.content = content
-                        self.root.last_edit = datetime.now().isoformat()
-                    if new_title:
-                        self.root.title = new_title
-                    return self.root
-                
-                # Get section without hiding memory links to modify the original
-                section = self.get_section(path=path, title=title, 
-                                           hide_memory_links=False)
-                
-                if section:
-                    if content is not None:
-                        section.content = content
-                        section.last_edit = datetime.now().isoformat()
-                        section.update_memory_ids()
-                    
-                    # Handle title update if provided
-                    if new_title and new_title != section.title:
-                        parent = self._find_parent(section.title)
-                        if parent:
-                            # Update the key in parent's subsections
-                            subsections = parent.subsections
-                            section = subsections.pop(section.title)
-                            section.title = new_title  # Update the title
-                            subsections[new_title] = section  # Add back
-                            # Sort the parent's subsections
-                            parent.subsections = \
-                                self._sort_sections(parent.subsections)
-                        else:
-                            # This is the root section
-                            section.title = new_title
-                    
-                    return section
+        if path is None and title is None:
+            raise ValueError("Must provide either path or title")
+        elif path and title and not path.endswith(title):
+            raise ValueError("Path and title must match to update a section")
+
+        # Handle special case for root section
+        if path is not None and path == "":
+            if content is not None:
+                self.root.content = content
+                self.root.last_edit = datetime.now().isoformat()
+            if new_title and new_title != self.root.title:
+                self._unindex_title(self.root)
+                self.root.title = new_title
+                self._sections_by_title.setdefault(
+                    new_title, []).append(self.root)
+            return self.root
 
-                return None
-        finally:
-            await self._decrement_pending_writes()
+        # Get section without hiding memory links to modify the original
+        section = self.get_section(path=path, title=title, 
+                                   hide_memory_links=False)
+
+        if section:
+            if content is not None:
+                section.content = content
+                section.last_edit = datetime.now().isoformat()
+                section.update_memory_ids()
+
+            # Handle title update if provided
+            if new_title and new_title != section.title:
+                parent = section.parent
+                self._unindex_title(section)
+                if parent:
+                    # Update the key in parent's subsections
+                    subsections = parent.subsections
+                    section = subsections.pop(section.title)
+                    section.title = new_title  # Update the title
+                    subsections[new_title] = section  # Add back
+                    # Sort the parent's subsections
+                    parent.subsections = \
+                        self._sort_sections(parent.subsections)
+                else:
+                    # This is the root section
+                    section.title = new_title
+                self._sections_by_title.setdefault(
+                    new_title, []).append(section)
+
+            return section
+
+        return None
     
     async def delete_section(self, path: Optional[str] = None, title: Optional[str] = None) -> bool:
         """Delete a section by its path or title."""
-        await self._increment_pending_writes()
-        try:
-            async with self._write_lock:
-                if path is None and title is None:
-                    raise ValueError("Must provide either path or "
-                                     "title to delete a section")
-                
-                # Handle root section deletion attempt
-                if path == "":
-                    raise ValueError("Cannot delete root section")
-                
-                # Get section by path or title
-                section = self.get_section(path=path, title=title)
-                if section:
-                    title = section.title
-                
-                if not section:
-                    return False
-                
-                # Can't delete root section
-                if section == self.root:
-                    raise ValueError("Cannot delete root section")
-                
-                # Find and delete from parent's subsections
-                parent = self._find_parent(section.title)
-                if parent:
-                    del parent.subsections[title]
-                    return True
+        if path is None and title is None:
+            raise ValueError("Must provide either path or "
+                             "title to delete a section")
 
-                return False
-        finally:
-            await self._decrement_pending_writes()
+        # Handle root section deletion attempt
+        if path == "":
+            raise ValueError("Cannot delete root section")
+
+        # Get section by path or title
+        section = self.get_section(path=path, title=title,
+                                   hide_memory_links=False)
+        if section:
+            title = section.title
+
+        if not section:
+            return False
+
+        # Can't delete root section
+        if section == self.root:
+            raise ValueError("Cannot delete root section")
+
+        # Delete from parent's subsections
+        parent = section.parent
+        if parent:
+            del parent.subsections[title]
+            self._unindex_section(section)
+            return True
+
+        return False
 
     def _covert_to_markdown_content(self, hide_memory_links: bool = True) -> str:
         """Internal method to convert biography to markdown without locks."""
@@ -567,24 +556,20 @@ class Biography:
             save_to_file: Whether to save the markdown to a file
             hide_memory_links: If True, removes memory ID brackets from content
         """
-        # Acquire read lock
-        await self._acquire_read_lock()
-        try:
-            # Generate markdown content
-            markdown_content = \
-                self._covert_to_markdown_content(hide_memory_links)
-
-            # Save to markdown file if requested
-            if save_to_file:
-                # For file operations, we need to ensure no writes are happening
-                await self._all_writes_complete.wait()
-                
-                output_path = f"{self._get_file_name()}.md"
+        # Generate markdown content from the biography as it is now
+        markdown_content = \
+            self._covert_to_markdown_content(hide_memory_links)
+
+        # Save to markdown file if requested
+        if save_to_file:
+            output_path = f"{self._get_file_name()}.md"
+
+            def _write():
                 os.makedirs(os.path.dirname(output_path), exist_ok=True)
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(markdown_content)
 
-            return markdown_content
-        finally:
-            # Release read lock
-            await self._release_read_lock()
+            async with self._save_lock:
+                await asyncio.to_thread(_write)
+
+        return markdown_content
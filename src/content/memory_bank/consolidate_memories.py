@@ -0,0 +1,113 @@
+import os
+import re
+import sys
+import asyncio
+import argparse
+from typing import Dict
+from pathlib import Path
+
+# Add src directory to Python path
+src_dir = str(Path(__file__).parent.parent.parent)
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+from content.memory_bank.memory_bank_vector_db import VectorMemoryBank
+from content.question_bank.question_bank_vector_db import QuestionBankVectorDB
+from content.biography.biography import Biography, Section
+
+
+def _remap_biography(section: Section, merged_ids: Dict[str, str]) -> int:
+    """Replace merged memory IDs in a section tree with the kept IDs.
+
+    Returns:
+        int: Number of sections whose memory links changed
+    """
+    changed = 0
+    if any(memory_id in merged_ids for memory_id in section.memory_ids):
+        section.content = re.sub(
+            r'\[(MEM_[\w-]+)\]',
+            lambda m: f"[{merged_ids.get(m.group(1), m.group(1))}]",
+            section.content
+        )
+        section.memory_ids = list(dict.fromkeys(
+            merged_ids.get(memory_id, memory_id)
+            for memory_id in section.memory_ids
+        ))
+        changed += 1
+
+    for subsection in section.subsections.values():
+        changed += _remap_biography(subsection, merged_ids)
+    return changed
+
+
+def consolidate_user_memories(user_id: str, threshold: float = None) -> Dict[str, str]:
+    """Merge near-duplicate memories in a user's memory bank.
+
+    Question links and biography memory references to merged memories
+    are redirected to the memories they were merged into.
+
+    Args:
+        user_id: ID of the user whose memory bank to consolidate
+        threshold: Optional cosine similarity threshold
+
+    Returns:
+        Dict[str, str]: Mapping from removed memory ID to kept memory ID
+    """
+    memory_bank = VectorMemoryBank.load_from_file(user_id)
+    merged_ids = memory_bank.consolidate(threshold=threshold)
+    if not merged_ids:
+        return merged_ids
+
+    # Redirect question links
+    question_bank = QuestionBankVectorDB.load_from_file(user_id)
+    for question in question_bank.questions:
+        question.memory_ids = list(dict.fromkeys(
+            merged_ids.get(memory_id, memory_id)
+            for memory_id in question.memory_ids
+        ))
+
+    # Redirect biography references
+    biography = Biography.load_from_file(user_id)
+    if biography.version > 0 and _remap_biography(biography.root, merged_ids):
+        asyncio.run(biography.save(save_markdown=True, increment_version=True))
+
+    memory_bank.save_to_file(user_id)
+    question_bank.save_to_file(user_id)
+    return merged_ids
+
+
+def main():
+    """
+    Consolidate near-duplicate memories in existing memory banks.
+
+    Example usage:
+    python src/content/memory_bank/consolidate_memories.py --user_id coates
+    python src/content/memory_bank/consolidate_memories.py --threshold 0.9
+    """
+    parser = argparse.ArgumentParser(
+        description='Merge near-duplicate memories in memory banks')
+    parser.add_argument('--user_id', type=str, help='Specific user ID to process. '
+                        'If not provided, processes all users.')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='Cosine similarity threshold '
+                        '(default: MEMORY_DUPLICATE_THRESHOLD)')
+    args = parser.parse_args()
+
+    logs_dir = os.getenv("LOGS_DIR", "logs")
+    user_ids = [args.user_id] if args.user_id else [
+        d for d in os.listdir(logs_dir)
+        if os.path.exists(os.path.join(logs_dir, d, "memory_bank_content.json"))
+    ]
+
+    for user_id in user_ids:
+        merged_ids = consolidate_user_memories(user_id, args.threshold)
+        print(f"Merged {len(merged_ids)} near-duplicate memories "
+              f"for {user_id}")
+
+
+if __name__ == "__main__":
+    main()
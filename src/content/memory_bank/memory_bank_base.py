@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import os
 import json
 import random
+import re
 import string
+from collections import OrderedDict
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -19,9 +21,19 @@ class MemoryBankBase(ABC):
     from this class and implement the abstract methods.
     """
     
+    # Maximum number of cached search results per memory bank
+    SEARCH_CACHE_SIZE = 256
+
     def __init__(self):
         self.memories: List[Memory] = []
         self.session_id: Optional[str] = None
+
+        # Bumped on every change to the memories; invalidates search cache
+        self.version = 0
+        self._search_cache: OrderedDict[Tuple[str, int], 
+                                        List[MemorySearchResult]] = \
+            OrderedDict()
+        self._search_cache_version = 0
     
     def set_session_id(self, session_id: str) -> None:
         """Set the current session ID for the memory bank.
@@ -31,6 +43,51 @@ class MemoryBankBase(ABC):
         """
         self.session_id = session_id
     
+    def _bump_version(self) -> None:
+        """Mark the memory bank as changed."""
+        self.version += 1
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a search query so trivially different queries 
+        share a cache entry."""
+        query = re.sub(r'\s+', ' ', query.strip().lower())
+        return query.rstrip('.?!')
+
+    def _get_cached_search(self, query: str, k: int
+                           ) -> Optional[List[MemorySearchResult]]:
+        """Get cached search results if the bank has not changed since.
+        
+        Args:
+            query: The search query text
+            k: Number of results requested
+            
+        Returns:
+            Optional[List[MemorySearchResult]]: Cached results, or None
+        """
+        if self._search_cache_version != self.version:
+            self._search_cache.clear()
+            self._search_cache_version = self.version
+            return None
+
+        key = (self._normalize_query(query), k)
+        results = self._search_cache.get(key)
+        if results is None:
+            return None
+        self._search_cache.move_to_end(key)
+        return list(results)
+
+    def _cache_search(self, query: str, k: int, 
+                      results: List[MemorySearchResult]) -> None:
+        """Cache search results for the current bank version."""
+        if self._search_cache_version != self.version:
+            self._search_cache.clear()
+            self._search_cache_version = self.version
+
+        self._search_cache[(self._normalize_query(query), k)] = list(results)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+    
     def generate_memory_id(self) -> str:
         """Generate a short, unique memory ID.
         Format: MEM_MMDDHHMM_{random_chars}
@@ -65,11 +122,45 @@ class MemoryBankBase(ABC):
             Memory: The created memory object
         """
         pass
+
+    def add_or_merge_memory(
+        self,
+        title: str,
+        text: str,
+        importance_score: int,
+        source_interview_response: str,
+        metadata: Optional[Dict] = None,
+        question_ids: Optional[List[str]] = None
+    ) -> Tuple[Memory, bool]:
+        """Add a new memory unless it is a near-duplicate of an existing one.
+        
+        Implementations that can detect near-duplicates should override this.
+        By default, the memory is always added.
+        
+        Args:
+            Same as add_memory
+            
+        Returns:
+            Tuple[Memory, bool]: The stored memory and whether the new memory
+            was merged into an existing one instead of being added
+        """
+        memory = self.add_memory(
+            title=title,
+            text=text,
+            importance_score=importance_score,
+            source_interview_response=source_interview_response,
+            metadata=metadata,
+            question_ids=question_ids
+        )
+        return memory, False
     
     @abstractmethod
     def search_memories(self, query: str, k: int = 5) -> List[MemorySearchResult]:
         """Search for similar memories using the query text.
         
+        Implementations should serve repeated queries from the search cache
+        (see _get_cached_search) and bump the version on every change.
+        
         Args:
             query: The search query text
             k: Number of results to return
@@ -189,6 +280,7 @@ class MemoryBankBase(ABC):
         memory = self.get_memory_by_id(memory_id)
         if memory and question_id not in memory.question_ids:
             memory.question_ids.append(question_id)
+            self._bump_version()
 
     def get_memories_by_question(self, question_id: str) -> List[Memory]:
         """Get all memories linked to a specific question.
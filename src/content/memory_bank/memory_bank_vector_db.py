@@ -3,7 +3,7 @@ import os
 import json
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
 import faiss
@@ -13,6 +13,7 @@ import dotenv
 
 from content.memory_bank.memory_bank_base import MemoryBankBase
 from content.memory_bank.memory import Memory, MemorySearchResult
+from utils.logger.tracer import Tracer
 
 # Load environment variables
 dotenv.load_dotenv(override=True)
@@ -26,6 +27,13 @@ class VectorMemoryBank(MemoryBankBase):
         self.embedding_dimension = embedding_dimension
         self.index = faiss.IndexFlatL2(embedding_dimension)
         self.embeddings: Dict[str, np.ndarray] = {}
+
+        # Near-duplicate detection on insert
+        # Modes: "merge" (fold into the existing memory), 
+        # "link" (add and link as a variant), "off"
+        self.duplicate_mode = os.getenv("MEMORY_DEDUP_MODE", "merge").lower()
+        self.duplicate_threshold = float(
+            os.getenv("MEMORY_DUPLICATE_THRESHOLD", 0.92))
         
     def _get_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for the given text using OpenAI's API."""
@@ -45,14 +53,86 @@ class VectorMemoryBank(MemoryBankBase):
         question_ids: List[str] = None
     ) -> Memory:
         """Add a new memory to the vector database."""
+        combined_text = f"{title}\n{text}"
+        embedding = self._get_embedding(combined_text)
+
+        return self._add_memory_with_embedding(
+            title=title,
+            text=text,
+            importance_score=importance_score,
+            source_interview_response=source_interview_response,
+            embedding=embedding,
+            metadata=metadata,
+            question_ids=question_ids
+        )
+
+    def add_or_merge_memory(
+        self,
+        title: str,
+        text: str,
+        importance_score: int,
+        source_interview_response: str,
+        metadata: Dict = None,
+        question_ids: List[str] = None
+    ) -> Tuple[Memory, bool]:
+        """Add a new memory, handling near-duplicates of existing memories.
+        
+        The nearest existing memory is checked before inserting. If its cosine
+        similarity reaches duplicate_threshold, the new memory is either 
+        merged into it (duplicate_mode "merge") or added and linked to it as 
+        a variant (duplicate_mode "link").
+        """
+        combined_text = f"{title}\n{text}"
+        embedding = self._get_embedding(combined_text)
+
+        duplicate = None
+        if self.duplicate_mode in ("merge", "link"):
+            duplicate = self._find_near_duplicate(embedding)
+
+        if duplicate and self.duplicate_mode == "merge":
+            self._merge_into(
+                duplicate,
+                importance_score=importance_score,
+                question_ids=question_ids or [],
+                metadata=metadata or {}
+            )
+            return duplicate, True
+
+        memory = self._add_memory_with_embedding(
+            title=title,
+            text=text,
+            importance_score=importance_score,
+            source_interview_response=source_interview_response,
+            embedding=embedding,
+            metadata=metadata,
+            question_ids=question_ids
+        )
+
+        if duplicate:
+            # Link mode: keep both and record the relationship
+            memory.metadata["variant_of"] = duplicate.id
+            duplicate.metadata.setdefault("variants", []).append(memory.id)
+            self._bump_version()
+
+        return memory, False
+
+    def _add_memory_with_embedding(
+        self,
+        title: str,
+        text: str,
+        importance_score: int,
+        source_interview_response: str,
+        embedding: np.ndarray,
+        metadata: Dict = None,
+        question_ids: List[str] = None
+    ) -> Memory:
+        """Add a new memory whose embedding is already computed."""
         if metadata is None:
             metadata = {}
         if question_ids is None:
             question_ids = []
             
         memory_id = self.generate_memory_id()
-        combined_text = f"{title}\n{text}"
-        embedding = self._get_embedding(combined_text)
         
         memory = Memory(
             id=memory_id,
@@ -68,19 +148,160 @@ class VectorMemoryBank(MemoryBankBase):
         self.memories.append(memory)
         self.embeddings[memory_id] = embedding
         self.index.add(embedding.reshape(1, -1))
+        self._bump_version()
 
         return memory
 
+    def _find_near_duplicate(self, embedding: np.ndarray) -> Optional[Memory]:
+        """Find the nearest memory if it is within duplicate_threshold."""
+        if not self.memories:
+            return None
+
+        distances, indices = self.index.search(embedding.reshape(1, -1), 1)
+        distance, idx = distances[0][0], indices[0][0]
+        if idx < 0 or idx >= len(self.memories):
+            return None
+
+        if self._distance_to_cosine(distance) >= self.duplicate_threshold:
+            return self.memories[idx]
+        return None
+
+    @staticmethod
+    def _distance_to_cosine(distance: float) -> float:
+        """Convert a squared L2 distance between unit-length 
+        OpenAI embeddings to cosine similarity."""
+        return float(1 - distance / 2)
+
+    def _merge_into(
+        self,
+        memory: Memory,
+        importance_score: int,
+        question_ids: List[str],
+        metadata: Dict
+    ) -> None:
+        """Fold a near-duplicate into an existing memory.
+        
+        Keeps the existing title and text, the union of question IDs,
+        the highest importance score and any new metadata keys.
+        """
+        memory.question_ids.extend(
+            [qid for qid in question_ids if qid not in memory.question_ids])
+        memory.importance_score = max(memory.importance_score,
+                                      importance_score or 0)
+        for key, value in metadata.items():
+            memory.metadata.setdefault(key, value)
+        self._bump_version()
+
+    def consolidate(self, threshold: Optional[float] = None) -> Dict[str, str]:
+        """Merge near-duplicate memories already in the bank.
+        
+        Memories are visited in insertion order and each one is merged 
+        into the earliest kept memory it is a near-duplicate of. Merged 
+        memories are removed and the FAISS index is rebuilt.
+        
+        Args:
+            threshold: Cosine similarity threshold 
+                (defaults to duplicate_threshold)
+            
+        Returns:
+            Dict[str, str]: Mapping from removed memory ID to kept memory ID
+        """
+        if threshold is None:
+            threshold = self.duplicate_threshold
+
+        kept: List[Memory] = []
+        kept_with_embedding: List[Memory] = []  # Aligned with kept_index
+        kept_index = faiss.IndexFlatL2(self.embedding_dimension)
+        merged_ids: Dict[str, str] = {}
+
+        for memory in self.memories:
+            embedding = self.embeddings.get(memory.id)
+            if embedding is None:
+                kept.append(memory)
+                continue
+
+            if kept_index.ntotal > 0:
+                distances, indices = kept_index.search(
+                    embedding.reshape(1, -1), 1)
+                if self._distance_to_cosine(distances[0][0]) >= threshold:
+                    target = kept_with_embedding[indices[0][0]]
+                    self._merge_into(
+                        target,
+                        importance_score=memory.importance_score,
+                        question_ids=memory.question_ids,
+                        metadata=memory.metadata
+                    )
+                    merged_ids[memory.id] = target.id
+                    continue
+
+            kept.append(memory)
+            kept_with_embedding.append(memory)
+            kept_index.add(embedding.reshape(1, -1))
+
+        # Rebuild memories, embeddings and the index in the same order
+        self.memories = kept
+        for memory_id in merged_ids:
+            self.embeddings.pop(memory_id, None)
+        self.index = faiss.IndexFlatL2(self.embedding_dimension)
+        for memory in self.memories:
+            embedding = self.embeddings.get(memory.id)
+            if embedding is not None:
+                self.index.add(embedding.reshape(1, -1))
+        self._bump_version()
+
+        return merged_ids
+
+    def upsert_memories(
+        self,
+        memories: List[Memory],
+        embeddings: Dict[str, np.ndarray]
+    ) -> None:
+        """Insert or replace memories whose embeddings are already computed.
+
+        Used to restore a session checkpoint. Memories with an existing ID
+        replace the stored one in place; the FAISS index is rebuilt.
+
+        Args:
+            memories: Memories to insert or replace
+            embeddings: Embeddings by memory ID, for memories that need one
+        """
+        positions = {memory.id: i for i, memory in enumerate(self.memories)}
+        for memory in memories:
+            if memory.id in positions:
+                self.memories[positions[memory.id]] = memory
+            else:
+                positions[memory.id] = len(self.memories)
+                self.memories.append(memory)
+        self.embeddings.update(embeddings)
+
+        self.index = faiss.IndexFlatL2(self.embedding_dimension)
+        for memory in self.memories:
+            embedding = self.embeddings.get(memory.id)
+            if embedding is not None:
+                self.index.add(embedding.reshape(1, -1))
+        self._bump_version()
+
+    @Tracer.traced("memory_bank.search")
     def search_memories(self, query: str, k: int = 5) -> List[MemorySearchResult]:
-        """Search for similar memories using the query text."""
+        """Search for similar memories using the query text.
+        
+        Repeated queries are served from the search cache until the
+        memory bank changes, skipping both the embedding call and the
+        FAISS search.
+        """
         if not self.memories:
             return []
+
+        # Adjust k to not exceed the number of available memories, before
+        # the cache lookup, so lookups and stores use the same key
+        k = min(k, len(self.memories))
+
+        cached_results = self._get_cached_search(query, k)
+        if cached_results is not None:
+            return cached_results
         
         query_embedding = self._get_embedding(query)
         
-        # Adjust k to not exceed the number of available memories
-        k = min(k, len(self.memories))
-        
         # Perform similarity search
         distances, indices = self.index.search(
             query_embedding.reshape(1, -1),
@@ -97,6 +318,7 @@ class VectorMemoryBank(MemoryBankBase):
                     similarity_score=similarity_score
                 ))
         
+        self._cache_search(query, k, results)
         return results
 
     def _save_implementation_specific(self, path: str) -> None:
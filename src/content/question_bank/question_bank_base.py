@@ -29,6 +29,15 @@ class QuestionBankBase(ABC):
         self.questions: List[Question] = []
         self.eval_engine = get_engine("gpt-4o")
         self.session_id: Optional[str] = None
+
+        # Cosine similarity thresholds for the duplicate evaluation fast path.
+        # Above the duplicate threshold a question is a duplicate, below the
+        # novel threshold it is novel; only the band in between needs the LLM.
+        # See content/question_bank/threshold_calibration.py for tuning.
+        self.duplicate_threshold = float(
+            os.getenv("QUESTION_DUPLICATE_THRESHOLD", 0.85))
+        self.novel_threshold = float(
+            os.getenv("QUESTION_NOVEL_THRESHOLD", 0.45))
     
     def set_session_id(self, session_id: str) -> None:
         """Set the current session ID for the question bank.
@@ -164,9 +173,28 @@ class QuestionBankBase(ABC):
         """Get all questions linked to a specific memory."""
         return [q for q in self.questions if memory_id in q.memory_ids]
     
+    def _get_cosine_similarity(self, result: QuestionSearchResult) -> float:
+        """Get the cosine similarity between a search result and its query.
+        
+        Implementations whose similarity score is not a cosine similarity
+        should override this to convert it.
+        
+        Args:
+            result: A result returned by search_questions
+            
+        Returns:
+            float: Cosine similarity between -1 and 1
+        """
+        return result.similarity_score
+
     def evaluate_question_duplicate(self, target_question: str, proposer: str = "interviewer") -> tuple:
         """Check if a question is semantically equivalent to existing questions.
         
+        Uses a tiered decision: the closest existing question's cosine 
+        similarity decides directly when it is above duplicate_threshold 
+        (duplicate) or below novel_threshold (novel). Only questions in 
+        the ambiguous band between the two are evaluated by the LLM.
+        
         Args:
             target_question: The question to evaluate
             proposer: The agent proposing the question
@@ -183,7 +211,74 @@ class QuestionBankBase(ABC):
 
         # Get similar questions
         similar_results = self.search_questions(target_question)
+        cosine_similarities = [
+            self._get_cosine_similarity(result) for result in similar_results
+        ]
+        top_similarity = max(cosine_similarities) if cosine_similarities \
+            else None
+
+        if top_similarity is None or top_similarity < self.novel_threshold:
+            # Fast path: nothing close enough to be a duplicate
+            decision_source = "embedding"
+            is_duplicate = False
+            matched_question = ""
+            explanation = (
+                "No existing questions to compare against." 
+                if top_similarity is None else
+                f"Closest existing question has cosine similarity "
+                f"{top_similarity:.3f}, below the novel threshold "
+                f"{self.novel_threshold:.3f}."
+            )
+        elif top_similarity >= self.duplicate_threshold:
+            # Fast path: near-identical question already exists
+            decision_source = "embedding"
+            is_duplicate = True
+            matched_question = \
+                similar_results[cosine_similarities.index(top_similarity)] \
+                    .content
+            explanation = (
+                f"Closest existing question has cosine similarity "
+                f"{top_similarity:.3f}, above the duplicate threshold "
+                f"{self.duplicate_threshold:.3f}."
+            )
+        else:
+            # Ambiguous band: let the LLM decide
+            decision_source = "llm"
+            is_duplicate, matched_question, explanation = \
+                self._evaluate_question_duplicate_with_llm(
+                    target_question, similar_results, logger)
+        
+        if logger:
+            logger.log_question_similarity(
+                target_question=target_question,
+                similar_questions=[r.content for r in similar_results],
+                similarity_scores=[r.similarity_score for r in similar_results],
+                is_duplicate=is_duplicate,
+                matched_question=matched_question,
+                explanation=explanation,
+                proposer=proposer,
+                top_cosine_similarity=top_similarity,
+                decision_source=decision_source
+            )
+        
+        return (is_duplicate, matched_question, explanation)
+
+    def _evaluate_question_duplicate_with_llm(
+        self,
+        target_question: str,
+        similar_results: List[QuestionSearchResult],
+        logger: Optional[EvaluationLogger] = None
+    ) -> tuple:
+        """Ask the LLM whether a question duplicates any similar question.
+        
+        Args:
+            target_question: The question to evaluate
+            similar_results: Similar questions found by search_questions
+            logger: Optional evaluation logger for the prompt and response
             
+        Returns:
+            tuple: (is_duplicate, matched_question, explanation)
+        """
         # Format similar questions for prompt
         similar_questions = "\n".join([
             f"<question>{result.content}</question>"
@@ -216,15 +311,4 @@ class QuestionBankBase(ABC):
         # Convert matched_question to empty string if "null"
         matched_question = "" if matched_question == "null" else matched_question
         
-        if logger:
-            logger.log_question_similarity(
-                target_question=target_question,
-                similar_questions=[r.content for r in similar_results],
-                similarity_scores=[r.similarity_score for r in similar_results],
-                is_duplicate=is_duplicate,
-                matched_question=matched_question,
-                explanation=explanation,
-                proposer=proposer
-            )
-        
-        return (is_duplicate, matched_question, explanation)
\ No newline at end of file
+        return (is_duplicate, matched_question, explanation)
@@ -9,6 +9,7 @@ import dotenv
 
 from content.question_bank.question_bank_base import QuestionBankBase
 from content.question_bank.question import Question, QuestionSearchResult
+from utils.logger.tracer import Tracer
 
 # Load environment variables
 dotenv.load_dotenv(override=True)
@@ -56,6 +57,37 @@ class QuestionBankVectorDB(QuestionBankBase):
 
         return question
 
+    def upsert_questions(
+        self,
+        questions: List[Question],
+        embeddings: Dict[str, np.ndarray]
+    ) -> None:
+        """Insert or replace questions whose embeddings are already computed.
+
+        Used to restore a session checkpoint. Questions with an existing ID
+        replace the stored one in place; the FAISS index is rebuilt.
+
+        Args:
+            questions: Questions to insert or replace
+            embeddings: Embeddings by question ID, for questions that need one
+        """
+        positions = {question.id: i
+                     for i, question in enumerate(self.questions)}
+        for question in questions:
+            if question.id in positions:
+                self.questions[positions[question.id]] = question
+            else:
+                positions[question.id] = len(self.questions)
+                self.questions.append(question)
+        self.embeddings.update(embeddings)
+
+        self.index = faiss.IndexFlatL2(self.embedding_dimension)
+        for question in self.questions:
+            embedding = self.embeddings.get(question.id)
+            if embedding is not None:
+                self.index.add(embedding.reshape(1, -1))
+
+    @Tracer.traced("question_bank.search")
     def search_questions(self, query: str, k: int = 5) -> List[QuestionSearchResult]:
         """Search for similar questions using the query text."""
         if not self.questions:
@@ -84,6 +116,16 @@ class QuestionBankVectorDB(QuestionBankBase):
         
         return results
 
+    def _get_cosine_similarity(self, result: QuestionSearchResult) -> float:
+        """Convert a search score back to cosine similarity.
+        
+        The FAISS index returns squared L2 distances, which search_questions
+        maps to 1 / (1 + distance). OpenAI embeddings are unit length, so
+        cosine similarity is 1 - distance / 2.
+        """
+        distance = 1 / result.similarity_score - 1
+        return 1 - distance / 2
+
     def _save_implementation_specific(self, path: str) -> None:
         """Save embeddings to file.
         
@@ -0,0 +1,197 @@
+import os
+import csv
+import sys
+import argparse
+from typing import Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+
+# Add src directory to Python path
+src_dir = str(Path(__file__).parent.parent.parent)
+if src_dir not in sys.path:
+    sys.path.append(src_dir)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from utils.logger.evaluation_store import EvaluationStore
+
+# Columns of question_similarity.csv files written before evaluation
+# records moved to EvaluationStore
+QUESTION_SIMILARITY_COLUMNS = [
+    'Timestamp',
+    'Proposer',
+    'Session ID',
+    'Target Question',
+    'Similar Questions',
+    'Similarity Scores',
+    'Is Duplicate',
+    'Matched Question',
+    'Explanation',
+    'Top Cosine Similarity',
+    'Decision Source'
+]
+
+
+def _parse_llm_decisions(rows: Iterable[Dict]) -> List[Tuple[float, bool]]:
+    """Extract (top cosine similarity, is duplicate) pairs decided by the LLM.
+
+    Rows decided by the embedding fast path are skipped, since they would
+    only confirm the thresholds that produced them. Rows logged before the
+    cosine similarity column existed are skipped as well.
+    """
+    decisions = []
+    for row in rows:
+        if row.get('Decision Source') != 'llm' or \
+                not row.get('Top Cosine Similarity'):
+            continue
+        decisions.append((
+            float(row['Top Cosine Similarity']),
+            str(row['Is Duplicate']).strip().lower() == 'true'
+        ))
+    return decisions
+
+
+def load_llm_decisions(
+    eval_dirs: List[str],
+    csv_paths: Optional[List[str]] = None
+) -> List[Tuple[float, bool]]:
+    """Load the question duplicate decisions made by the LLM.
+
+    Args:
+        eval_dirs: Evaluations directories holding EvaluationStore files
+        csv_paths: Optional legacy question_similarity.csv files
+
+    Returns:
+        List of (cosine similarity, is duplicate) tuples
+    """
+    decisions = []
+    for eval_dir in eval_dirs:
+        decisions.extend(_parse_llm_decisions(
+            EvaluationStore.load_records(eval_dir, "question_similarity")))
+
+    for csv_path in csv_paths or []:
+        with open(csv_path, 'r', newline='') as f:
+            reader = csv.DictReader(f, fieldnames=QUESTION_SIMILARITY_COLUMNS)
+            next(reader, None)  # Skip header row
+            decisions.extend(_parse_llm_decisions(reader))
+    return decisions
+
+
+def calibrate_thresholds(
+    decisions: List[Tuple[float, bool]],
+    target_precision: float = 0.95
+) -> Dict[str, Optional[float]]:
+    """Find the widest fast-path bands that agree with the LLM.
+
+    The duplicate threshold is the lowest similarity such that at least
+    target_precision of the LLM decisions above it are duplicates. The
+    novel threshold is the highest similarity such that at least
+    target_precision of the LLM decisions below it are not duplicates.
+
+    Args:
+        decisions: (cosine similarity, is duplicate) pairs
+        target_precision: Required agreement with the LLM in each band
+
+    Returns:
+        Dict with duplicate_threshold, novel_threshold and the fraction
+        of the logged decisions each fast path would have covered.
+        Thresholds are None if no band reaches the target precision.
+    """
+    if not decisions:
+        return {
+            "duplicate_threshold": None,
+            "novel_threshold": None,
+            "duplicate_coverage": 0.0,
+            "novel_coverage": 0.0
+        }
+
+    decisions = sorted(decisions, key=lambda d: d[0])
+    total = len(decisions)
+
+    # Duplicate band: lowest score whose band above still holds precision
+    duplicate_threshold = None
+    duplicate_count = 0
+    duplicate_coverage = 0.0
+    for i in range(total - 1, -1, -1):
+        duplicate_count += decisions[i][1]
+        if duplicate_count / (total - i) >= target_precision:
+            duplicate_threshold = decisions[i][0]
+            duplicate_coverage = (total - i) / total
+
+    # Novel band: highest score whose band below still holds precision
+    novel_threshold = None
+    novel_count = 0
+    novel_coverage = 0.0
+    for i in range(total):
+        novel_count += not decisions[i][1]
+        if novel_count / (i + 1) >= target_precision and \
+                (duplicate_threshold is None or
+                 decisions[i][0] < duplicate_threshold):
+            # Novel threshold is exclusive, so sit just above this score
+            novel_threshold = decisions[i][0] + 1e-4
+            novel_coverage = (i + 1) / total
+
+    return {
+        "duplicate_threshold": duplicate_threshold,
+        "novel_threshold": novel_threshold,
+        "duplicate_coverage": duplicate_coverage,
+        "novel_coverage": novel_coverage
+    }
+
+
+def main():
+    """
+    Suggest question duplicate thresholds from logged evaluations.
+
+    Example usage:
+    python src/content/question_bank/threshold_calibration.py --user_id coates
+    python src/content/question_bank/threshold_calibration.py --precision 0.98
+    """
+    parser = argparse.ArgumentParser(
+        description='Calibrate question duplicate thresholds')
+    parser.add_argument('--user_id', type=str, help='Specific user ID to use. '
+                        'If not provided, uses logs of all users.')
+    parser.add_argument('--precision', type=float, default=0.95,
+                        help='Required agreement with the LLM decisions')
+    args = parser.parse_args()
+
+    logs_dir = os.getenv("LOGS_DIR", "logs")
+    user_ids = [args.user_id] if args.user_id else [
+        d for d in os.listdir(logs_dir)
+        if os.path.isdir(os.path.join(logs_dir, d))
+    ]
+    eval_dirs = [
+        path for path in (
+            os.path.join(logs_dir, user_id, "evaluations")
+            for user_id in user_ids
+        ) if os.path.isdir(path)
+    ]
+    csv_paths = [
+        path for path in (
+            os.path.join(eval_dir, "question_similarity.csv")
+            for eval_dir in eval_dirs
+        ) if os.path.exists(path)
+    ]
+
+    decisions = load_llm_decisions(eval_dirs, csv_paths)
+    print(f"Loaded {len(decisions)} LLM decisions "
+          f"from {len(eval_dirs)} users")
+
+    result = calibrate_thresholds(decisions, target_precision=args.precision)
+    if result["duplicate_threshold"] is not None:
+        print(f"QUESTION_DUPLICATE_THRESHOLD="
+              f"{result['duplicate_threshold']:.4f} "
+              f"(covers {result['duplicate_coverage']:.0%})")
+    else:
+        print("No duplicate threshold reaches the target precision")
+    if result["novel_threshold"] is not None:
+        print(f"QUESTION_NOVEL_THRESHOLD="
+              f"{result['novel_threshold']:.4f} "
+              f"(covers {result['novel_coverage']:.0%})")
+    else:
+        print("No novel threshold reaches the target precision")
+
+
+if __name__ == "__main__":
+    main()
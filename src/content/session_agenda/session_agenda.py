@@ -44,11 +44,17 @@ class SessionAgenda:
         """Loads a SessionAgenda from a JSON file."""
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            
-        # Extract the core fields from the file
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Creates a SessionAgenda from the output of to_dict."""
+        data = dict(data)
+
+        # Extract the core fields from the data
         user_id = data.pop('user_id', '')
         session_id = data.pop('session_id', '')
-        
+
         # Create new SessionAgenda instance
         return cls(user_id, session_id, data)
     
@@ -309,25 +315,32 @@ class SessionAgenda:
             os.makedirs(session_dir)
             
         file_path = os.path.join(session_dir, file_name)
-        
-        # Prepare data for serialization
+
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(save_session_id), f, indent=2)
+
+        return file_path
+
+    def to_dict(self, session_id: int = None) -> dict:
+        """Serializes the SessionAgenda in the format load_from_file reads.
+
+        Args:
+            session_id: Session ID to record (defaults to this agenda's)
+        """
         data = {
             "user_id": self.user_id,
-            "session_id": save_session_id,
+            "session_id": self.session_id if session_id is None else session_id,
             "user_portrait": self.user_portrait,
             "last_meeting_summary": self.last_meeting_summary,
             "additional_notes": self.additional_notes,
             "topics": {}
         }
-        
+
         # Serialize topics and their questions
         for topic, questions in self.topics.items():
             data["topics"][topic] = [q.serialize() for q in questions]
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        
-        return file_path
+
+        return data
 
     def get_user_portrait_str(self) -> str:
         """Returns formatted string of user portrait information."""
@@ -0,0 +1,148 @@
+import os
+from collections import deque
+from typing import Deque, Dict, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _median(samples: Deque[float]) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[(len(ordered) - 1) // 2]
+
+
+class IdleWindowPredictor:
+    """Predicts whether the user stays idle long enough for an LLM call.
+
+    Learns from the user's think times, the seconds between an
+    interviewer message and the user's reply, and from how long
+    background LLM calls take. Given how long the user has already been
+    idle, a call fits if, among past think times at least that long,
+    enough lasted until the call would have finished.
+    """
+
+    def __init__(self):
+        max_samples = int(os.getenv("IDLE_WINDOW_SAMPLES", 50))
+        self.min_samples = int(os.getenv("IDLE_WINDOW_MIN_SAMPLES", 3))
+        # Share of comparable think times the call must fit in
+        self.confidence = float(os.getenv("IDLE_WINDOW_CONFIDENCE", 0.5))
+        self._think_times: Deque[float] = deque(maxlen=max_samples)
+        self._call_times: Deque[float] = deque(maxlen=max_samples)
+
+    def record_think_time(self, seconds: float) -> None:
+        self._think_times.append(seconds)
+
+    def record_call_time(self, seconds: float) -> None:
+        self._call_times.append(seconds)
+
+    @property
+    def think_seconds(self) -> Optional[float]:
+        """Median think time, or None before any reply."""
+        return _median(self._think_times)
+
+    @property
+    def call_seconds(self) -> Optional[float]:
+        """Median background LLM call time, or None before any call."""
+        return _median(self._call_times)
+
+    def fits(self, idle_seconds: float) -> bool:
+        """Whether a background LLM call started now is likely to finish
+        before the user replies.
+
+        Args:
+            idle_seconds: How long the user has been idle so far
+        """
+        call_seconds = self.call_seconds
+        if call_seconds is None or len(self._think_times) < self.min_samples:
+            # Nothing to predict from yet
+            return True
+
+        longer = [seconds for seconds in self._think_times
+                  if seconds > idle_seconds]
+        if not longer:
+            # Idle longer than ever before; the user is likely away
+            return True
+        lasting = sum(1 for seconds in longer
+                      if seconds >= idle_seconds + call_seconds)
+        return lasting / len(longer) >= self.confidence
+
+    def seconds_until_fit(self, idle_seconds: float) -> float:
+        """Seconds until a call started then is likely to fit, if the user
+        stays idle.
+
+        Whether a call fits only changes where the idle time passes a
+        think time, or comes within a call time of one, so only those
+        points are checked.
+
+        Args:
+            idle_seconds: How long the user has been idle so far
+        """
+        if self.fits(idle_seconds):
+            return 0.0
+        call_seconds = self.call_seconds
+        # Just past each point, where the comparisons have changed
+        points = sorted(
+            point + 0.01
+            for seconds in self._think_times
+            for point in (seconds, seconds - call_seconds)
+            if point >= idle_seconds)
+        for point in points:
+            if self.fits(point):
+                return point - idle_seconds
+        # Past the longest think time a call always fits, so not reached
+        return 0.0
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            "think_samples": len(self._think_times),
+            "think_p50": self.think_seconds,
+            "call_p50": self.call_seconds
+        }
+
+
+class AutoUpdatePolicy:
+    """Sizes biography auto-updates to the user's idle windows.
+
+    The threshold is the number of memories an update can write within a
+    typical think time, at the observed seconds per memory, kept between
+    half and four times the configured threshold. An update takes the
+    oldest threshold memories, or the whole backlog once it has grown to
+    twice the threshold, so a backlog that outpaces the idle windows is
+    cleared in one larger update instead of growing.
+    """
+
+    def __init__(self, base_threshold: int):
+        self.base_threshold = base_threshold
+        self.min_threshold = max(1, base_threshold // 2)
+        self.max_threshold = base_threshold * 4
+        self.threshold = base_threshold
+        self._seconds_per_memory: Optional[float] = None
+
+    def record_update(self, num_memories: int, seconds: float) -> None:
+        """Record how long an auto-update of num_memories took."""
+        if num_memories <= 0:
+            return
+        rate = seconds / num_memories
+        # Smooth over updates; a single slow update should not swing it
+        self._seconds_per_memory = rate if self._seconds_per_memory is None \
+            else 0.5 * self._seconds_per_memory + 0.5 * rate
+
+    def adapt(self, think_seconds: Optional[float]) -> int:
+        """Update the threshold to the current think time.
+
+        Returns:
+            int: The new threshold
+        """
+        if think_seconds is not None and self._seconds_per_memory:
+            fits = int(think_seconds / self._seconds_per_memory)
+            self.threshold = max(self.min_threshold,
+                                 min(self.max_threshold, fits))
+        return self.threshold
+
+    def batch_size(self, backlog: int) -> int:
+        """Number of memories to write in the next update."""
+        if backlog >= 2 * self.threshold:
+            return backlog
+        return min(backlog, self.threshold)
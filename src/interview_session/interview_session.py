@@ -2,7 +2,7 @@ import asyncio
 import os
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, Optional, TypedDict, Union
 import signal
 import contextlib
 from dotenv import load_dotenv
@@ -11,20 +11,32 @@ from tiktoken import get_encoding
 
 from agents.base_agent import BaseAgent
 from interview_session.session_models import Message, MessageType, Participant
+from interview_session.session_checkpoint import SessionCheckpoint
+from interview_session.post_session import (
+    enqueue_final_update, get_post_session_queue
+)
+from interview_session.task_scheduler import TaskScheduler, background_llm_call
+from interview_session.idle_window import AutoUpdatePolicy
 from agents.interviewer.interviewer import Interviewer, InterviewerConfig, TTSConfig
 from agents.session_scribe.session_scribe import SessionScribe, SessionScribeConfig
 from agents.user.user_agent import UserAgent
 from content.session_agenda.session_agenda import SessionAgenda
 from utils.data_process import save_feedback_to_csv
+from utils.deferred import Deferred
 from utils.logger.session_logger import SessionLogger, setup_logger
 from utils.logger.evaluation_logger import EvaluationLogger
+from utils.logger.tracer import Tracer
 from interview_session.user.user import User
 from agents.biography_team.orchestrator import BiographyOrchestrator
-from agents.biography_team.base_biography_agent import BiographyConfig
+from agents.biography_team.base_biography_agent import (
+    BiographyConfig, BiographyTeamAgent
+)
 from content.memory_bank.memory_bank_vector_db import VectorMemoryBank
 from content.memory_bank.memory import Memory
 from content.question_bank.question_bank_vector_db import QuestionBankVectorDB
-from interview_session.prompts.conversation_summerize import summarize_conversation
+from interview_session.prompts.conversation_summerize import (
+    summarize_conversation, update_conversation_summary
+)
 
 
 load_dotenv(override=True)
@@ -53,7 +65,9 @@ class InterviewSession:
 
     def __init__(self, interaction_mode: str = 'terminal', user_config: UserConfig = {},
                  interview_config: InterviewConfig = {}, bank_config: BankConfig = {},
-                 use_baseline: Optional[bool] = None, max_turns: Optional[int] = None):
+                 use_baseline: Optional[bool] = None, max_turns: Optional[int] = None,
+                 resume: Optional[bool] = None,
+                 checkpoint: Optional[SessionCheckpoint] = None):
         """Initialize the interview session.
 
         Args:
@@ -72,7 +86,13 @@ class InterviewSession:
             use_baseline: Whether to use baseline prompt (default: read from .env)
             max_turns: Optional maximum number of turns before ending session
                       If None, session continues until manually ended
+            resume: Whether to resume the user's last session if it stopped
+                    before completing (default: read from .env)
+            checkpoint: Checkpoint of the session to resume, such as one
+                        handed off to a post-session worker (default: the
+                        user's interrupted session, if resuming)
         """
+        init_start = time.perf_counter()
 
         # Set the baseline mode for all agents
         if use_baseline is not None:
@@ -85,9 +105,27 @@ class InterviewSession:
         # User setup
         self.user_id = user_config.get("user_id", "default_user")
 
+        # Resume the last session from its checkpoint if it was interrupted
+        if checkpoint is None:
+            if resume is None:
+                resume = \
+                    os.getenv("RESUME_SESSIONS", "true").lower() == "true"
+            checkpoint = SessionCheckpoint.find_resumable(self.user_id) \
+                if resume else None
+
         # Session agenda setup
-        self.session_agenda = SessionAgenda.get_last_session_agenda(self.user_id)
-        self.session_id = self.session_agenda.session_id + 1
+        if checkpoint:
+            self.session_agenda = checkpoint.load_session_agenda()
+            self.session_id = checkpoint.session_id
+        else:
+            self.session_agenda = \
+                SessionAgenda.get_last_session_agenda(self.user_id)
+            self.session_id = self.session_agenda.session_id + 1
+            checkpoint = SessionCheckpoint(self.user_id, self.session_id)
+        self.checkpoint = checkpoint
+        self.resumed = checkpoint.resumed
+        self.checkpoint_interval = float(
+            os.getenv("CHECKPOINT_INTERVAL_SECONDS", 30))
 
         # Memory bank setup
         memory_bank_type = bank_config.get("memory_bank_type", "vector_db")
@@ -101,11 +139,12 @@ class InterviewSession:
         historical_question_bank_type = \
             bank_config.get("historical_question_bank_type", "vector_db")
         if historical_question_bank_type == "vector_db":
-            self.historical_question_bank = \
-                QuestionBankVectorDB.load_from_file(
-                    self.user_id)
-            self.historical_question_bank.set_session_id(self.session_id)
-            self.proposed_question_bank = QuestionBankVectorDB()
+            # Only background agents use the question banks, so they are
+            # loaded after the interviewer's first question
+            self._historical_question_bank = Deferred(
+                self._load_historical_question_bank)
+            self._proposed_question_bank = Deferred(
+                self._create_proposed_question_bank)
         else:
             raise ValueError(
                 f"Unknown question bank type: {historical_question_bank_type}")
@@ -114,33 +153,48 @@ class InterviewSession:
         setup_logger(self.user_id, self.session_id,
                      console_output_files=["execution_log"])
         EvaluationLogger.setup_logger(self.user_id, self.session_id)
+        Tracer.setup_tracer(SessionLogger.get_log_dir())
+
+        # Chat history and memory bank changes of a resumed session
+        self.chat_history: list[Message] = \
+            self.checkpoint.load_chat_history()
+        self.checkpoint.attach_bank("memory_bank", self.memory_bank)
 
-        # Chat history
-        self.chat_history: list[Message] = []
+        # Scheduler for message delivery and background agent work
+        self.scheduler = TaskScheduler()
+
+        # Queue to hand the final update off to post-session workers,
+        # if enabled
+        self.post_session_queue = get_post_session_queue()
 
         # Session states signals
         self.interaction_mode = interaction_mode
+        self._session_ended = asyncio.Event()  # Set once the session ends
         self.session_in_progress = True
         self.session_completed = False
         self._session_timeout = False
         self.max_turns = max_turns
 
-        # Biography auto-update states
+        # Biography auto-update states; the threshold adapts to the user's
+        # idle windows, starting from the configured one
         self.auto_biography_update_in_progress = False
         self.memory_threshold = int(
             os.getenv("MEMORY_THRESHOLD_FOR_UPDATE", 10))
+        self.auto_update_policy = AutoUpdatePolicy(self.memory_threshold)
         
-        # Conversation summary for auto-updates
+        # Conversation summary for auto-updates, kept up to date after
+        # every turn, and how many chat messages it covers
         self.conversation_summary = ""
+        self._summarized_messages = 0
         
-        # Counter for user messages to trigger auto-updates check
+        # Counter for user messages
         self._user_message_count = 0
-        self._check_interval = max(1, self.memory_threshold // 5)
         self._accumulated_auto_update_time = 0
 
         # Last message timestamp tracking for session timeout
         self._last_message_time = datetime.now()
         self._last_user_message = None
+        self._last_interviewer_message_time: Optional[datetime] = None
         self.timeout_minutes = int(os.getenv("SESSION_TIMEOUT_MINUTES", 10))
 
         # User in the interview session
@@ -166,27 +220,28 @@ class InterviewSession:
             ),
             interview_session=self
         )
-        self.session_scribe: SessionScribe = SessionScribe(
-            config=SessionScribeConfig(
-                user_id=self.user_id
-            ),
-            interview_session=self
-        )
-        self.biography_orchestrator = BiographyOrchestrator(
-            config=BiographyConfig(
-                user_id=self.user_id,
-                biography_style=user_config.get(
-                    "biography_style", "chronological")
-            ),
-            interview_session=self
-        )
+        # The session scribe and biography team are not needed for the
+        # first question; they are built in the background once it is asked
+        self._session_scribe: Deferred[SessionScribe] = Deferred(
+            self._create_session_scribe)
+        self.biography_style = \
+            user_config.get("biography_style", "chronological")
+        self._biography_orchestrator: Deferred[BiographyOrchestrator] = \
+            Deferred(lambda: BiographyOrchestrator(
+                config=BiographyConfig(
+                    user_id=self.user_id,
+                    biography_style=self.biography_style
+                ),
+                interview_session=self
+            ))
 
         # Subscriptions of participants to each other
-        self._subscriptions: Dict[str, List[Participant]] = {
+        self._subscriptions: Dict[
+            str, List[Union[Participant, Deferred[Participant]]]] = {
             # Subscribers of Interviewer: Note-taker and User (in following code)
-            "Interviewer": [self.session_scribe],
+            "Interviewer": [self._session_scribe],
             # Subscribers of User: Interviewer and Note-taker
-            "User": [self._interviewer, self.session_scribe]
+            "User": [self._interviewer, self._session_scribe]
         }
 
         # User participant for terminal interaction
@@ -213,7 +268,111 @@ class InterviewSession:
         SessionLogger.log_to_file(
             "execution_log", f"[INIT] Use baseline: {BaseAgent.use_baseline}")
         
-        self.tokenizer = get_encoding("cl100k_base")
+        self._tokenizer = Deferred(lambda: get_encoding("cl100k_base"))
+
+        self.checkpoint.attach_agent(self._interviewer)
+        if self.resumed:
+            self._restore_checkpoint_state(self.checkpoint.state["session"])
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[INIT] Resumed from checkpoint with "
+                f"{len(self.chat_history)} messages")
+
+        self.init_seconds = time.perf_counter() - init_start
+        SessionLogger.log_to_file(
+            "execution_log",
+            f"[INIT] Session initialized in {self.init_seconds:.3f}s")
+
+    def _load_historical_question_bank(self) -> QuestionBankVectorDB:
+        question_bank = QuestionBankVectorDB.load_from_file(self.user_id)
+        question_bank.set_session_id(self.session_id)
+        self.checkpoint.attach_bank("historical_question_bank", question_bank)
+        return question_bank
+
+    def _create_proposed_question_bank(self) -> QuestionBankVectorDB:
+        question_bank = QuestionBankVectorDB()
+        self.checkpoint.attach_bank("proposed_question_bank", question_bank)
+        return question_bank
+
+    def _create_session_scribe(self) -> SessionScribe:
+        session_scribe = SessionScribe(
+            config=SessionScribeConfig(
+                user_id=self.user_id
+            ),
+            interview_session=self
+        )
+        self.checkpoint.attach_agent(session_scribe)
+        scribe_state = self.checkpoint.state.get("scribe")
+        if scribe_state:
+            session_scribe.restore_checkpoint_state(
+                scribe_state,
+                memories={memory.id: memory
+                          for memory in self.memory_bank.memories},
+                messages={message.id: message
+                          for message in self.chat_history}
+            )
+        return session_scribe
+
+    @property
+    def historical_question_bank(self) -> QuestionBankVectorDB:
+        return self._historical_question_bank.get()
+
+    @property
+    def proposed_question_bank(self) -> QuestionBankVectorDB:
+        return self._proposed_question_bank.get()
+
+    @property
+    def session_scribe(self) -> SessionScribe:
+        return self._session_scribe.get()
+
+    @property
+    def biography_orchestrator(self) -> BiographyOrchestrator:
+        return self._biography_orchestrator.get()
+
+    async def get_biography_orchestrator(self) -> BiographyOrchestrator:
+        """Get the biography orchestrator, building it in a worker thread"""
+        return await self._biography_orchestrator.aget()
+
+    @property
+    def tokenizer(self):
+        return self._tokenizer.get()
+
+    async def get_tokenizer(self):
+        """Get the tokenizer, loading it in a worker thread"""
+        return await self._tokenizer.aget()
+
+    async def _warm_up(self):
+        """Build the components deferred at startup in worker threads"""
+        with Tracer.span("warm_up"):
+            await self._session_scribe.warm()
+            if self.resumed:
+                await self.session_scribe.resume_processing()
+            await self._biography_orchestrator.warm()
+            await self._tokenizer.warm()
+
+    @property
+    def session_in_progress(self) -> bool:
+        return not self._session_ended.is_set()
+
+    @session_in_progress.setter
+    def session_in_progress(self, value: bool) -> None:
+        if value:
+            self._session_ended.clear()
+        else:
+            self._session_ended.set()
+
+    async def _deliver_message(
+        self,
+        sub: Union[Participant, Deferred[Participant]],
+        message: Message
+    ):
+        """Deliver a message to one subscriber inside a tracing span"""
+        if isinstance(sub, Deferred):
+            # Wait for the subscriber to be built without blocking the loop
+            sub = await sub.aget()
+        with Tracer.span("on_message", participant=sub.title,
+                         role=message.role):
+            await sub.on_message(message)
 
     async def _notify_participants(self, message: Message):
         """Notify subscribers asynchronously"""
@@ -227,12 +386,16 @@ class InterviewSession:
             )
         )
 
-        # Create independent tasks for each subscriber
-        tasks = []
-        for sub in subscribers:
-            if self.session_in_progress:
-                task = asyncio.create_task(sub.on_message(message))
-                tasks.append(task)
+        # Schedule an independent job for each subscriber; the interviewer's
+        # response is turn-critical and holds back background work
+        with Tracer.span("notify_participants", role=message.role,
+                         subscribers=len(subscribers)):
+            for sub in subscribers:
+                if self.session_in_progress:
+                    self.scheduler.submit(
+                        "turn" if sub is self._interviewer else "notify",
+                        self._deliver_message, sub, message,
+                        name="deliver_message")
         
         # Allow tasks to run concurrently without waiting for each other
         await asyncio.sleep(0)  # Explicitly yield control
@@ -242,10 +405,15 @@ class InterviewSession:
             self._last_user_message = message
             self._user_message_count += 1
 
-            # Check if we need to trigger a biography update
-            if (self._user_message_count % self._check_interval == 0 and 
-                not self.auto_biography_update_in_progress):
-                asyncio.create_task(self._check_and_trigger_biography_update())
+            # Fold the finished turn into the conversation summary
+            self._schedule_summary_update()
+
+            # Check if we need to trigger a biography update; the check
+            # is cheap, so it runs after every turn
+            if not self.auto_biography_update_in_progress and \
+                    not self.scheduler.depth("biography"):
+                self.scheduler.submit(
+                    "biography", self._check_and_trigger_biography_update)
             
             # Check if max turns reached
             if self.max_turns is not None and \
@@ -282,8 +450,16 @@ class InterviewSession:
 
         if role == "User":
             self._last_message_time = message.timestamp
-        elif role == "Interviewer" and self._last_user_message is not None:
-            self._last_user_message = None
+            # Learn how long the user takes to reply
+            if self._last_interviewer_message_time is not None:
+                self.scheduler.idle_window.record_think_time(
+                    (message.timestamp - self._last_interviewer_message_time)
+                    .total_seconds())
+                self._last_interviewer_message_time = None
+        elif role == "Interviewer":
+            self._last_interviewer_message_time = message.timestamp
+            if self._last_user_message is not None:
+                self._last_user_message = None
         
         # Log feedback
         if message_type != MessageType.CONVERSATION:
@@ -300,7 +476,7 @@ class InterviewSession:
                 "chat_history", f"{message.role}: {message.content}")
             
             # Notify participants
-            asyncio.create_task(self._notify_participants(message))
+            self.scheduler.submit("notify", self._notify_participants, message)
 
 
         SessionLogger.log_to_file(
@@ -317,30 +493,36 @@ class InterviewSession:
             "execution_log", f"[RUN] Starting interview session")
         self.session_in_progress = True
 
+        # Build the deferred components once the first question is out
+        self.scheduler.submit("startup", self._warm_up)
+
+        if self.checkpoint_interval > 0:
+            self.scheduler.submit("checkpoint", self._checkpoint_periodically)
+
         # In-interview Processing
         try:
-            # Interviewer initiate the conversation (if not in API mode)
-            if self.user is not None:
-                await self._interviewer.on_message(None)
-
-            # Monitor the session for completion and timeout
-            while self.session_in_progress or \
-                self.session_scribe.processing_in_progress:
-                await asyncio.sleep(0.1)
-
-                # Check for timeout
-                if datetime.now() - self._last_message_time \
-                        > timedelta(minutes=self.timeout_minutes):
-                    SessionLogger.log_to_file(
-                        "execution_log", 
-                        (
-                            f"[TIMEOUT] Session timed out after "
-                            f"{self.timeout_minutes} minutes of inactivity"
-                        )
-                    )
-                    self.session_in_progress = False
-                    self._session_timeout = True
-                    break
+            if self.resumed and self.chat_history:
+                # Pick the conversation up where it stopped
+                self._resume_conversation()
+            # Interviewer initiate the conversation
+            elif self.user is not None or self.api_participant is not None:
+                start_time = time.perf_counter()
+                await self.scheduler.submit(
+                    "turn", self._interviewer.on_message, None,
+                    name="open_conversation")
+                EvaluationLogger.get_current_logger().log_startup_latency(
+                    init_seconds=self.init_seconds,
+                    first_question_seconds=time.perf_counter() - start_time,
+                    llm_seconds=self._interviewer.opening_llm_seconds
+                )
+
+            # Wait for the session to end or time out
+            await self._wait_for_session_end()
+
+            # Let the session scribe finish processing the last messages
+            if not self._session_timeout and self._session_scribe.ready:
+                await self.session_scribe.wait_for_processing(
+                    timeout=self._get_timeout_remaining())
 
         except Exception as e:
             SessionLogger.log_to_file(
@@ -349,54 +531,268 @@ class InterviewSession:
 
         # Post-interview Processing
         finally:
+            handed_off = False
             try:
                 self.session_in_progress = False
 
+                # Drop deliveries to the conversation that has ended
+                await self.scheduler.end_conversation()
+
                 # Update biography (API mode handles this separately)
-                if self.interaction_mode != 'api' or self._session_timeout:
-                    with contextlib.suppress(KeyboardInterrupt):
-                        SessionLogger.log_to_file(
-                            "execution_log", 
-                            (
-                                f"[BIOGRAPHY] Trigger final biography update. "
-                                f"Waiting for session scribe to finish processing..."
+                run_final_update = \
+                    self.interaction_mode != 'api' or self._session_timeout
+
+                # Leave the final update to a post-session worker if enabled;
+                # in API mode its topics are selected after the session ends
+                if self.post_session_queue is not None:
+                    handed_off = await self._hand_off_post_session(
+                        selected_topics=[] if run_final_update else None)
+
+                if not handed_off:
+                    # Keep the whole conversation if the final update fails
+                    if self.checkpoint_interval > 0:
+                        await self.save_checkpoint()
+
+                    # In API mode, a session meant for the post-session
+                    # queue did not start its final update at end_session
+                    if run_final_update or self.post_session_queue is not None:
+                        with contextlib.suppress(KeyboardInterrupt):
+                            SessionLogger.log_to_file(
+                                "execution_log", 
+                                (
+                                    f"[BIOGRAPHY] Trigger final biography update. "
+                                    f"Waiting for session scribe to finish processing..."
+                                )
                             )
-                        )
-                        await self.final_update_biography_and_agenda(
-                            selected_topics=[])
+                            await self.final_update_biography_and_agenda(
+                                selected_topics=[])
 
-                # Wait for biography update to complete if it's in progress
-                start_time = time.time()
-                while (self.biography_orchestrator.biography_update_in_progress or 
-                       self.biography_orchestrator.session_agenda_update_in_progress):
-                    await asyncio.sleep(0.1)
-                    if time.time() - start_time > 300:  # 5 minutes timeout
+                    # Wait for biography update to complete if it's in progress
+                    if not await self.biography_orchestrator.wait_for_updates(
+                            timeout=300):  # 5 minutes timeout
                         SessionLogger.log_to_file(
                             "execution_log", 
                             (
                                 f"[BIOGRAPHY] Timeout waiting for biography update"
                             )
                         )
-                        break
 
             except Exception as e:
                 SessionLogger.log_to_file(
                     "execution_log", f"[RUN] Error during biography update: \
                           {str(e)}")
             finally:
-                # Save memory bank
-                self.memory_bank.save_to_file(self.user_id)
-                SessionLogger.log_to_file(
-                    "execution_log", f"[COMPLETED] Memory bank saved")
-                
-                # Save historical question bank
-                self.historical_question_bank.save_to_file(self.user_id)
-                SessionLogger.log_to_file(
-                    "execution_log", f"[COMPLETED] Question bank saved")
-                       
-                self.session_completed = True
+                # A post-session worker saves a handed off session
+                if not handed_off:
+                    await self._save_session()
+                await self._close_session()
+
+    async def run_post_session(
+            self, selected_topics: Optional[List[str]] = None):
+        """Run the final update of a session handed off to the queue.
+
+        Runs in a post-session worker, on the session resumed from its
+        ended checkpoint. Errors are raised rather than logged, so the job
+        is retried from the same checkpoint.
+
+        Args:
+            selected_topics: Topics for the next session's agenda; None
+                waits for them to be set on the biography orchestrator
+        """
+        self.session_in_progress = False
+        await self.scheduler.end_conversation()
+        try:
+            # Builds the scribe, which processes the Q&A pairs it had left
+            await self._warm_up()
+            await self.final_update_biography_and_agenda(
+                selected_topics=selected_topics)
+            await self._save_session()
+        finally:
+            await self._close_session()
+
+    async def _hand_off_post_session(
+            self, selected_topics: Optional[List[str]]) -> bool:
+        """Queue the final update for a post-session worker.
+
+        The job is queued before the checkpoint is marked ended, so a
+        process stopping in between leaves a resumable session rather
+        than one nobody post-processes; a worker retries the job until the
+        checkpoint is marked.
+
+        Args:
+            selected_topics: Topics for the next session's agenda; None if
+                the user is still selecting them
+
+        Returns:
+            bool: Whether the session was handed off
+        """
+        try:
+            # An auto-update already running has taken its memories from
+            # the scribe; let it write them before they are checkpointed
+            if self._biography_orchestrator.ready and \
+                    not await self.biography_orchestrator.wait_for_updates(
+                        timeout=300):
+                raise TimeoutError("Timeout waiting for biography update")
+
+            await asyncio.to_thread(
+                enqueue_final_update, self.post_session_queue, self.user_id,
+                self.session_id, self.biography_style, selected_topics)
+
+            self.checkpoint.ended = True
+            await self.checkpoint.save(
+                chat_history=self.chat_history,
+                session_agenda=self.session_agenda,
+                session_state=self._get_checkpoint_state(),
+                scribe_state=self.session_scribe.get_checkpoint_state()
+                    if self._session_scribe.ready else None
+            )
+        except Exception as e:
+            self.checkpoint.ended = False
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[POST-SESSION] Error handing off final update, "
+                f"running it here: {str(e)}")
+            return False
+
+        SessionLogger.log_to_file(
+            "execution_log",
+            f"[POST-SESSION] Final update queued for a post-session worker")
+        return True
+
+    async def _save_session(self):
+        """Save the banks and mark the session completed"""
+        # Save memory bank
+        self.memory_bank.save_to_file(self.user_id)
+        SessionLogger.log_to_file(
+            "execution_log", f"[COMPLETED] Memory bank saved")
+        
+        # Save historical question bank, if it was ever loaded
+        if self._historical_question_bank.ready:
+            self.historical_question_bank.save_to_file(self.user_id)
+            SessionLogger.log_to_file(
+                "execution_log", f"[COMPLETED] Question bank saved")
+
+        # Everything is saved, so the session is not to be resumed
+        await asyncio.to_thread(self.checkpoint.mark_completed)
+               
+        SessionLogger.log_to_file(
+            "execution_log", f"[COMPLETED] Session completed")
+
+    async def _close_session(self):
+        """Stop background work and write out the session's logs"""
+        # Stop any background work left and log the queue metrics
+        await self.scheduler.shutdown()
+
+        # The biography may be updated by another process before the
+        # user's next session, which should load it from disk
+        BiographyTeamAgent.release_biography(self.user_id)
+        eval_logger = EvaluationLogger.get_current_logger()
+        eval_logger.log_task_queue_stats(self.scheduler.stats())
+        eval_logger.log_idle_window_stats(
+            self.scheduler.idle_window_stats())
+
+        # Log the session's turn latency percentiles
+        eval_logger.log_turn_latency_summary(
+            self._interviewer.turn_latency.summary())
+        
+        # Make sure the session's logs are on disk before reporting done
+        await asyncio.to_thread(SessionLogger.flush)
+        await asyncio.to_thread(eval_logger.close)
+        tracer = Tracer.get_current_tracer()
+        if tracer:
+            await asyncio.to_thread(tracer.flush)
+        self.session_completed = True
+
+    def _resume_conversation(self):
+        """Continue a resumed conversation from its last message"""
+        last_message = self.chat_history[-1]
+        if last_message.role == "User":
+            # The interviewer had not responded yet; deliver the message
+            # unless it reached the interviewer before the checkpoint
+            self._last_user_message = last_message
+            num_user_messages = sum(
+                1 for message in self.chat_history if message.role == "User")
+            delivered = self._interviewer.event_stream.count(
+                "User", "message") >= num_user_messages
+            self.scheduler.submit(
+                "turn", self._interviewer.on_message,
+                None if delivered else last_message,
+                name="resume_conversation")
+        else:
+            # Show the user the question they were answering
+            for sub in (self.user, self.api_participant):
+                if sub is not None:
+                    self.scheduler.submit(
+                        "notify", self._deliver_message, sub, last_message,
+                        name="resume_conversation")
+
+    def _get_checkpoint_state(self) -> Dict:
+        return {
+            "user_message_count": self._user_message_count,
+            "accumulated_auto_update_time": self._accumulated_auto_update_time,
+            "conversation_summary": self.conversation_summary,
+            "summarized_messages": self._summarized_messages
+        }
+
+    def _restore_checkpoint_state(self, state: Dict):
+        self._user_message_count = state["user_message_count"]
+        self._accumulated_auto_update_time = \
+            state["accumulated_auto_update_time"]
+        self.conversation_summary = state["conversation_summary"]
+        self._summarized_messages = state["summarized_messages"]
+
+    async def save_checkpoint(self):
+        """Checkpoint the session's progress, so it can be resumed"""
+        try:
+            await self.checkpoint.save(
+                chat_history=self.chat_history,
+                session_agenda=self.session_agenda,
+                session_state=self._get_checkpoint_state(),
+                scribe_state=self.session_scribe.get_checkpoint_state()
+                    if self._session_scribe.ready else None
+            )
+        except Exception as e:
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[CHECKPOINT] Error saving checkpoint: {str(e)}")
+
+    async def _checkpoint_periodically(self):
+        """Save a checkpoint every checkpoint_interval seconds"""
+        while self.session_in_progress:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._session_ended.wait(),
+                                       self.checkpoint_interval)
+            if self.session_in_progress:
+                await self.save_checkpoint()
+
+    def _get_timeout_remaining(self) -> float:
+        """Seconds left before the session times out from inactivity."""
+        deadline = self._last_message_time + \
+            timedelta(minutes=self.timeout_minutes)
+        return (deadline - datetime.now()).total_seconds()
+
+    async def _wait_for_session_end(self):
+        """Wait until the session ends, or end it after inactivity.
+        
+        Only wakes up when the session ends or the inactivity deadline 
+        passes; the deadline moves forward with every user message.
+        """
+        while self.session_in_progress:
+            remaining = self._get_timeout_remaining()
+            if remaining <= 0:
                 SessionLogger.log_to_file(
-                    "execution_log", f"[COMPLETED] Session completed")
+                    "execution_log", 
+                    (
+                        f"[TIMEOUT] Session timed out after "
+                        f"{self.timeout_minutes} minutes of inactivity"
+                    )
+                )
+                self.session_in_progress = False
+                self._session_timeout = True
+                return
+
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._session_ended.wait(), remaining)
 
     async def get_session_memories(self, include_processed=True) -> List[Memory]:
         """Get memories added during this session
@@ -413,41 +809,49 @@ class InterviewSession:
 
     async def _check_and_trigger_biography_update(self):
         """Check if we have enough memories to trigger a biography update"""
+        # Never build the scribe or orchestrator on the event loop
+        session_scribe = await self._session_scribe.aget()
+        orchestrator = await self.get_biography_orchestrator()
+
         # Skip if biography update already in progress or session not in progress
         if self.auto_biography_update_in_progress or \
            not self.session_in_progress or \
-           self.biography_orchestrator.biography_update_in_progress:
+           orchestrator.biography_update_in_progress:
             return
             
         # Get current memory count without clearing or waiting
-        memories = await self.session_scribe \
+        memories = await session_scribe \
             .get_session_memories(clear_processed=False,
                                    wait_for_processing=False)
         
-        # Check if we've reached the threshold
-        if len(memories) >= self.memory_threshold:
+        # Check if we've reached the threshold, adapted to how long the
+        # user thinks and how long updates take
+        threshold = self.auto_update_policy.adapt(
+            self.scheduler.idle_window.think_seconds)
+        if len(memories) >= threshold:
+            batch_size = self.auto_update_policy.batch_size(len(memories))
             SessionLogger.log_to_file(
                 "execution_log",
                 f"[AUTO-UPDATE] Triggering biography update "
-                f"with {len(memories)} memories"
+                f"with {batch_size} of {len(memories)} memories "
+                f"(threshold {threshold})"
             )
             
+            memories_to_process = []
             try:
                 self.auto_biography_update_in_progress = True
                 
-                # Generate a summary of recent conversation
-                await self._update_conversation_summary()
-                
-                # Get memories and clear them from the session scribe
+                # Get the oldest memories and clear them from the session scribe
                 memories_to_process = \
-                    await self.session_scribe.get_session_memories(
-                        clear_processed=True, wait_for_processing=False)
+                    await session_scribe.get_session_memories(
+                        clear_processed=True, wait_for_processing=False,
+                        max_memories=batch_size)
                 
                 # Measure the time auto-update would take
                 start_time = time.time()
                 
                 # Update biography with these memories and the conversation summary
-                await self.biography_orchestrator.update_biography_with_memories(
+                await orchestrator.update_biography_with_memories(
                     memories_to_process,
                     is_auto_update=True
                 )
@@ -455,6 +859,8 @@ class InterviewSession:
                 # Record the time it took
                 update_time = time.time() - start_time
                 self._accumulated_auto_update_time += update_time
+                self.auto_update_policy.record_update(
+                    len(memories_to_process), update_time)
                 
                 SessionLogger.log_to_file(
                     "execution_log",
@@ -468,21 +874,40 @@ class InterviewSession:
                     f"[AUTO-UPDATE] Error during biography update: {str(e)}"
                 )
             finally:
+                # Unless cancelled, checkpoints leave the memories out from
+                # now on, written or not, as failed updates are not retried
+                if not asyncio.current_task().cancelling():
+                    session_scribe.finish_memory_update(
+                        memories_to_process)
                 self.auto_biography_update_in_progress = False
     
+    def _schedule_summary_update(self):
+        """Update the conversation summary in the background"""
+        # An update that has not started yet will include the latest turn
+        if self.scheduler.depth("summary") < 2:
+            self.scheduler.submit("summary", self._update_conversation_summary)
+
     async def _update_conversation_summary(self):
-        """Generate a summary of recent conversation messages"""
-        
-        # Extract recent messages from chat history
-        recent_messages: List[Message] = []
-        for msg in self.chat_history[-self.session_scribe._max_events_len:]:
-            if msg.type == MessageType.CONVERSATION:
-                recent_messages.append(msg)
-        
-        # Generate summary if we have messages
-        if recent_messages:
-            self.conversation_summary = \
-                summarize_conversation(recent_messages)
+        """Fold the messages added since the last update into the summary"""
+        end = len(self.chat_history)
+        new_messages: List[Message] = [
+            msg for msg in self.chat_history[self._summarized_messages:end]
+            if msg.type == MessageType.CONVERSATION
+        ]
+        if not new_messages:
+            return
+
+        async with background_llm_call():
+            if self.conversation_summary:
+                summary = await asyncio.to_thread(
+                    update_conversation_summary,
+                    self.conversation_summary, new_messages)
+            else:
+                summary = await asyncio.to_thread(
+                    summarize_conversation, new_messages)
+
+        self.conversation_summary = summary
+        self._summarized_messages = end
     
     async def final_update_biography_and_agenda(self, selected_topics: Optional[List[str]] = None):
         """Trigger final biography update"""
@@ -0,0 +1,58 @@
+import os
+from typing import List, Optional
+from dotenv import load_dotenv
+
+from utils.job_queue import JobQueue
+
+load_dotenv(override=True)
+
+# Kind of the job running a session's final biography and agenda update
+FINAL_UPDATE_JOB = "final_update"
+
+
+def get_post_session_queue() -> Optional[JobQueue]:
+    """The queue of post-session work, if sessions hand it off to workers.
+
+    Returns:
+        Optional[JobQueue]: The queue, or None if post-session work runs
+        in the session's own process
+    """
+    if os.getenv("POST_SESSION_QUEUE", "false").lower() != "true":
+        return None
+    return JobQueue()
+
+
+def final_update_job_key(user_id: str, session_id: int) -> str:
+    return f"{FINAL_UPDATE_JOB}/{user_id}/{session_id}"
+
+
+def enqueue_final_update(queue: JobQueue, user_id: str, session_id: int,
+                         biography_style: str,
+                         selected_topics: Optional[List[str]]) -> bool:
+    """Queue the final update of a session whose conversation has ended.
+
+    The user's jobs form a group, so their sessions are post-processed
+    one at a time, in order.
+
+    Args:
+        queue: The post-session queue
+        user_id: User of the session
+        session_id: Session ID
+        biography_style: Biography style of the user's session
+        selected_topics: Topics for the next session's agenda; None if
+            the user is still selecting them
+
+    Returns:
+        bool: Whether the job was queued
+    """
+    return queue.enqueue(
+        FINAL_UPDATE_JOB,
+        final_update_job_key(user_id, session_id),
+        {
+            "user_id": user_id,
+            "session_id": session_id,
+            "biography_style": biography_style,
+            "selected_topics": selected_topics
+        },
+        group=user_id
+    )
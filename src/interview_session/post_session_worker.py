@@ -0,0 +1,204 @@
+import asyncio
+import contextvars
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+from dotenv import load_dotenv
+
+from interview_session.interview_session import InterviewSession
+from interview_session.post_session import FINAL_UPDATE_JOB
+from interview_session.session_checkpoint import SessionCheckpoint
+from utils.job_queue import Job, JobQueue
+
+load_dotenv(override=True)
+
+logger = logging.getLogger(__name__)
+
+
+class PostSessionWorker:
+    """Drains the post-session queue.
+
+    Each job resumes a session from the checkpoint saved when its
+    conversation ended, and runs its final biography and agenda update.
+    Jobs run concurrently, each in a context of its own like the API's
+    hosted sessions. A job whose session has already completed is done
+    without running again, so a job may safely run more than once.
+    """
+
+    def __init__(self, queue: JobQueue, name: Optional[str] = None):
+        """Initialize the worker.
+
+        Args:
+            queue: The post-session queue
+            name: Name of the worker in the queue (default: host and PID)
+        """
+        self.queue = queue
+        self.name = name or f"{socket.gethostname()}-{os.getpid()}"
+        self.concurrency = \
+            int(os.getenv("POST_SESSION_WORKER_CONCURRENCY", 4))
+        self.poll_seconds = float(os.getenv("JOB_POLL_SECONDS", 2))
+        self.stats_interval = \
+            float(os.getenv("JOB_STATS_INTERVAL_SECONDS", 60))
+        self.topic_selection_timeout = \
+            float(os.getenv("TOPIC_SELECTION_TIMEOUT_SECONDS", 240))
+        self._jobs: Set[asyncio.Task] = set()
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def serve(self) -> None:
+        """Run jobs until SIGINT or SIGTERM, then finish the running ones."""
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=int(os.getenv("ENGINE_POOL_SIZE", 256)),
+            thread_name_prefix="engine"))
+        self._stopping = asyncio.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopping.set)
+
+        logger.info(f"Post-session worker {self.name} started")
+        last_stats = time.monotonic()
+        while not self._stopping.is_set():
+            job = None
+            if len(self._jobs) < self.concurrency:
+                job = await asyncio.to_thread(
+                    self.queue.claim, self.name, [FINAL_UPDATE_JOB])
+            if job is not None:
+                task = asyncio.create_task(self._run_job(job))
+                self._jobs.add(task)
+                task.add_done_callback(self._jobs.discard)
+                continue
+
+            if time.monotonic() - last_stats >= self.stats_interval:
+                last_stats = time.monotonic()
+                stats = await asyncio.to_thread(self.queue.stats)
+                logger.info(f"Post-session queue: {stats}")
+
+            # Wait for a free slot, a new job or the stop signal
+            waits = [asyncio.create_task(self._stopping.wait())]
+            if len(self._jobs) >= self.concurrency:
+                waits.extend(self._jobs)
+            await asyncio.wait(waits, timeout=self.poll_seconds,
+                               return_when=asyncio.FIRST_COMPLETED)
+            waits[0].cancel()
+
+        if self._jobs:
+            logger.info(f"Finishing {len(self._jobs)} running jobs")
+            await asyncio.gather(*self._jobs, return_exceptions=True)
+
+    async def _run_job(self, job: Job) -> None:
+        start = time.perf_counter()
+        lease = asyncio.create_task(self._keep_lease(job))
+        try:
+            await self.run_final_update(job)
+        except Exception as e:
+            retried = await asyncio.to_thread(
+                self.queue.fail, job, self.name, f"{type(e).__name__}: {e}")
+            logger.error(
+                f"Job {job.key} failed on attempt {job.attempts}"
+                f"{', retrying' if retried else ''}: {e}")
+        else:
+            await asyncio.to_thread(self.queue.complete, job, self.name)
+            logger.info(f"Job {job.key} done in "
+                        f"{time.perf_counter() - start:.2f}s, "
+                        f"{time.time() - job.created_at:.2f}s after queued")
+        finally:
+            lease.cancel()
+
+    async def _keep_lease(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            await asyncio.to_thread(self.queue.extend_lease, job, self.name)
+
+    async def run_final_update(self, job: Job) -> None:
+        """Run the final update of the job's session.
+
+        Raises:
+            RuntimeError: If the session has not been handed off yet
+        """
+        user_id = job.payload["user_id"]
+        session_id = job.payload["session_id"]
+        checkpoint = await asyncio.to_thread(
+            SessionCheckpoint.load, user_id, session_id)
+        if checkpoint is None:
+            logger.info(f"Session {session_id} of user {user_id} "
+                        f"has already completed")
+            return
+        if not checkpoint.ended:
+            raise RuntimeError(f"Session {session_id} of user {user_id} "
+                               f"has not been handed off yet")
+
+        # Loading the banks reads from disk, so build the session in a
+        # worker thread, inside a fresh context of its own
+        context = contextvars.Context()
+        session = await asyncio.to_thread(
+            context.run, InterviewSession,
+            interaction_mode='api',
+            user_config={"user_id": user_id,
+                         "biography_style": job.payload["biography_style"]},
+            checkpoint=checkpoint)
+
+        loop = asyncio.get_running_loop()
+        selected_topics = job.payload.get("selected_topics")
+        forward_topics = None
+        if selected_topics is None:
+            forward_topics = loop.create_task(
+                self._forward_selected_topics(job, session), context=context)
+        try:
+            await loop.create_task(
+                session.run_post_session(selected_topics), context=context)
+        finally:
+            if forward_topics is not None:
+                forward_topics.cancel()
+
+    async def _forward_selected_topics(self, job: Job,
+                                       session: InterviewSession) -> None:
+        """Pass the topics the user selects on to the session.
+
+        The API stores them in the job's payload; without a selection
+        before the timeout, the agenda is updated without topics.
+        """
+        deadline = job.created_at + self.topic_selection_timeout
+        topics = None
+        while topics is None and time.time() < deadline:
+            await asyncio.sleep(self.poll_seconds)
+            payload = await asyncio.to_thread(self.queue.get_payload, job.key)
+            topics = payload.get("selected_topics") if payload else None
+        orchestrator = await session.get_biography_orchestrator()
+        await orchestrator.set_selected_topics(topics or [])
+
+
+def _worker_main() -> None:
+    """Entry point of a post-session worker process."""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(PostSessionWorker(JobQueue()).serve())
+
+
+def run_workers(num_workers: int) -> None:
+    """Run post-session workers until interrupted.
+
+    Args:
+        num_workers: Number of worker processes
+    """
+    if num_workers <= 1:
+        _worker_main()
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_worker_main,
+                        name=f"post-session-worker-{index}")
+        for index in range(num_workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # The workers got the signal too; let them finish their jobs
+        for process in processes:
+            process.join()
@@ -21,6 +21,36 @@ Recent conversation:
 Summarize the key points of this conversation in 100-200 words:
 """
 
+CONVERSATION_SUMMARY_UPDATE_PROMPT = """
+You are an expert conversation summarizer. You are keeping a running summary of a conversation between an interviewer and a user up to date.
+
+Focus on capturing:
+1. Key facts and information shared by the user
+2. Important topics discussed
+3. Any significant insights or revelations
+
+The summary should be factual, objective, and focused on the content rather than the interaction style. Keep the facts from the current summary that still matter, fold in what the new messages add, and give more room to the most recent topics.
+
+Current summary:
+<summary>
+{summary}
+</summary>
+
+New messages since the summary was written:
+<conversation>
+{conversation}
+</conversation>
+
+Write the updated summary in 100-200 words:
+"""
+
+def _format_conversation(conversation_messages: List[Message]) -> str:
+    return "\n\n".join(
+        [f"<{msg.role}>{msg.content}</{msg.role}>" for msg in conversation_messages])
+
+def _get_summary_engine():
+    return get_engine("gpt-4o-mini", temperature=0.0, max_tokens=1024)
+
 def summarize_conversation(conversation_messages: List[Message]):
     """
     Summarize recent conversation messages.
@@ -34,15 +64,31 @@ def summarize_conversation(conversation_messages: List[Message]):
     """
     
     
-    # Format the conversation
-    formatted_conversation = "\n\n".join(
-        [f"<{msg.role}>{msg.content}</{msg.role}>" for msg in conversation_messages])
-    
     # Create the prompt
-    prompt = CONVERSATION_SUMMARIZE_PROMPT.format(conversation=formatted_conversation)
+    prompt = CONVERSATION_SUMMARIZE_PROMPT.format(
+        conversation=_format_conversation(conversation_messages))
     
-    # Get the engine and invoke it
-    engine = get_engine("gpt-4o-mini", temperature=0.0, max_tokens=1024)
-    summary = invoke_engine(engine, prompt)
+    # Invoke the shared engine
+    summary = invoke_engine(_get_summary_engine(), prompt)
     
     return summary
+
+def update_conversation_summary(summary: str,
+                                new_messages: List[Message]) -> str:
+    """
+    Fold new conversation messages into an existing summary.
+    
+    Only the new messages are sent, so the cost of an update does not
+    grow with the length of the conversation.
+    
+    Args:
+        summary: The current summary
+        new_messages: Messages added since the summary was written
+    
+    Returns:
+        The updated summary
+    """
+    prompt = CONVERSATION_SUMMARY_UPDATE_PROMPT.format(
+        summary=summary,
+        conversation=_format_conversation(new_messages))
+    return invoke_engine(_get_summary_engine(), prompt)
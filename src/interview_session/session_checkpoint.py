@@ -0,0 +1,377 @@
+import asyncio
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+from dotenv import load_dotenv
+
+from agents.base_agent import BaseAgent
+from content.memory_bank.memory import Memory
+from content.memory_bank.memory_bank_vector_db import VectorMemoryBank
+from content.question_bank.question import Question
+from content.question_bank.question_bank_vector_db import QuestionBankVectorDB
+from content.session_agenda.session_agenda import SessionAgenda
+from interview_session.session_models import Message
+from utils.logger.session_logger import SessionLogger
+
+load_dotenv(override=True)
+
+Bank = Union[VectorMemoryBank, QuestionBankVectorDB]
+
+# Events that are only logged, never read back into prompts
+SKIPPED_EVENT_TAGS = {"llm_prompt"}
+
+
+class SessionCheckpoint:
+    """Incremental checkpoint of an interview session in progress.
+
+    Lives in the session's log directory, under checkpoint/:
+        chat_history.jsonl   Messages, appended as they arrive
+        events.jsonl         Event streams of the tracked agents
+        <bank>.jsonl         New or changed bank items, with embeddings
+        session_agenda.json  The working agenda, rewritten when it changes
+        state.json           Session and scribe state, written last
+
+    Each save appends only what changed since the previous one. state.json
+    records how far every journal was written, and is replaced atomically,
+    so a checkpoint interrupted midway still loads the previous one.
+    A checkpoint that is not marked completed lets a restarted process
+    resume the session without redoing any LLM work. One marked ended was
+    handed off to a post-session worker, which resumes it instead.
+    """
+
+    STATE_FILE = "state.json"
+    AGENDA_FILE = "session_agenda.json"
+    CHAT_JOURNAL = "chat_history"
+    EVENTS_JOURNAL = "events"
+
+    def __init__(self, user_id: str, session_id: int,
+                 state: Optional[Dict[str, Any]] = None):
+        """Initialize the checkpoint of a session.
+
+        Args:
+            user_id: User of the session
+            session_id: Session ID
+            state: Saved state of a checkpoint being resumed
+        """
+        self.user_id = user_id
+        self.session_id = session_id
+        self.directory = self.get_directory(user_id, session_id)
+        self.resumed = state is not None
+        self._state: Dict[str, Any] = state or {}
+        # Whether the conversation ended and was handed off
+        self.ended: bool = self._state.get("ended", False)
+        self._offsets: Dict[str, int] = dict(self._state.get("journals", {}))
+        self._records: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = asyncio.Lock()
+
+        # What has been written so far, per tracked component
+        self._chat_written = 0
+        self._agents: Dict[str, BaseAgent] = {}
+        self._event_positions: Dict[str, int] = {}
+        self._banks: Dict[str, Bank] = {}
+        self._bank_digests: Dict[str, Dict[str, str]] = {}
+        self._bank_versions: Dict[str, int] = {}
+        self._agenda_json: Optional[str] = None
+
+        if state is not None:
+            self._load_journals()
+
+    @staticmethod
+    def get_directory(user_id: str, session_id: int) -> Path:
+        return Path(os.getenv("LOGS_DIR"), user_id, "execution_logs",
+                    f"session_{session_id}", "checkpoint")
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """The saved state of the checkpoint being resumed."""
+        return self._state
+
+    @classmethod
+    def load(cls, user_id: str,
+             session_id: int) -> Optional['SessionCheckpoint']:
+        """Load a session's checkpoint, if the session has not completed.
+
+        Returns:
+            Optional[SessionCheckpoint]: The loaded checkpoint, or None
+        """
+        state_path = cls.get_directory(user_id, session_id) / cls.STATE_FILE
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if state.get("completed"):
+            return None
+        return cls(user_id, session_id, state=state)
+
+    @classmethod
+    def find_resumable(cls, user_id: str) -> Optional['SessionCheckpoint']:
+        """Find the user's last session, if it stopped before completing.
+
+        Sessions handed off to a post-session worker are not resumable.
+
+        Returns:
+            Optional[SessionCheckpoint]: The loaded checkpoint, or None
+        """
+        base_path = Path(os.getenv("LOGS_DIR"), user_id, "execution_logs")
+        if not base_path.is_dir():
+            return None
+
+        session_ids = [int(d.name.split('_')[1]) for d in base_path.iterdir()
+                       if d.is_dir() and d.name.startswith('session_')]
+        if not session_ids:
+            return None
+
+        checkpoint = cls.load(user_id, max(session_ids))
+        if checkpoint is None or checkpoint.ended:
+            return None
+        return checkpoint
+
+    def _load_journals(self) -> None:
+        """Read the journals up to the offsets recorded in the state.
+
+        Anything written past them belongs to a save that did not finish;
+        it is cut off, so new records are appended after the loaded ones.
+        """
+        for name, offset in self._offsets.items():
+            path = self.directory / f"{name}.jsonl"
+            with open(path, 'rb') as f:
+                data = f.read(offset)
+            self._records[name] = [json.loads(line)
+                                   for line in data.splitlines() if line]
+            if path.stat().st_size > offset:
+                os.truncate(path, offset)
+
+    def load_session_agenda(self) -> SessionAgenda:
+        with open(self.directory / self.AGENDA_FILE, 'r',
+                  encoding='utf-8') as f:
+            self._agenda_json = f.read()
+        return SessionAgenda.from_dict(json.loads(self._agenda_json))
+
+    def load_chat_history(self) -> List[Message]:
+        """Restore the chat history and start tracking it."""
+        messages = [
+            Message(
+                id=record["id"],
+                type=record["type"],
+                role=record["role"],
+                content=record["content"],
+                timestamp=datetime.fromisoformat(record["timestamp"])
+            )
+            for record in self._records.pop(self.CHAT_JOURNAL, [])
+        ]
+        self._chat_written = len(messages)
+        return messages
+
+    def attach_agent(self, agent: BaseAgent) -> None:
+        """Restore an agent's event stream, if resuming, and track it."""
+        for record in self._records.get(self.EVENTS_JOURNAL, []):
+            if record["agent"] == agent.name:
+                agent.event_stream.append(BaseAgent.Event(
+                    sender=record["sender"],
+                    tag=record["tag"],
+                    content=record["content"],
+                    timestamp=datetime.fromisoformat(record["timestamp"])
+                ))
+        self._agents[agent.name] = agent
+        self._event_positions[agent.name] = len(agent.event_stream)
+
+    def attach_bank(self, name: str, bank: Bank) -> None:
+        """Restore a bank's changes, if resuming, and track the bank.
+
+        Only changes made after the bank is attached are checkpointed;
+        what it holds now is already on disk.
+        """
+        records = self._records.pop(name, [])
+        if records:
+            embeddings = {
+                record["item"]["id"]: np.array(record["embedding"],
+                                               dtype=np.float32)
+                for record in records if record["embedding"] is not None
+            }
+            if isinstance(bank, VectorMemoryBank):
+                bank.upsert_memories(
+                    [Memory.from_dict(record["item"]) for record in records],
+                    embeddings)
+            else:
+                bank.upsert_questions(
+                    [Question.from_dict(record["item"]) for record in records],
+                    embeddings)
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[CHECKPOINT] Restored {len(records)} {name} items")
+
+        self._banks[name] = bank
+        self._bank_digests[name] = {
+            item.id: self._digest(item) for item in self._bank_items(bank)}
+        self._bank_versions[name] = getattr(bank, "version", None)
+
+    @staticmethod
+    def _bank_items(bank: Bank) -> List[Union[Memory, Question]]:
+        if isinstance(bank, VectorMemoryBank):
+            return bank.memories
+        return bank.questions
+
+    @staticmethod
+    def _digest(item: Union[Memory, Question]) -> str:
+        return json.dumps(item.to_dict(), sort_keys=True)
+
+    async def save(
+        self,
+        chat_history: List[Message],
+        session_agenda: SessionAgenda,
+        session_state: Dict[str, Any],
+        scribe_state: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Checkpoint what changed since the last save.
+
+        The changes are collected on the event loop, so they are a
+        consistent snapshot, and written to disk in a worker thread.
+
+        Args:
+            chat_history: The session's chat history
+            session_agenda: The working session agenda
+            session_state: State of the interview session
+            scribe_state: State of the session scribe, if it was built
+        """
+        async with self._lock:
+            journals, tracked = self._collect_changes(chat_history)
+
+            agenda_json = json.dumps(session_agenda.to_dict(), indent=2)
+            if agenda_json == self._agenda_json:
+                agenda_json = None
+
+            state = {
+                "user_id": self.user_id,
+                "session_id": self.session_id,
+                "completed": False,
+                "ended": self.ended,
+                "saved_at": datetime.now().isoformat(),
+                "session": session_state,
+                # An unbuilt scribe has not changed since the last save
+                "scribe": scribe_state if scribe_state is not None
+                          else self._state.get("scribe")
+            }
+
+            await asyncio.to_thread(self._write, journals, agenda_json, state)
+
+            # Only count changes as saved once they are on disk
+            self._chat_written, self._event_positions, \
+                self._bank_digests, self._bank_versions = tracked
+            if agenda_json is not None:
+                self._agenda_json = agenda_json
+
+        num_records = sum(len(lines) for lines in journals.values())
+        SessionLogger.log_to_file(
+            "execution_log",
+            f"[CHECKPOINT] Saved {num_records} new records")
+
+    def _collect_changes(self, chat_history: List[Message]):
+        """Serialize everything tracked that changed since the last save.
+
+        Returns:
+            The new lines of each journal, and the tracking state to keep
+            once they are written
+        """
+        journals: Dict[str, List[str]] = {}
+
+        journals[self.CHAT_JOURNAL] = [
+            json.dumps({
+                "id": message.id,
+                "type": message.type.value,
+                "role": message.role,
+                "content": message.content,
+                "timestamp": message.timestamp.isoformat()
+            })
+            for message in chat_history[self._chat_written:]
+        ]
+
+        event_positions = dict(self._event_positions)
+        journals[self.EVENTS_JOURNAL] = []
+        for name, agent in self._agents.items():
+            for event in agent.event_stream.since(event_positions[name]):
+                if event.tag in SKIPPED_EVENT_TAGS:
+                    continue
+                journals[self.EVENTS_JOURNAL].append(json.dumps({
+                    "agent": name,
+                    "sender": event.sender,
+                    "tag": event.tag,
+                    "content": event.content,
+                    "timestamp": event.timestamp.isoformat()
+                }))
+            event_positions[name] = len(agent.event_stream)
+
+        bank_digests = dict(self._bank_digests)
+        bank_versions = dict(self._bank_versions)
+        for name, bank in self._banks.items():
+            version = getattr(bank, "version", None)
+            if version is not None and version == bank_versions[name]:
+                continue
+            digests = dict(bank_digests[name])
+            lines = []
+            for item in list(self._bank_items(bank)):
+                digest = self._digest(item)
+                if digests.get(item.id) == digest:
+                    continue
+                # Embeddings do not change, so only new items carry one
+                embedding = None
+                if item.id not in digests:
+                    embedding = bank.embeddings.get(item.id)
+                    if embedding is None:
+                        # Still being added; it is picked up next time
+                        continue
+                lines.append(json.dumps({
+                    "item": item.to_dict(),
+                    "embedding": embedding.tolist()
+                        if embedding is not None else None
+                }))
+                digests[item.id] = digest
+            journals[name] = lines
+            bank_digests[name] = digests
+            bank_versions[name] = version
+
+        return journals, (len(chat_history), event_positions,
+                          bank_digests, bank_versions)
+
+    def _write(self, journals: Dict[str, List[str]],
+               agenda_json: Optional[str], state: Dict[str, Any]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        offsets = dict(self._offsets)
+        for name, lines in journals.items():
+            if not lines and name in offsets:
+                continue
+            # A new checkpoint starts its journals fresh
+            mode = 'ab' if name in offsets else 'wb'
+            with open(self.directory / f"{name}.jsonl", mode) as f:
+                if lines:
+                    f.write(("\n".join(lines) + "\n").encode('utf-8'))
+                offsets[name] = f.tell()
+
+        if agenda_json is not None:
+            self._replace(self.AGENDA_FILE, agenda_json)
+
+        state["journals"] = offsets
+        self._replace(self.STATE_FILE, json.dumps(state, indent=2))
+        self._offsets = offsets
+        self._state = state
+
+    def _replace(self, file_name: str, content: str) -> None:
+        """Write a file atomically."""
+        path = self.directory / file_name
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+    def mark_completed(self) -> None:
+        """Mark the session as completed, so it is not resumed."""
+        if not self._state:
+            return
+        state = dict(self._state, completed=True)
+        self._replace(self.STATE_FILE, json.dumps(state, indent=2))
+        self._state = state
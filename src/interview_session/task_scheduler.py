@@ -0,0 +1,322 @@
+import asyncio
+import contextlib
+import contextvars
+import os
+import time
+import traceback
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Optional,
+                    Set, TypedDict)
+from dotenv import load_dotenv
+
+from interview_session.idle_window import IdleWindowPredictor
+from interview_session.turn_metrics import LatencyHistogram
+from utils.logger.session_logger import SessionLogger
+
+load_dotenv()
+
+# Scheduler running the background job of the current task, if any
+_background_scheduler: contextvars.ContextVar[Optional['TaskScheduler']] = \
+    contextvars.ContextVar("background_scheduler", default=None)
+
+
+class QueueConfig(TypedDict, total=False):
+    """Configuration for a scheduler queue."""
+    max_concurrency: Optional[int]  # None runs every job at once
+    critical: bool       # Background queues wait while these jobs are queued
+    background: bool     # Waits until no critical job is queued or running
+    cancel_on_end: bool  # Jobs are cancelled when the conversation ends
+
+
+def default_queue_configs() -> Dict[str, QueueConfig]:
+    """Queues of an interview session, in priority order."""
+    return {
+        # Delivering user messages to the interviewer
+        "turn": QueueConfig(max_concurrency=None, critical=True,
+                            cancel_on_end=True),
+        # Delivering messages to the other participants
+        "notify": QueueConfig(max_concurrency=None, cancel_on_end=True),
+        # Session scribe processing of Q&A pairs
+        "scribe": QueueConfig(
+            max_concurrency=int(os.getenv("SCRIBE_MAX_CONCURRENCY", 2)),
+            background=True),
+        # Rolling conversation summary updates
+        "summary": QueueConfig(max_concurrency=1, background=True),
+        # Biography auto-updates
+        "biography": QueueConfig(max_concurrency=1, background=True),
+        # Session agenda updates; the session summary and the interview
+        # questions are independent, so both can run at once
+        "agenda": QueueConfig(max_concurrency=2, background=True),
+        # Building components deferred at session startup
+        "startup": QueueConfig(max_concurrency=None, background=True),
+        # Periodic session checkpoints
+        "checkpoint": QueueConfig(max_concurrency=1, background=True),
+    }
+
+
+class _JobQueue:
+    """Bookkeeping for one named queue."""
+
+    def __init__(self, name: str, config: QueueConfig):
+        self.name = name
+        self.config = config
+        max_concurrency = config.get("max_concurrency")
+        self.semaphore = asyncio.Semaphore(max_concurrency) \
+            if max_concurrency else None
+        self.tasks: Set[asyncio.Task] = set()
+        self.queued = 0
+        self.running = 0
+        self.max_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.wait_times = LatencyHistogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "max_depth": self.max_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "wait": self.wait_times.to_dict()
+        }
+
+
+class TaskScheduler:
+    """Runs an interview session's background work in named queues.
+
+    Every job is tracked, so it can be cancelled or waited for, and its
+    failure is logged instead of lost. Queues bound how many of their
+    jobs run at once. Background jobs (scribe, biography, agenda) do not
+    start while a critical job is queued or running, so they never
+    compete with the interviewer's next response.
+
+    The LLM calls of background jobs (see background_llm_call) also
+    wait for an idle window: no critical job in flight, and the user
+    likely to stay idle until the call finishes.
+    """
+
+    def __init__(self, queues: Optional[Dict[str, QueueConfig]] = None):
+        queues = queues if queues is not None else default_queue_configs()
+        self._queues: Dict[str, _JobQueue] = {
+            name: _JobQueue(name, config) for name, config in queues.items()
+        }
+        self._critical_jobs = 0
+        self._critical_idle = asyncio.Event()
+        self._critical_idle.set()
+        # Set, and replaced, when a critical job is submitted or the
+        # conversation ends, to wake calls waiting for an idle window
+        self._idle_interrupted = asyncio.Event()
+
+        # Idle windows between the interviewer's turns
+        self.idle_window = IdleWindowPredictor()
+        self.max_defer_seconds = float(
+            os.getenv("BACKGROUND_MAX_DEFER_SECONDS", 60))
+        self._idle_since = time.perf_counter()
+        self._critical_starts = 0
+        self._deferred_calls = 0
+        self._deferred_seconds = 0.0
+        self._overlapping_calls = 0
+        self._conversation_ended = False
+
+    def submit(self, queue: str, fn: Callable[..., Awaitable[Any]],
+               *args, name: Optional[str] = None, **kwargs) -> asyncio.Task:
+        """Schedule fn(*args, **kwargs) on a queue.
+
+        Args:
+            queue: Name of the queue
+            fn: Coroutine function to run
+            name: Name of the job in logs (defaults to the function name)
+
+        Returns:
+            asyncio.Task: Task that resolves to the job's result
+        """
+        job_queue = self._queues[queue]
+        job_queue.queued += 1
+        job_queue.max_depth = max(
+            job_queue.max_depth, job_queue.queued + job_queue.running)
+        if job_queue.config.get("critical"):
+            # Count critical jobs from submission, so background jobs
+            # submitted right after do not start ahead of them
+            self._critical_jobs += 1
+            self._critical_starts += 1
+            self._critical_idle.clear()
+            self._interrupt_idle_waits()
+
+        task = asyncio.create_task(self._run(
+            job_queue, name or fn.__name__, fn, args, kwargs))
+        job_queue.tasks.add(task)
+        task.add_done_callback(
+            lambda done: self._on_done(job_queue, done))
+        return task
+
+    async def _run(self, job_queue: _JobQueue, name: str,
+                   fn: Callable[..., Awaitable[Any]], args, kwargs) -> Any:
+        submitted = time.perf_counter()
+        started = False
+        try:
+            if job_queue.semaphore:
+                await job_queue.semaphore.acquire()
+            try:
+                if job_queue.config.get("background"):
+                    _background_scheduler.set(self)
+                    while self._critical_jobs:
+                        await self._critical_idle.wait()
+                job_queue.queued -= 1
+                job_queue.running += 1
+                started = True
+                job_queue.wait_times.record(time.perf_counter() - submitted)
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    job_queue.running -= 1
+            finally:
+                if job_queue.semaphore:
+                    job_queue.semaphore.release()
+        except asyncio.CancelledError:
+            job_queue.cancelled += 1
+            raise
+        except Exception as e:
+            job_queue.failed += 1
+            SessionLogger.log_to_file(
+                "execution_log",
+                f"[SCHEDULER] {job_queue.name} job {name} failed: {str(e)}\n"
+                f"{traceback.format_exc()}"
+            )
+            raise
+        finally:
+            if not started:
+                job_queue.queued -= 1
+            if job_queue.config.get("critical"):
+                self._critical_jobs -= 1
+                if not self._critical_jobs:
+                    self._idle_since = time.perf_counter()
+                    self._critical_idle.set()
+
+    def _interrupt_idle_waits(self) -> None:
+        self._idle_interrupted.set()
+        self._idle_interrupted = asyncio.Event()
+
+    def _on_done(self, job_queue: _JobQueue, task: asyncio.Task) -> None:
+        job_queue.tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is None:
+            job_queue.completed += 1
+
+    async def wait_for_idle_window(self) -> None:
+        """Wait until a background LLM call is unlikely to overlap a turn.
+
+        Waits while a critical job is in flight, then while the user is
+        likely to reply before the call would finish. After
+        max_defer_seconds the call only waits for critical jobs, so
+        background work is delayed but never starved. Once the
+        conversation has ended there is no reply to wait for.
+
+        Rather than polling, waits until the predicted window opens,
+        waking early if a critical job starts or the conversation ends.
+        """
+        start = time.perf_counter()
+        deferred = False
+        while True:
+            while self._critical_jobs:
+                deferred = True
+                await self._critical_idle.wait()
+            now = time.perf_counter()
+            if self._conversation_ended or \
+                    now - start >= self.max_defer_seconds or \
+                    self.idle_window.fits(now - self._idle_since):
+                break
+            deferred = True
+            remaining = min(
+                self.idle_window.seconds_until_fit(now - self._idle_since),
+                self.max_defer_seconds - (now - start))
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._idle_interrupted.wait(), remaining)
+
+        if deferred:
+            self._deferred_calls += 1
+            self._deferred_seconds += time.perf_counter() - start
+
+    @contextlib.asynccontextmanager
+    async def _llm_call(self) -> AsyncIterator[None]:
+        await self.wait_for_idle_window()
+        critical_starts = self._critical_starts
+        start = time.perf_counter()
+        yield
+        self.idle_window.record_call_time(time.perf_counter() - start)
+        if self._critical_starts != critical_starts:
+            self._overlapping_calls += 1
+
+    def idle_window_stats(self) -> Dict[str, Any]:
+        """Think times, background LLM call times and how often the calls
+        were deferred to, or still overlapped, the interviewer's turns."""
+        return {
+            **self.idle_window.to_dict(),
+            "deferred_calls": self._deferred_calls,
+            "deferred_seconds": self._deferred_seconds,
+            "overlapping_calls": self._overlapping_calls
+        }
+
+    def depth(self, queue: str) -> int:
+        """Number of jobs queued or running on a queue."""
+        job_queue = self._queues[queue]
+        return job_queue.queued + job_queue.running
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Depth, outcome counts and wait times of every queue."""
+        return {name: job_queue.to_dict()
+                for name, job_queue in self._queues.items()}
+
+    async def join(self, queue: str, timeout: Optional[float] = None) -> bool:
+        """Wait until a queue has no jobs left.
+
+        Returns:
+            bool: True if the queue drained, False on timeout
+        """
+        async def _drain():
+            while self._queues[queue].tasks:
+                await asyncio.wait(set(self._queues[queue].tasks))
+
+        try:
+            await asyncio.wait_for(_drain(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def cancel(self, queue: str) -> None:
+        """Cancel a queue's jobs and wait for them to stop."""
+        tasks = list(self._queues[queue].tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def end_conversation(self) -> None:
+        """Cancel the jobs that are only useful while the user is talking."""
+        self._conversation_ended = True
+        self._interrupt_idle_waits()
+        for name, job_queue in self._queues.items():
+            if job_queue.config.get("cancel_on_end"):
+                await self.cancel(name)
+
+    async def shutdown(self) -> None:
+        """Cancel every job still scheduled."""
+        for name in self._queues:
+            await self.cancel(name)
+
+
+@contextlib.asynccontextmanager
+async def background_llm_call() -> AsyncIterator[None]:
+    """Hold an LLM call made by a background job for an idle window.
+
+    Calls outside background jobs, such as the interviewer's, run at once.
+    """
+    scheduler = _background_scheduler.get()
+    if scheduler is None:
+        yield
+        return
+    async with scheduler._llm_call():
+        yield
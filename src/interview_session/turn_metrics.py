@@ -0,0 +1,139 @@
+import bisect
+import math
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Upper bounds (seconds) of the histogram buckets
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1, 2.5, 5, 10, 20, 30, 60]
+
+# Phases of a turn, from user message to the interviewer's response
+TURN_PHASES = ["loop_delay", "prompt_build", "llm_wait",
+               "tool_dispatch", "recall_search", "total"]
+
+
+class LatencyHistogram:
+    """Bucketed latency histogram that also keeps samples for percentiles."""
+
+    def __init__(self, buckets: List[float] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last bucket is overflow
+        self.samples: List[float] = []
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.samples.append(seconds)
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the recorded samples."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": len(self.samples),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self.samples, default=0.0),
+            "buckets": {
+                **{f"le_{bound}": count for bound, count
+                   in zip(self.buckets, self.counts)},
+                "inf": self.counts[-1]
+            }
+        }
+
+
+class TurnLatencyTracker:
+    """Breaks down each interviewer turn and records per-session histograms.
+
+    A turn starts when a user message reaches the interviewer and ends when
+    the interviewer's response is delivered. Turns slower than
+    TURN_LATENCY_SLO_SECONDS are counted as SLO violations.
+    """
+
+    def __init__(self):
+        self.slo_seconds = float(os.getenv("TURN_LATENCY_SLO_SECONDS", 10))
+        self.histograms: Dict[str, LatencyHistogram] = {
+            phase: LatencyHistogram() for phase in TURN_PHASES
+        }
+        self.slo_violations = 0
+        self._message_id: Optional[str] = None
+        self._message_time: Optional[datetime] = None
+        self._message_length = 0
+        self._phases: Dict[str, float] = {}
+
+    @property
+    def turn_in_progress(self) -> bool:
+        return self._message_time is not None
+
+    def start_turn(self, message_id: str, message_time: datetime,
+                   message_length: int) -> None:
+        """Start timing a turn for a user message.
+
+        Args:
+            message_id: ID of the user message
+            message_time: When the user message was added to the chat
+            message_length: Length of the user message in characters
+        """
+        self._message_id = message_id
+        self._message_time = message_time
+        self._message_length = message_length
+        self._phases = {phase: 0.0 for phase in TURN_PHASES}
+        # Time between the message being sent and the interviewer picking
+        # it up is spent waiting on the event loop
+        self._phases["loop_delay"] = \
+            (datetime.now() - message_time).total_seconds()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase to the current turn."""
+        if self.turn_in_progress:
+            self._phases[phase] += seconds
+
+    def end_turn(self, response_time: datetime) -> Optional[Dict]:
+        """Finish the current turn and record its phases.
+
+        Returns:
+            Dict with the message details and seconds per phase, or None
+            if no turn is in progress
+        """
+        if not self.turn_in_progress:
+            return None
+
+        self._phases["total"] = \
+            (response_time - self._message_time).total_seconds()
+        for phase, seconds in self._phases.items():
+            self.histograms[phase].record(seconds)
+        if self._phases["total"] > self.slo_seconds:
+            self.slo_violations += 1
+
+        turn = {
+            "message_id": self._message_id,
+            "message_time": self._message_time,
+            "message_length": self._message_length,
+            "phases": self._phases
+        }
+        self._message_id = None
+        self._message_time = None
+        return turn
+
+    def summary(self) -> Dict:
+        """Percentiles and histograms of every phase for the session."""
+        turns = len(self.histograms["total"].samples)
+        return {
+            "turns": turns,
+            "slo_seconds": self.slo_seconds,
+            "slo_violations": self.slo_violations,
+            "slo_attainment": 1 - self.slo_violations / turns if turns else 1.0,
+            "phases": {
+                phase: histogram.to_dict()
+                for phase, histogram in self.histograms.items()
+            }
+        }
@@ -1,4 +1,5 @@
 import os
+import asyncio
 from typing import TYPE_CHECKING
 from interview_session.session_models import Participant, Message
 from utils.speech.speech_to_text import create_stt_engine
@@ -22,19 +23,27 @@ class User(Participant):
     async def on_message(self, message: Message):
         self.show_last_message_history(message)
         
+        # Terminal reads run in a worker thread so background agent work
+        # keeps progressing on the event loop while the user is typing
         if self._voice_enabled:
             print(f"{BLUE}[1] Type response")
             print(f"[2] Voice response{RESET}")
-            choice = input("Choose input method (1/2): ").strip()
+            choice = (await self._async_input(
+                "Choose input method (1/2): ")).strip()
             
             if choice == "2":
-                user_response = self.get_voice_input()
+                user_response = await asyncio.to_thread(self.get_voice_input)
             else:
-                user_response = input(f"{ORANGE}User: {RESET}")
+                user_response = await self._async_input(
+                    f"{ORANGE}User: {RESET}")
         else:
-            user_response = input(f"{ORANGE}User: {RESET}")
+            user_response = await self._async_input(f"{ORANGE}User: {RESET}")
             
         self.interview_session.add_message_to_chat_history(self.title, user_response)
+
+    async def _async_input(self, prompt: str) -> str:
+        """Read a line from the terminal without blocking the event loop."""
+        return await asyncio.to_thread(input, prompt)
         
     def get_voice_input(self) -> str:
         """Record and transcribe user's voice input"""
@@ -5,6 +5,7 @@ import asyncio
 import contextlib
 
 from interview_session.interview_session import InterviewSession
+from interview_session.post_session import get_post_session_queue
 from utils.speech.speech_to_text import PYAUDIO_AVAILABLE
 
 load_dotenv(override=True)
@@ -22,6 +23,14 @@ async def run_terminal_mode(args):
         args.voice_input = False
         args.voice_output = False
     
+    # The user's last session must be post-processed before the next one
+    post_session_queue = get_post_session_queue()
+    if post_session_queue is not None and \
+            post_session_queue.has_unfinished(args.user_id):
+        print(f"The last session of user {args.user_id} is still being "
+              f"processed. Please try again later.")
+        return
+
     interview_session = InterviewSession(
         interaction_mode='agent' if args.user_agent else 'terminal',
         user_config={
@@ -38,10 +47,21 @@ async def run_terminal_mode(args):
     with contextlib.suppress(KeyboardInterrupt):
         await interview_session.run()
 
+def run_worker_mode(args):
+    from interview_session.post_session_worker import run_workers
+
+    run_workers(args.workers)
+
+def run_server_mode(args):
+    import uvicorn
+    from api.server import app
+
+    uvicorn.run(app, host=args.host, port=args.port)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Run interviewer with specific user and session')
 
-    # Three modes: terminal, server, and setup_db
+    # Modes: terminal, server, and worker (post-session queue)
     parser.add_argument('--mode', default='terminal')
     
     # Terminal mode arguments
@@ -57,6 +77,14 @@ if __name__ == "__main__":
     parser.add_argument('--max_turns', type=int, default=None,
                         help='Maximum number of turns before ending the session')
     
+    # Server mode arguments
+    parser.add_argument('--host', default='0.0.0.0', help='Server host')
+    parser.add_argument('--port', type=int, default=8000, help='Server port')
+    
+    # Worker mode arguments
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of post-session worker processes')
+    
     # Setup_db mode arguments
     parser.add_argument('--reset', action='store_true', help='Reset database (clear all data)')
     
@@ -68,6 +96,10 @@ if __name__ == "__main__":
             parser.error("--user_id is required for terminal mode")
         with contextlib.suppress(KeyboardInterrupt):
             asyncio.run(run_terminal_mode(args))
+    elif args.mode == 'server':
+        run_server_mode(args)
+    elif args.mode == 'worker':
+        run_worker_mode(args)
     else:
         parser.error(f"Invalid mode: {args.mode}")
     
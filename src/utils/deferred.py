@@ -0,0 +1,52 @@
+import asyncio
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Deferred(Generic[T]):
+    """A value that is built on first use instead of up front.
+
+    The value can also be built ahead of time in a worker thread with
+    `warm`, so the event loop never waits for it. It is built only once,
+    however it is first requested.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._ready = False
+        self._warming: Optional[asyncio.Future] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def get(self) -> T:
+        """Get the value, building it in the calling thread if needed."""
+        if not self._ready:
+            with self._lock:
+                if not self._ready:
+                    self._value = self._factory()
+                    self._ready = True
+        return self._value
+
+    async def aget(self) -> T:
+        """Get the value, building it in a worker thread if needed."""
+        if self._ready:
+            return self._value
+        await self.warm()
+        return self._value
+
+    def warm(self) -> asyncio.Future:
+        """Start building the value in a worker thread.
+
+        Returns:
+            asyncio.Future: Resolves once the value is built
+        """
+        if self._warming is None:
+            self._warming = asyncio.ensure_future(
+                asyncio.to_thread(self.get))
+        return self._warming
@@ -0,0 +1,289 @@
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@dataclass
+class Job:
+    """A job claimed from a JobQueue."""
+    id: int
+    kind: str
+    key: str
+    group: Optional[str]
+    payload: Dict[str, Any]
+    attempts: int
+    created_at: float
+
+
+class JobQueue:
+    """Durable job queue in a local SQLite database.
+
+    Jobs are identified by a unique key, so enqueueing the same work twice
+    adds it once. A worker claims a job with a lease; if the worker stops,
+    the lease runs out and another worker claims the job again. Failed
+    jobs are retried with exponential backoff until they run out of
+    attempts. Jobs in the same group run one at a time, in the order they
+    were enqueued.
+
+    Every method opens its own connection, so one queue can be used from
+    several threads and several processes. Methods block; call them from
+    async code with asyncio.to_thread.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: Optional[str] = None):
+        """Open the queue, creating the database if needed.
+
+        Args:
+            path: Database file (default: JOB_QUEUE_PATH, or
+                  DATA_DIR/job_queue.sqlite3)
+        """
+        self.path = Path(path or os.getenv("JOB_QUEUE_PATH") or Path(
+            os.getenv("DATA_DIR", "data"), "job_queue.sqlite3"))
+        self.lease_seconds = float(os.getenv("JOB_LEASE_SECONDS", 600))
+        self.max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+        self.retry_delay = float(os.getenv("JOB_RETRY_DELAY_SECONDS", 30))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL UNIQUE,
+                    group_key TEXT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_until REAL,
+                    worker TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )""")
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_status "
+                       "ON jobs (status, available_at)")
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_group "
+                       "ON jobs (group_key, status)")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction."""
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        finally:
+            db.close()
+
+    def enqueue(self, kind: str, key: str, payload: Dict[str, Any],
+                group: Optional[str] = None) -> bool:
+        """Add a job, unless a job with the same key exists.
+
+        A job with the key that has failed for good is queued again.
+
+        Args:
+            kind: What the job does, for workers to dispatch on
+            key: Unique key of the work
+            payload: JSON serializable arguments of the job
+            group: Jobs of a group run one at a time, in order
+
+        Returns:
+            bool: Whether the job was queued
+        """
+        now = time.time()
+        with self._transaction() as db:
+            cursor = db.execute("""
+                INSERT INTO jobs (kind, key, group_key, payload, status,
+                                  max_attempts, available_at, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    payload = excluded.payload, status = excluded.status,
+                    attempts = 0, available_at = excluded.available_at,
+                    error = NULL
+                WHERE status = ?""",
+                (kind, key, group, json.dumps(payload), self.PENDING,
+                 self.max_attempts, now, now, self.FAILED))
+            return cursor.rowcount > 0
+
+    def update_payload(self, key: str, **fields: Any) -> bool:
+        """Set fields of an unfinished job's payload.
+
+        Returns:
+            bool: Whether the job exists and has not finished
+        """
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT payload FROM jobs WHERE key = ? AND status IN (?, ?)",
+                (key, self.PENDING, self.RUNNING)).fetchone()
+            if row is None:
+                return False
+            payload = dict(json.loads(row[0]), **fields)
+            db.execute("UPDATE jobs SET payload = ? WHERE key = ?",
+                       (json.dumps(payload), key))
+            return True
+
+    def get_payload(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._transaction() as db:
+            row = db.execute("SELECT payload FROM jobs WHERE key = ?",
+                             (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def claim(self, worker: str,
+              kinds: Optional[List[str]] = None) -> Optional[Job]:
+        """Claim the next job that is ready to run.
+
+        Args:
+            worker: Name of the claiming worker
+            kinds: Kinds of jobs the worker runs (default: all)
+
+        Returns:
+            Optional[Job]: The claimed job, or None if none is ready
+        """
+        now = time.time()
+        with self._transaction() as db:
+            # Jobs whose worker stopped before finishing them
+            db.execute("""
+                UPDATE jobs SET status = ?, error = 'Lease expired',
+                    finished_at = ?
+                WHERE status = ? AND lease_until < ?
+                    AND attempts >= max_attempts""",
+                (self.FAILED, now, self.RUNNING, now))
+            db.execute("""
+                UPDATE jobs SET status = ?, available_at = ?
+                WHERE status = ? AND lease_until < ?""",
+                (self.PENDING, now, self.RUNNING, now))
+
+            kind_filter = ""
+            params: List[Any] = [self.PENDING, now]
+            if kinds:
+                kind_filter = \
+                    f"AND job.kind IN ({', '.join('?' for _ in kinds)})"
+                params.extend(kinds)
+            params.extend([self.PENDING, self.RUNNING])
+            row = db.execute(f"""
+                SELECT id, kind, key, group_key, payload, attempts, created_at
+                FROM jobs AS job
+                WHERE job.status = ? AND job.available_at <= ? {kind_filter}
+                    AND NOT EXISTS (
+                        SELECT 1 FROM jobs AS earlier
+                        WHERE earlier.group_key = job.group_key
+                            AND earlier.id < job.id
+                            AND earlier.status IN (?, ?))
+                    AND NOT EXISTS (
+                        SELECT 1 FROM jobs AS running
+                        WHERE running.group_key = job.group_key
+                            AND running.status = 'running')
+                ORDER BY job.available_at, job.id
+                LIMIT 1""", params).fetchone()
+            if row is None:
+                return None
+
+            db.execute("""
+                UPDATE jobs SET status = ?, attempts = attempts + 1,
+                    lease_until = ?, worker = ?, started_at = ?
+                WHERE id = ?""",
+                (self.RUNNING, now + self.lease_seconds, worker, now, row[0]))
+        return Job(id=row[0], kind=row[1], key=row[2], group=row[3],
+                   payload=json.loads(row[4]), attempts=row[5] + 1,
+                   created_at=row[6])
+
+    def extend_lease(self, job: Job, worker: str) -> bool:
+        """Keep a long running job claimed.
+
+        Returns:
+            bool: Whether the worker still holds the job
+        """
+        with self._transaction() as db:
+            cursor = db.execute("""
+                UPDATE jobs SET lease_until = ?
+                WHERE id = ? AND worker = ? AND status = ?""",
+                (time.time() + self.lease_seconds, job.id, worker,
+                 self.RUNNING))
+            return cursor.rowcount > 0
+
+    def complete(self, job: Job, worker: str) -> None:
+        with self._transaction() as db:
+            db.execute("""
+                UPDATE jobs SET status = ?, finished_at = ?, error = NULL
+                WHERE id = ? AND worker = ? AND status = ?""",
+                (self.DONE, time.time(), job.id, worker, self.RUNNING))
+
+    def fail(self, job: Job, worker: str, error: str) -> bool:
+        """Record a failed attempt, retrying the job if it has attempts left.
+
+        Returns:
+            bool: Whether the job will be retried
+        """
+        now = time.time()
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT attempts, max_attempts FROM jobs "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (job.id, worker, self.RUNNING)).fetchone()
+            if row is None:
+                return False
+            attempts, max_attempts = row
+            if attempts < max_attempts:
+                delay = self.retry_delay * 2 ** (attempts - 1)
+                db.execute("""
+                    UPDATE jobs SET status = ?, available_at = ?, error = ?
+                    WHERE id = ?""",
+                    (self.PENDING, now + delay, error, job.id))
+                return True
+            db.execute("""
+                UPDATE jobs SET status = ?, finished_at = ?, error = ?
+                WHERE id = ?""",
+                (self.FAILED, now, error, job.id))
+            return False
+
+    def has_unfinished(self, group: str) -> bool:
+        """Whether a job of the group is pending or running."""
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT 1 FROM jobs WHERE group_key = ? AND status IN (?, ?) "
+                "LIMIT 1", (group, self.PENDING, self.RUNNING)).fetchone()
+        return row is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """Number of jobs in each status, and how long jobs wait and run."""
+        now = time.time()
+        with self._transaction() as db:
+            counts = dict(db.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"))
+            oldest_pending, = db.execute(
+                "SELECT MIN(created_at) FROM jobs WHERE status = ?",
+                (self.PENDING,)).fetchone()
+            mean_run, mean_total = db.execute(
+                "SELECT AVG(finished_at - started_at), "
+                "AVG(finished_at - created_at) FROM jobs WHERE status = ?",
+                (self.DONE,)).fetchone()
+        return {
+            **{status: counts.get(status, 0) for status in
+               (self.PENDING, self.RUNNING, self.DONE, self.FAILED)},
+            "oldest_pending_seconds": now - oldest_pending
+                if oldest_pending is not None else None,
+            "mean_run_seconds": mean_run,
+            "mean_completion_seconds": mean_total
+        }
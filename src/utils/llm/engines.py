@@ -1,3 +1,4 @@
+import threading
 from dotenv import load_dotenv
 from langchain_together import ChatTogether
 from langchain_openai import ChatOpenAI
@@ -19,7 +20,34 @@ engine_constructor = {
     "meta-llama/Llama-3.1-70B-Instruct": ChatTogether
 }
 
+# Engines are stateless clients, so agents with the same settings share one
+# instance (and its connection pool) across all sessions in the process.
+_engine_pool = {}
+_engine_pool_lock = threading.Lock()
+
 def get_engine(model_name, **kwargs):
+    """
+    Returns a shared language model engine for the model name and settings,
+    creating it on first use.
+
+    Args:
+        model_name (str): Name of the model, see create_engine
+        **kwargs: Additional keyword arguments, see create_engine
+
+    Returns:
+        LangChain chat model instance or custom engine
+    """
+    key = (model_name, tuple(sorted(kwargs.items())))
+    engine = _engine_pool.get(key)
+    if engine is None:
+        with _engine_pool_lock:
+            engine = _engine_pool.get(key)
+            if engine is None:
+                engine = create_engine(model_name, **kwargs)
+                _engine_pool[key] = engine
+    return engine
+
+def create_engine(model_name, **kwargs):
     """
     Creates and returns a language model engine based on the specified model name.
 
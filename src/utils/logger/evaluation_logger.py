@@ -1,15 +1,25 @@
 from pathlib import Path
+import contextvars
 import csv
 import os
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
-from tiktoken import get_encoding
+
+from utils.logger.evaluation_store import EvaluationStore
 
 load_dotenv()
 
+# Evaluation logger of the session running in the current context
+_context_logger: contextvars.ContextVar[Optional["EvaluationLogger"]] = \
+    contextvars.ContextVar("evaluation_logger", default=None)
+
 class EvaluationLogger:
-    """Logger for evaluation results."""
+    """Logger for evaluation results.
+    
+    Per-record evaluations are appended to the session's EvaluationStore
+    and can be exported to CSV with EvaluationStore.export_csv.
+    """
     
     _current_logger = None
     
@@ -31,12 +41,14 @@ class EvaluationLogger:
             self.eval_dir = self.base_dir / "evaluations"
         self.eval_dir.mkdir(parents=True, exist_ok=True)
         
-        self.tokenizer = get_encoding("cl100k_base")
+        self.store = EvaluationStore.open(
+            self.eval_dir, str(session_id) if session_id is not None else "")
+        
     
     @classmethod
     def get_current_logger(cls) -> Optional['EvaluationLogger']:
         """Get the current logger instance."""
-        return cls._current_logger
+        return _context_logger.get() or cls._current_logger
     
     @classmethod
     def setup_logger(
@@ -52,6 +64,7 @@ class EvaluationLogger:
         """
         logger = cls(user_id=user_id, session_id=session_id)
         cls._current_logger = logger
+        _context_logger.set(logger)
         return logger
 
     def log_prompt_response(
@@ -70,28 +83,15 @@ class EvaluationLogger:
             response: The response received from the LLM
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create a logs directory for prompts and responses
-        logs_dir = self.eval_dir / \
-            f"prompt_response_logs{'_session_' + self.session_id \
-                                    if self.session_id else ''}"
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        
         if timestamp is None:
             timestamp = datetime.now()
         
-        # Create a timestamped filename
-        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = logs_dir / f"{evaluation_type}_{timestamp_str}.log"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"=== TIMESTAMP: {timestamp.isoformat()} ===\n\n")
-            f.write("=== PROMPT ===\n\n")
-            f.write(prompt)
-            f.write("\n\n=== RESPONSE ===\n\n")
-            f.write(response)
-            f.write("\n")
-        
-        print(f"Saved to {filename}")
+        self.store.append(f"{evaluation_type}_prompt_response", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Prompt': prompt,
+            'Response': response
+        })
     
     def log_question_similarity(
         self,
@@ -102,6 +102,8 @@ class EvaluationLogger:
         matched_question: str,
         explanation: str,
         proposer: str = "unknown",
+        top_cosine_similarity: Optional[float] = None,
+        decision_source: str = "llm",
         timestamp: Optional[datetime] = None
     ) -> None:
         """Log question similarity evaluation results.
@@ -114,41 +116,28 @@ class EvaluationLogger:
             matched_question: Content of the matched duplicate question
             explanation: Explanation of the similarity evaluation
             proposer: Name of the agent proposing this question
+            top_cosine_similarity: Cosine similarity of the closest question
+            decision_source: What made the decision ('embedding' or 'llm')
             timestamp: Optional timestamp (defaults to current time)
         """
-        filename = self.eval_dir / "question_similarity.csv"
-            
-        file_exists = filename.exists()
-        
         if timestamp is None:
             timestamp = datetime.now()
-            
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow([
-                    'Timestamp',
-                    'Proposer',
-                    'Session ID',
-                    'Target Question',
-                    'Similar Questions',
-                    'Similarity Scores',
-                    'Is Duplicate',
-                    'Matched Question',
-                    'Explanation'
-                ])
-            
-            writer.writerow([
-                timestamp.isoformat(),
-                proposer,
-                self.session_id,
-                target_question,
-                '; '.join(similar_questions),
-                '; '.join(f"{score:.2f}" for score in similarity_scores),
-                is_duplicate,
-                matched_question,
-                explanation
-            ])
+        
+        self.store.append("question_similarity", {
+            'Timestamp': timestamp.isoformat(),
+            'Proposer': proposer,
+            'Session ID': self.session_id,
+            'Target Question': target_question,
+            'Similar Questions': '; '.join(similar_questions),
+            'Similarity Scores': '; '.join(
+                f"{score:.2f}" for score in similarity_scores),
+            'Is Duplicate': is_duplicate,
+            'Matched Question': matched_question,
+            'Explanation': explanation,
+            'Top Cosine Similarity': f"{top_cosine_similarity:.4f}" \
+                if top_cosine_similarity is not None else "",
+            'Decision Source': decision_source
+        })
     
     def log_response_latency(
         self,
@@ -165,35 +154,196 @@ class EvaluationLogger:
             response_timestamp: When the response was delivered
             user_message_length: Length of the user's message in characters
         """
-        # Create a logs directory for response latency
-        logs_dir = self.eval_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        
         # Calculate latency in seconds
         latency_seconds = (response_timestamp - user_message_timestamp).total_seconds()
         
-        # Log to CSV file
-        filename = logs_dir / "response_latency.csv"
-        file_exists = filename.exists()
+        self.store.append("response_latency", {
+            'User Message ID': message_id,
+            'Session ID': self.session_id,
+            'Timestamp': user_message_timestamp.isoformat(),
+            'Latency (seconds)': f"{latency_seconds:.3f}",
+            'User Message Length': user_message_length
+        })
+
+    def log_startup_latency(
+        self,
+        init_seconds: float,
+        first_question_seconds: float,
+        llm_seconds: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Log how long the session took to ask its first question.
         
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow([
-                    'User Message ID',
-                    'Session ID',
-                    'Timestamp',
-                    'Latency (seconds)',
-                    'User Message Length'
-                ])
-            
-            writer.writerow([
-                message_id,
-                self.session_id,
-                user_message_timestamp.isoformat(),
-                f"{latency_seconds:.3f}",
-                user_message_length
-            ])
+        Args:
+            init_seconds: Seconds spent constructing the session
+            first_question_seconds: Seconds from the start of the session
+                until the first question was delivered
+            llm_seconds: Part of first_question_seconds spent waiting for
+                the LLM
+            timestamp: Optional timestamp (defaults to current time)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        self.store.append("startup_latency", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Init (seconds)': f"{init_seconds:.3f}",
+            'First Question (seconds)': f"{first_question_seconds:.3f}",
+            'LLM Wait (seconds)': f"{llm_seconds:.3f}",
+            'Local Overhead (seconds)':
+                f"{init_seconds + first_question_seconds - llm_seconds:.3f}"
+        })
+
+    def log_turn_latency(
+        self,
+        message_id: str,
+        phases: Dict[str, float],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Log the latency breakdown of one interviewer turn.
+        
+        Args:
+            message_id: ID of the user message that started the turn
+            phases: Seconds spent in each phase of the turn
+            timestamp: Optional timestamp (defaults to current time)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        self.store.append("turn_latency", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'User Message ID': message_id,
+            **{f"{phase} (seconds)": f"{seconds:.3f}"
+               for phase, seconds in phases.items()}
+        })
+
+    def log_turn_latency_summary(
+        self,
+        summary: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Log the per-session turn latency percentiles and histograms.
+        
+        Args:
+            summary: Output of TurnLatencyTracker.summary
+            timestamp: Optional timestamp (defaults to current time)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        self.store.append("turn_latency_summary", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Turns': summary['turns'],
+            'SLO (seconds)': summary['slo_seconds'],
+            'SLO Violations': summary['slo_violations'],
+            'SLO Attainment': f"{summary['slo_attainment']:.3f}",
+            **{f"{phase} p{p}": f"{stats[f'p{p}']:.3f}"
+               for phase, stats in summary['phases'].items()
+               for p in (50, 95, 99)},
+            'Histograms': {
+                phase: stats['buckets']
+                for phase, stats in summary['phases'].items()
+            }
+        })
+
+    def log_scribe_pass(
+        self,
+        mode: str,
+        lane: str,
+        num_pairs: int,
+        duration: float,
+        usage: Dict[str, int],
+        outputs: Dict[str, int],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Log the cost and output of one session scribe pass.
+        
+        Args:
+            mode: Scribe mode ("multi" or "combined")
+            lane: Part of the pipeline ("notes", "memory" or "combined")
+            num_pairs: Number of Q&A pairs processed in the pass
+            duration: Seconds the pass took
+            usage: LLM calls and prompt/completion tokens of the pass
+            outputs: Successful calls per output tool
+            timestamp: Optional timestamp (defaults to current time)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        self.store.append("scribe_pass", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Mode': mode,
+            'Lane': lane,
+            'Q&A Pairs': num_pairs,
+            'Duration (seconds)': f"{duration:.3f}",
+            'LLM Calls': usage['llm_calls'],
+            'Prompt Tokens': usage['prompt_tokens'],
+            'Completion Tokens': usage['completion_tokens'],
+            'Agenda Notes': outputs.get('update_session_agenda', 0),
+            'Follow-up Questions': outputs.get('add_interview_question', 0),
+            'Memories': outputs.get('update_memory_bank', 0),
+            'Historical Questions': outputs.get('add_historical_question', 0)
+        })
+
+    def log_task_queue_stats(
+        self,
+        stats: Dict[str, Dict[str, Any]],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Log the per-session metrics of each scheduler queue.
+        
+        Args:
+            stats: Output of TaskScheduler.stats
+            timestamp: Optional timestamp (defaults to current time)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        
+        for queue, queue_stats in stats.items():
+            self.store.append("task_queue_stats", {
+                'Timestamp': timestamp.isoformat(),
+                'Session ID': self.session_id,
+                'Queue': queue,
+                'Max Depth': queue_stats['max_depth'],
+                'Completed': queue_stats['completed'],
+                'Failed': queue_stats['failed'],
+                'Cancelled': queue_stats['cancelled'],
+                'Wait p50 (seconds)': f"{queue_stats['wait']['p50']:.3f}",
+                'Wait p95 (seconds)': f"{queue_stats['wait']['p95']:.3f}",
+                'Wait Max (seconds)': f"{queue_stats['wait']['max']:.3f}"
+            })
+
+    def log_idle_window_stats(
+        self,
+        stats: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Log how background LLM calls were fit into user idle time.
+        
+        Args:
+            stats: Output of TaskScheduler.idle_window_stats
+            timestamp: Optional timestamp (defaults to current time)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        def seconds(value: Optional[float]) -> str:
+            return f"{value:.3f}" if value is not None else ""
+        
+        self.store.append("idle_window_stats", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Think Time Samples': stats['think_samples'],
+            'Think Time p50 (seconds)': seconds(stats['think_p50']),
+            'Background Call p50 (seconds)': seconds(stats['call_p50']),
+            'Deferred Calls': stats['deferred_calls'],
+            'Deferred (seconds)': f"{stats['deferred_seconds']:.3f}",
+            'Overlapping Calls': stats['overlapping_calls']
+        })
 
     def log_conversation_statistics(
         self,
@@ -216,50 +366,23 @@ class EvaluationLogger:
             total_memories: Total number of memories in the session
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create logs directory
-        logs_dir = self.eval_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        
         if timestamp is None:
             timestamp = datetime.now()
         
-        # Log to CSV file
-        filename = logs_dir / "conversation_statistics.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Session ID',
-                    'Total Turns',
-                    'Total Tokens',
-                    'User Tokens',
-                    'System Tokens',
-                    'Conversation Duration (seconds)',
-                    'Average Tokens Per Turn',
-                    'Total Memories'
-                ]
-                writer.writerow(headers)
-            
-            # Calculate average tokens per turn
-            avg_tokens_per_turn = total_tokens / total_turns if total_turns > 0 else 0
-            
-            # Write row
-            writer.writerow([
-                timestamp.isoformat(),
-                self.session_id,
-                total_turns,
-                total_tokens,
-                user_tokens,
-                system_tokens,
-                f"{conversation_duration:.2f}",
-                f"{avg_tokens_per_turn:.2f}",
-                total_memories
-            ]) 
+        # Calculate average tokens per turn
+        avg_tokens_per_turn = total_tokens / total_turns if total_turns > 0 else 0
+        
+        self.store.append("conversation_statistics", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Total Turns': total_turns,
+            'Total Tokens': total_tokens,
+            'User Tokens': user_tokens,
+            'System Tokens': system_tokens,
+            'Conversation Duration (seconds)': f"{conversation_duration:.2f}",
+            'Average Tokens Per Turn': f"{avg_tokens_per_turn:.2f}",
+            'Total Memories': total_memories
+        })
     
     def log_biography_section_groundedness(
         self,
@@ -272,34 +395,15 @@ class EvaluationLogger:
         biography_version: int
     ) -> None:
         """Log biography groundedness evaluation results."""
-        # Create a version-specific directory
-        version_dir = self.eval_dir / f"biography_{biography_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Log to CSV file
-        filename = version_dir / "groundedness_summary.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow([
-                    'Section ID',
-                    'Section Title',
-                    'Groundedness Score',
-                    'Overall Assessment',
-                    'Unsubstantiated Claims',
-                    'Missing Details',
-                ])
-            
-            writer.writerow([
-                section_id,
-                section_title,
-                groundedness_score,
-                overall_assessment,
-                '; '.join(unsubstantiated_claims),
-                '; '.join(unsubstantiated_details_explanation),
-            ])
+        self.store.append("groundedness_summary", {
+            'Biography Version': biography_version,
+            'Section ID': section_id,
+            'Section Title': section_title,
+            'Groundedness Score': groundedness_score,
+            'Overall Assessment': overall_assessment,
+            'Unsubstantiated Claims': '; '.join(unsubstantiated_claims),
+            'Missing Details': '; '.join(unsubstantiated_details_explanation),
+        })
 
     def log_biography_completeness(
         self,
@@ -394,78 +498,48 @@ class EvaluationLogger:
             biography_version: Version number of our biography
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create a version-specific directory
-        version_dir = Path("logs") / self.user_id / "evaluations" / \
-            f"biography_{biography_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
-        
         if timestamp is None:
             timestamp = datetime.now()
         
-        # Log to CSV file
-        filename = version_dir / "biography_comparisons.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Model A',
-                    'Model B',
-                    'Version A',
-                    'Version B',
-                    'Insightfulness Winner',
-                    'Insightfulness Explanation',
-                    'Narrativity Winner',
-                    'Narrativity Explanation',
-                    'Coherence Winner',
-                    'Coherence Explanation'
-                ]
-                writer.writerow(headers)
-            
-            # Extract metadata
-            metadata = evaluation_data.get('metadata', {})
-            model_a = metadata.get('model_A', 'unknown')
-            model_b = metadata.get('model_B', 'unknown')
-            version_a = metadata.get('version_A', 'unknown')
-            version_b = metadata.get('version_B', 'unknown')
-            
-            # Extract criteria results
-            insightfulness = evaluation_data.get('insightfulness_score', {})
-            narrativity = evaluation_data.get('narrativity_score', {})
-            coherence = evaluation_data.get('coherence_score', {})
-            
-            # Ensure voting values are standardized
-            insightfulness_winner = insightfulness.get('voting', 'unknown')
-            narrativity_winner = narrativity.get('voting', 'unknown')
-            coherence_winner = coherence.get('voting', 'unknown')
-            
-            # Raise error if any voting value is unknown
-            if 'unknown' in \
-                  [insightfulness_winner, narrativity_winner, coherence_winner]:
-                raise ValueError(f"Got unknown voting value in biography comparison."
-                                 f" Insightfulness: {insightfulness_winner}, "
-                                 f"Narrativity: {narrativity_winner}, "
-                                 f"Coherence: {coherence_winner}")
-            
-            # Write row
-            row = [
-                timestamp.isoformat(),
-                model_a,
-                model_b,
-                version_a,
-                version_b,
-                insightfulness_winner,
-                insightfulness.get('explanation', ''),
-                narrativity_winner,
-                narrativity.get('explanation', ''),
-                coherence_winner,
-                coherence.get('explanation', '')
-            ]
-            writer.writerow(row)
+        # Extract metadata
+        metadata = evaluation_data.get('metadata', {})
+        model_a = metadata.get('model_A', 'unknown')
+        model_b = metadata.get('model_B', 'unknown')
+        version_a = metadata.get('version_A', 'unknown')
+        version_b = metadata.get('version_B', 'unknown')
+        
+        # Extract criteria results
+        insightfulness = evaluation_data.get('insightfulness_score', {})
+        narrativity = evaluation_data.get('narrativity_score', {})
+        coherence = evaluation_data.get('coherence_score', {})
+        
+        # Ensure voting values are standardized
+        insightfulness_winner = insightfulness.get('voting', 'unknown')
+        narrativity_winner = narrativity.get('voting', 'unknown')
+        coherence_winner = coherence.get('voting', 'unknown')
+        
+        # Raise error if any voting value is unknown
+        if 'unknown' in \
+              [insightfulness_winner, narrativity_winner, coherence_winner]:
+            raise ValueError(f"Got unknown voting value in biography comparison."
+                             f" Insightfulness: {insightfulness_winner}, "
+                             f"Narrativity: {narrativity_winner}, "
+                             f"Coherence: {coherence_winner}")
+        
+        self.store.append("biography_comparisons", {
+            'Timestamp': timestamp.isoformat(),
+            'Biography Version': biography_version,
+            'Model A': model_a,
+            'Model B': model_b,
+            'Version A': version_a,
+            'Version B': version_b,
+            'Insightfulness Winner': insightfulness_winner,
+            'Insightfulness Explanation': insightfulness.get('explanation', ''),
+            'Narrativity Winner': narrativity_winner,
+            'Narrativity Explanation': narrativity.get('explanation', ''),
+            'Coherence Winner': coherence_winner,
+            'Coherence Explanation': coherence.get('explanation', '')
+        })
 
     def log_interview_comparison_evaluation(
         self,
@@ -478,73 +552,44 @@ class EvaluationLogger:
             evaluation_data: Dictionary containing evaluation results and metadata
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create evaluations directory
-        eval_dir = Path("logs") / self.user_id / "evaluations"
-        eval_dir.mkdir(parents=True, exist_ok=True)
-        
         if timestamp is None:
             timestamp = datetime.now()
         
-        # Log to CSV file
-        filename = eval_dir / "interview_comparisons.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Session ID',
-                    'Model A',
-                    'Model B',
-                    'Smooth Score Winner',
-                    'Smooth Score Explanation',
-                    'Flexibility Score Winner',
-                    'Flexibility Score Explanation',
-                    'Comforting Score Winner',
-                    'Comforting Score Explanation'
-                ]
-                writer.writerow(headers)
-            
-            # Extract metadata
-            metadata = evaluation_data.get('metadata', {})
-            model_a = metadata.get('model_A', 'unknown')
-            model_b = metadata.get('model_B', 'unknown')
-            
-            # Extract criteria results
-            smooth = evaluation_data.get('smooth_score', {})
-            flexibility = evaluation_data.get('flexibility_score', {})
-            comforting = evaluation_data.get('comforting_score', {})
-            
-            # Ensure voting values are standardized
-            smooth_winner = smooth.get('voting', 'unknown')
-            flexibility_winner = flexibility.get('voting', 'unknown')
-            comforting_winner = comforting.get('voting', 'unknown')
-            
-            # Raise error if any voting value is unknown
-            if 'unknown' in \
-                   [smooth_winner, flexibility_winner, comforting_winner]:
-                raise ValueError(f"Got unknown voting value in interview comparison."
-                                 f" Smooth: {smooth_winner}, "
-                                 f"Flexibility: {flexibility_winner}, "
-                                 f"Comforting: {comforting_winner}")
-            
-            # Write row
-            row = [
-                timestamp.isoformat(),
-                self.session_id,
-                model_a,
-                model_b,
-                smooth_winner,
-                smooth.get('explanation', ''),
-                flexibility_winner,
-                flexibility.get('explanation', ''),
-                comforting_winner,
-                comforting.get('explanation', '')
-            ]
-            writer.writerow(row)
+        # Extract metadata
+        metadata = evaluation_data.get('metadata', {})
+        model_a = metadata.get('model_A', 'unknown')
+        model_b = metadata.get('model_B', 'unknown')
+        
+        # Extract criteria results
+        smooth = evaluation_data.get('smooth_score', {})
+        flexibility = evaluation_data.get('flexibility_score', {})
+        comforting = evaluation_data.get('comforting_score', {})
+        
+        # Ensure voting values are standardized
+        smooth_winner = smooth.get('voting', 'unknown')
+        flexibility_winner = flexibility.get('voting', 'unknown')
+        comforting_winner = comforting.get('voting', 'unknown')
+        
+        # Raise error if any voting value is unknown
+        if 'unknown' in \
+               [smooth_winner, flexibility_winner, comforting_winner]:
+            raise ValueError(f"Got unknown voting value in interview comparison."
+                             f" Smooth: {smooth_winner}, "
+                             f"Flexibility: {flexibility_winner}, "
+                             f"Comforting: {comforting_winner}")
+        
+        self.store.append("interview_comparisons", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Model A': model_a,
+            'Model B': model_b,
+            'Smooth Score Winner': smooth_winner,
+            'Smooth Score Explanation': smooth.get('explanation', ''),
+            'Flexibility Score Winner': flexibility_winner,
+            'Flexibility Score Explanation': flexibility.get('explanation', ''),
+            'Comforting Score Winner': comforting_winner,
+            'Comforting Score Explanation': comforting.get('explanation', '')
+        })
 
     def log_biography_update_time(
         self,
@@ -561,36 +606,21 @@ class EvaluationLogger:
             accumulated_auto_time: Total time spent on auto-updates (default 0)
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create logs directory
-        logs_dir = self.eval_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
-        
         if timestamp is None:
             timestamp = datetime.now()
         
-        # Log to CSV file
-        filename = logs_dir / "biography_update_times.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Session ID',
-                    'Update Type',
-                    'Duration (seconds)',
-                    'Accumulated Auto Time'
-                ]
-                writer.writerow(headers)
-            
-            # Write row
-            writer.writerow([
-                timestamp.isoformat(),
-                self.session_id,
-                update_type,
-                f"{duration:.2f}",
-                f"{accumulated_auto_time:.2f}"
-            ]) 
\ No newline at end of file
+        self.store.append("biography_update_times", {
+            'Timestamp': timestamp.isoformat(),
+            'Session ID': self.session_id,
+            'Update Type': update_type,
+            'Duration (seconds)': f"{duration:.2f}",
+            'Accumulated Auto Time': f"{accumulated_auto_time:.2f}"
+        })
+
+    def flush(self) -> None:
+        """Write buffered evaluation records to disk."""
+        self.store.flush()
+
+    def close(self) -> None:
+        """Write buffered evaluation records to disk and close the store."""
+        self.store.close()
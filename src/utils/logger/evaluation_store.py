@@ -0,0 +1,204 @@
+from pathlib import Path
+import atexit
+import csv
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class EvaluationStore:
+    """Append-only JSON lines store for one session's evaluation records.
+
+    Records are buffered in memory and appended in batches. A sidecar
+    index maps each evaluation type to the byte offsets of its records,
+    so reading one type back does not parse the whole file.
+    
+    Use EvaluationStore.open so that all writers of a session share one
+    store and one index, and close it once the session is over.
+    """
+
+    FILE_PREFIX = "evaluation_records"
+
+    _open_stores: Dict[Tuple[Path, str], "EvaluationStore"] = {}
+    _open_lock = threading.Lock()
+
+    def __init__(self, eval_dir: Path, session_id: str = ""):
+        """Initialize the store.
+
+        Args:
+            eval_dir: Evaluations directory of the user
+            session_id: Session the records belong to
+        """
+        name = f"{self.FILE_PREFIX}_session_{session_id}" \
+            if session_id else self.FILE_PREFIX
+        self.path = Path(eval_dir) / f"{name}.jsonl"
+        self.index_path = Path(eval_dir) / f"{name}_index.json"
+        self.buffer_size = int(os.getenv("EVAL_BUFFER_SIZE", "32"))
+        self._key = (Path(eval_dir), session_id)
+
+        self._buffer: List[Tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._index = self._load_index(self.path, self.index_path)
+        self._closed = False
+
+    @classmethod
+    def open(cls, eval_dir: Path, session_id: str = "") -> "EvaluationStore":
+        """Get the shared store for a session, creating it if needed."""
+        key = (Path(eval_dir), session_id)
+        with cls._open_lock:
+            store = cls._open_stores.get(key)
+            if store is None:
+                store = cls(eval_dir, session_id)
+                cls._open_stores[key] = store
+            return store
+
+    def append(self, evaluation_type: str, record: Dict[str, Any]) -> None:
+        """Buffer a record, writing the buffer out once it is full.
+
+        Args:
+            evaluation_type: Type of evaluation (e.g., 'question_similarity')
+            record: JSON serializable record
+        """
+        line = json.dumps({"type": evaluation_type, **record},
+                          ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append((evaluation_type, line))
+            # Nothing flushes a closed store later, so write through
+            if len(self._buffer) >= self.buffer_size or self._closed:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered records and the index to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush the store and stop sharing it, releasing its index.
+
+        Opening the session's store again loads the index from disk.
+        """
+        self.flush()
+        self._closed = True
+        with self._open_lock:
+            if self._open_stores.get(self._key) is self:
+                del self._open_stores[self._key]
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            for evaluation_type, line in self._buffer:
+                data = (line + "\n").encode('utf-8')
+                self._index["types"].setdefault(evaluation_type, []) \
+                    .append(offset)
+                f.write(data)
+                offset += len(data)
+        self._index["size"] = offset
+        self._buffer = []
+
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+
+    def read(self, evaluation_type: str) -> Iterator[Dict[str, Any]]:
+        """Read back the records of one evaluation type, oldest first."""
+        self.flush()
+        yield from self._read_records(self.path, self._index, evaluation_type)
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Flush every store that is still open."""
+        for store in list(cls._open_stores.values()):
+            store.flush()
+
+    @staticmethod
+    def _load_index(path: Path, index_path: Path) -> Dict[str, Any]:
+        """Load the index of a store file, rebuilding it if it is stale."""
+        size = path.stat().st_size if path.exists() else 0
+        if index_path.exists():
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("size") == size:
+                return index
+
+        # Missing or stale index (e.g. after a crash): rebuild by scanning
+        index = {"size": 0, "types": {}}
+        if size:
+            with open(path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    if line.endswith(b"\n"):
+                        evaluation_type = json.loads(line)["type"]
+                        index["types"].setdefault(evaluation_type, []) \
+                            .append(offset)
+                    offset += len(line)
+            index["size"] = offset
+        return index
+
+    @staticmethod
+    def _read_records(
+        path: Path, index: Dict[str, Any], evaluation_type: str
+    ) -> Iterator[Dict[str, Any]]:
+        offsets = index["types"].get(evaluation_type, [])
+        if not offsets:
+            return
+        with open(path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+
+    @classmethod
+    def load_records(
+        cls, eval_dir: Path, evaluation_type: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Read one evaluation type from all stores in a directory.
+
+        Args:
+            eval_dir: Evaluations directory of a user
+            evaluation_type: Type of evaluation to read
+        """
+        cls.flush_all()
+        for path in sorted(Path(eval_dir).glob(f"{cls.FILE_PREFIX}*.jsonl")):
+            index_path = path.with_name(f"{path.stem}_index.json")
+            index = cls._load_index(path, index_path)
+            yield from cls._read_records(path, index, evaluation_type)
+
+    @classmethod
+    def export_csv(
+        cls,
+        eval_dir: Path,
+        evaluation_type: str,
+        filename: Path,
+        fields: Optional[List[str]] = None
+    ) -> int:
+        """Export one evaluation type from a directory's stores to CSV.
+
+        Args:
+            eval_dir: Evaluations directory of a user
+            evaluation_type: Type of evaluation to export
+            filename: Path of the CSV file to write
+            fields: Columns to write (defaults to the first record's keys)
+
+        Returns:
+            int: Number of rows written
+        """
+        rows = 0
+        with open(filename, 'w', newline='') as f:
+            writer = None
+            for record in cls.load_records(eval_dir, evaluation_type):
+                record.pop("type", None)
+                if writer is None:
+                    writer = csv.DictWriter(
+                        f, fieldnames=fields or list(record.keys()),
+                        extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerow(record)
+                rows += 1
+        return rows
+
+
+atexit.register(EvaluationStore.flush_all)
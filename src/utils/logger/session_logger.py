@@ -1,7 +1,12 @@
 import logging
 import pathlib
 import os
-from typing import List, Optional
+import time
+import queue
+import atexit
+import contextvars
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import threading
 
@@ -23,16 +28,121 @@ LOG_LEVELS = {
     }
 }
 
+
+class _BatchLogWriter:
+    """Writes queued log records to their files from a background thread.
+
+    Callers only enqueue (file, timestamp, level, message) tuples. The
+    writer thread drains the queue in batches, formats the records and
+    appends each file's share of a batch with a single write, keeping a
+    bounded number of file handles open between batches.
+    """
+
+    MAX_BATCH_SIZE = 512
+    MAX_OPEN_FILES = 64
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._files: OrderedDict[pathlib.Path, object] = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def write(self, log_file: pathlib.Path, created: float,
+              level: int, message: str) -> None:
+        """Enqueue a record for the writer thread."""
+        if self._thread is None:
+            self._start()
+        self._queue.put((log_file, created, level, message))
+
+    def flush(self) -> None:
+        """Block until all records enqueued so far are written."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="SessionLogWriter", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List) -> None:
+        lines: Dict[pathlib.Path, List[str]] = {}
+        flush_events = []
+        for record in batch:
+            if isinstance(record, threading.Event):
+                flush_events.append(record)
+                continue
+            log_file, created, level, message = record
+            lines.setdefault(log_file, []).append(
+                f"{self._format_time(created)} - "
+                f"{logging.getLevelName(level)} - {message}\n"
+            )
+
+        for log_file, file_lines in lines.items():
+            try:
+                f = self._get_file(log_file)
+                f.write("".join(file_lines))
+                f.flush()
+            except OSError as e:
+                print(f"Failed to write to {log_file}: {e}")
+
+        for done in flush_events:
+            done.set()
+
+    def _get_file(self, log_file: pathlib.Path):
+        f = self._files.get(log_file)
+        if f is not None:
+            self._files.move_to_end(log_file)
+            return f
+        if len(self._files) >= self.MAX_OPEN_FILES:
+            _, oldest = self._files.popitem(last=False)
+            oldest.close()
+        f = open(log_file, 'a', encoding='utf-8')
+        self._files[log_file] = f
+        return f
+
+    @staticmethod
+    def _format_time(created: float) -> str:
+        # Same layout as logging.Formatter's default asctime
+        msecs = int((created - int(created)) * 1000)
+        return time.strftime("%Y-%m-%d %H:%M:%S",
+                             time.localtime(created)) + f",{msecs:03d}"
+
+
+# Logger of the session running in the current context. Tasks and threads
+# started from a session inherit it, so concurrent sessions in one process
+# log to their own directories.
+_context_logger: contextvars.ContextVar[Optional["SessionLogger"]] = \
+    contextvars.ContextVar("session_logger", default=None)
+
+
 class SessionLogger:
-    _file_locks = {}
-    _locks_lock = threading.Lock()
-    _current_logger = None
+    _current_logger = None  # Most recently created logger, used as fallback
+    _writer = _BatchLogWriter()
     
     @classmethod
     def log_to_file(cls, file_name: str, message: str, log_level: str = "info") -> None:
         """
         Logs a message to a specific file within the session's execution_logs directory.
         
+        The record is written asynchronously by a background thread; call
+        flush() before reading log files that are still being written.
+        
         Args:
             file_name: Name of the log file (without .log extension)
             message: Message to log
@@ -41,59 +151,78 @@ class SessionLogger:
         current_logger = cls.get_current_logger()
         if not current_logger:
             raise RuntimeError("No logger has been initialized. Call setup_logger or setup_default_logger first.")
-            
-        # Create logger for this specific file
-        logger_id = f"{current_logger.user_id}_{current_logger.session_id or current_logger.log_type}_{file_name}"
-        file_logger = logging.getLogger(logger_id)
         
-        # Define log directory and file path
-        if current_logger.session_id:
-            # Session-based logging
-            log_dir = current_logger.log_dir / "execution_logs" / f"session_{current_logger.session_id}"
-        else:
-            # Non-session logging
-            log_dir = current_logger.log_dir / current_logger.log_type
+        level = LOG_LEVELS[log_level]["log_level"]
+        if level < current_logger.log_level:
+            return
         
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / f"{file_name}.log"
+        # Resolve the file (and console logger) once per file name
+        target = current_logger._targets.get(file_name)
+        if target is None:
+            target = current_logger._create_target(file_name, message, log_level)
+        log_file, console_logger = target
         
-        if not file_logger.handlers:
-            file_logger.setLevel(current_logger.log_level)
-            
-            # Setup file handler
-            file_handler = logging.FileHandler(log_file)
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            file_handler.setFormatter(formatter)
-            file_logger.addHandler(file_handler)
-            
-            # Add console handler if this file should output to console
-            if current_logger.console_output_files and file_name in current_logger.console_output_files:
+        cls._writer.write(log_file, time.time(), level, message)
+        if console_logger:
+            console_logger.log(level, message)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Waits until all pending log records are written to disk."""
+        cls._writer.flush()
+
+    def _create_target(
+        self, file_name: str, message: str, log_level: str
+    ) -> Tuple[pathlib.Path, Optional[logging.Logger]]:
+        """Sets up the log file and optional console logger for a file name."""
+        log_file = self.get_log_dir() / f"{file_name}.log"
+        console_logger = None
+        
+        # Add console handler if this file should output to console
+        if self.console_output_files and file_name in self.console_output_files:
+            logger_id = f"{self.user_id}_{self.session_id or self.log_type}_{file_name}"
+            console_logger = logging.getLogger(logger_id)
+            if not console_logger.handlers:
+                console_logger.setLevel(self.log_level)
                 console_handler = logging.StreamHandler()
+                formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
                 console_handler.setFormatter(formatter)
-                file_logger.addHandler(console_handler)
+                console_logger.addHandler(console_handler)
                 
                 # Print colored message to console
                 color = LOG_LEVELS[log_level]["color"]
                 reset = "\033[0m"
                 print(f"{color}{message}{reset}")
         
-        # Get or create lock for this file
-        if log_file not in cls._file_locks:
-            with cls._locks_lock:
-                file_lock = cls._file_locks.get(log_file)
-                if file_lock is None:
-                    file_lock = threading.Lock()
-                    cls._file_locks[log_file] = file_lock
-        else:
-            file_lock = cls._file_locks[log_file]
-        
-        # Use the lock when writing to file
-        with file_lock:
-            file_logger.log(LOG_LEVELS[log_level]["log_level"], message)
+        self._targets[file_name] = (log_file, console_logger)
+        return self._targets[file_name]
 
     @classmethod
     def get_current_logger(cls):
-        return cls._current_logger
+        return _context_logger.get() or cls._current_logger
+
+    @classmethod
+    def get_log_dir(cls) -> pathlib.Path:
+        """
+        Gets the directory the current logger writes its log files to.
+        
+        Returns:
+            Path to the session's execution_logs directory, or to the
+            log type directory when there is no active session
+        """
+        current_logger = cls.get_current_logger()
+        if not current_logger:
+            raise RuntimeError("No logger has been initialized. Call setup_logger or setup_default_logger first.")
+        
+        if current_logger.session_id:
+            # Session-based logging
+            log_dir = current_logger.log_dir / "execution_logs" / f"session_{current_logger.session_id}"
+        else:
+            # Non-session logging
+            log_dir = current_logger.log_dir / current_logger.log_type
+        
+        log_dir.mkdir(parents=True, exist_ok=True)
+        return log_dir
 
     def __init__(self, user_id: str, session_id: Optional[int] = None, log_type: str = None, 
                  log_level=logging.INFO, console_output_files: List[str] = None):
@@ -103,9 +232,11 @@ class SessionLogger:
         self.log_level = log_level
         self.log_dir = pathlib.Path(LOGS_DIR) / user_id
         self.console_output_files = console_output_files        
+        self._targets: Dict[str, Tuple[pathlib.Path, Optional[logging.Logger]]] = {}
         
         # Store this instance as the current logger
         SessionLogger._current_logger = self
+        _context_logger.set(self)
         
         # Setup base logger
         logger_id = f"{'session' if session_id else log_type}_{user_id}_{session_id or ''}"
@@ -0,0 +1,218 @@
+from pathlib import Path
+import asyncio
+import atexit
+import contextvars
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Span currently open in this task or thread
+_current_span: contextvars.ContextVar[Optional["Span"]] = \
+    contextvars.ContextVar("current_span", default=None)
+
+# Tracer of the session running in the current context
+_context_tracer: contextvars.ContextVar[Optional["Tracer"]] = \
+    contextvars.ContextVar("tracer", default=None)
+
+
+class Span:
+    """A timed operation with attributes and a parent span."""
+
+    _ids = itertools.count(1)
+
+    __slots__ = ("name", "span_id", "parent_id", "attributes",
+                 "start", "track")
+
+    def __init__(self, name: str, parent: Optional["Span"],
+                 attributes: Dict[str, Any]):
+        self.name = name
+        self.span_id = next(Span._ids)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.track = Tracer.get_track()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+
+class Tracer:
+    """Records nested spans to a Chrome trace event file.
+
+    The trace file uses the JSON array format of the Trace Event Format,
+    so it opens in chrome://tracing and ui.perfetto.dev even while the
+    session is still running. Each asyncio task and thread gets its own
+    track. Spans are buffered and appended in batches.
+
+    A session resumed from a checkpoint, or finished by a post-session
+    worker, appends to the trace file its earlier runs wrote. Timestamps
+    are relative to the Unix epoch, so the runs line up on one timeline.
+    """
+
+    _current_tracer: Optional["Tracer"] = None
+    # Track IDs are unique in the process, as its tracers may share a file
+    _track_ids = itertools.count(1)
+    FLUSH_SIZE = 256
+
+    def __init__(self, trace_file: Path):
+        """Initialize the tracer.
+
+        Args:
+            trace_file: Path of the trace file to write
+        """
+        self.trace_file = Path(trace_file)
+        self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+        # perf_counter reading at the Unix epoch
+        self._origin = time.perf_counter() - time.time()
+        self._pid = os.getpid()
+        self._buffer: List[str] = []
+        self._tracks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        with open(self.trace_file, 'a', encoding='utf-8') as f:
+            if f.tell() == 0:
+                f.write("[\n")
+
+    @classmethod
+    def get_current_tracer(cls) -> Optional["Tracer"]:
+        """Get the current tracer instance."""
+        return _context_tracer.get() or cls._current_tracer
+
+    @classmethod
+    def setup_tracer(cls, log_dir: Path) -> Optional["Tracer"]:
+        """Setup a tracer writing trace.json to a log directory.
+
+        Tracing is skipped when TRACING_ENABLED is false.
+
+        Args:
+            log_dir: Directory of the session's logs
+        """
+        previous = cls.get_current_tracer()
+        if previous:
+            previous.flush()
+        if os.getenv("TRACING_ENABLED", "true").lower() != "true":
+            return None
+        tracer = cls(Path(log_dir) / "trace.json")
+        cls._current_tracer = tracer
+        _context_tracer.set(tracer)
+        return tracer
+
+    @staticmethod
+    def get_track() -> str:
+        """Name of the current asyncio task, or of the thread outside one."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return task.get_name() if task else threading.current_thread().name
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, **attributes) -> Iterator[Optional[Span]]:
+        """Record the enclosed block as a span.
+
+        Spans opened inside the block, including in tasks created from it,
+        become its children.
+
+        Args:
+            name: Name of the span
+            **attributes: Attributes shown with the span
+        """
+        tracer = cls.get_current_tracer()
+        if tracer is None:
+            yield None
+            return
+
+        span = Span(name, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_attribute("error", f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            _current_span.reset(token)
+            tracer._record(span, time.perf_counter())
+
+    @classmethod
+    def traced(cls, name: Optional[str] = None):
+        """Decorator recording each call of a function as a span."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+            if asyncio.iscoroutinefunction(func):
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with cls.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with cls.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _record(self, span: Span, end: float) -> None:
+        args = {"span_id": span.span_id, "parent_id": span.parent_id}
+        args.update({
+            key: value if isinstance(value, (int, float, bool)) else str(value)
+            for key, value in span.attributes.items()
+        })
+        with self._lock:
+            tid = self._tracks.get(span.track)
+            if tid is None:
+                # Name each new track after its task or thread
+                tid = next(Tracer._track_ids)
+                self._tracks[span.track] = tid
+                self._buffer.append(json.dumps({
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": tid,
+                    "args": {"name": span.track}
+                }))
+            self._buffer.append(json.dumps({
+                "name": span.name,
+                "ph": "X",
+                "ts": round((span.start - self._origin) * 1e6, 1),
+                "dur": round((end - span.start) * 1e6, 1),
+                "pid": self._pid,
+                "tid": tid,
+                "args": args
+            }, ensure_ascii=False))
+            if len(self._buffer) >= self.FLUSH_SIZE:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Append buffered spans to the trace file."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        # The closing bracket is optional in the JSON array format, so the
+        # file stays loadable without rewriting it. Other runs of the
+        # session may have appended events since the last flush.
+        with open(self.trace_file, 'a', encoding='utf-8') as f:
+            separator = ",\n" if f.tell() > len("[\n") else ""
+            f.write(separator + ",\n".join(self._buffer))
+        self._buffer = []
+
+
+def _flush_current_tracer() -> None:
+    tracer = Tracer.get_current_tracer()
+    if tracer:
+        tracer.flush()
+
+
+atexit.register(_flush_current_tracer)
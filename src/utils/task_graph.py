@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.logger.tracer import Tracer
+
+
+class TaskGraph:
+    """Runs async steps as soon as the steps they depend on are done.
+
+    Independent steps run concurrently, so the graph takes as long as
+    its longest chain of dependent steps rather than the sum of all
+    steps. If a step fails or is cancelled, the steps that depend on it
+    are skipped and the first error is raised once everything else has
+    finished.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._steps: Dict[str, Tuple[Callable[[], Awaitable[Any]],
+                                     List[str]]] = {}
+        self.durations: Dict[str, float] = {}
+
+    def add(self, name: str, fn: Callable[[], Awaitable[Any]],
+            after: Optional[List[str]] = None) -> None:
+        """Add a step.
+
+        Args:
+            name: Name of the step
+            fn: Coroutine function running the step
+            after: Names of the steps it depends on, added before it
+        """
+        after = after or []
+        for dependency in after:
+            if dependency not in self._steps:
+                raise ValueError(
+                    f"Step {name} depends on unknown step {dependency}")
+        self._steps[name] = (fn, after)
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every step.
+
+        Returns:
+            Dict[str, Any]: Result of each step
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        with Tracer.span("task_graph", graph=self.name):
+            # Steps are added after their dependencies, so each one's
+            # dependency tasks exist when it is created
+            for name, (fn, after) in self._steps.items():
+                tasks[name] = asyncio.create_task(self._run_step(
+                    name, fn, [tasks[dependency] for dependency in after]))
+            try:
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+            except asyncio.CancelledError:
+                for task in tasks.values():
+                    task.cancel()
+                raise
+
+        for name, task in tasks.items():
+            if task.cancelled():
+                raise RuntimeError(
+                    f"Step {name} of {self.name} was cancelled")
+            if task.exception() is not None and \
+                    not isinstance(task.exception(), _SkippedStep):
+                raise task.exception()
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_step(self, name: str, fn: Callable[[], Awaitable[Any]],
+                        dependencies: List[asyncio.Task]) -> Any:
+        if dependencies:
+            await asyncio.gather(*dependencies, return_exceptions=True)
+            if any(task.cancelled() or task.exception() is not None
+                   for task in dependencies):
+                raise _SkippedStep(name)
+
+        start = time.perf_counter()
+        try:
+            with Tracer.span("task_graph_step", step=name):
+                return await fn()
+        finally:
+            self.durations[name] = time.perf_counter() - start
+
+
+class _SkippedStep(Exception):
+    """A step did not run because a step it depends on failed."""